@@ -0,0 +1,119 @@
+"""
+Benchmark response decoding: compiled decode plans vs. _to_snake_dict + _normalize_amount_fields.
+
+Run from the repository root:
+
+    python benchmarks/bench_decoding.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sunbay_nexus_sdk.models.common import BatchQueryItem  # noqa: E402
+from sunbay_nexus_sdk.models.response import BatchQueryResponse, QueryResponse  # noqa: E402
+from sunbay_nexus_sdk.serialization import decode_response  # noqa: E402
+
+_NUMERIC_KEYS = (
+    "trans_amount",
+    "order_amount",
+    "tax_amount",
+    "surcharge_amount",
+    "tip_amount",
+    "cashback_amount",
+    "net_amount",
+)
+
+
+def _legacy_to_snake_dict(source: Dict[str, Any]) -> Dict[str, Any]:
+    # Previous HttpClient._to_snake_dict, kept here as the comparison baseline.
+    def _camel_to_snake(name: str) -> str:
+        chars = []
+        for ch in name:
+            if ch.isupper():
+                if chars:
+                    chars.append("_")
+                chars.append(ch.lower())
+            else:
+                chars.append(ch)
+        return "".join(chars)
+
+    result: Dict[str, Any] = {}
+    for key, value in source.items():
+        if isinstance(value, dict):
+            value = _legacy_to_snake_dict(value)
+        elif isinstance(value, list):
+            value = [_legacy_to_snake_dict(item) if isinstance(item, dict) else item for item in value]
+        result[_camel_to_snake(key)] = value
+    return result
+
+
+def _legacy_decode(root: Dict[str, Any], response_type: Any) -> Any:
+    payload = _legacy_to_snake_dict(root["data"])
+    items = [payload.get("amount"), payload.get("total_amount")] + list(payload.get("batch_list") or [])
+    for item in items:
+        if isinstance(item, dict):
+            for key in _NUMERIC_KEYS:
+                if isinstance(item.get(key), str):
+                    item[key] = int(item[key])
+    payload.setdefault("code", root.get("code"))
+    payload.setdefault("msg", root.get("msg"))
+    payload.setdefault("trace_id", root.get("traceId"))
+    if payload.get("batch_list") is not None:
+        payload["batch_list"] = [BatchQueryItem(**item) for item in payload["batch_list"]]
+    return response_type(**payload)
+
+
+def build_samples() -> Dict[str, Any]:
+    query = {
+        "transactionId": "TXN20231119001",
+        "transactionRequestId": "PAY_REQ_1234567890",
+        "referenceOrderId": "ORDER20231119001",
+        "transactionStatus": "S",
+        "transactionType": "SALE",
+        "amount": {"priceCurrency": "USD", "transAmount": "10200", "orderAmount": "10000", "tipAmount": "200"},
+        "createTime": "2023-11-19T10:00:00Z",
+        "completeTime": "2023-11-19T10:00:05Z",
+        "maskedPan": "411111******1111",
+        "cardNetworkType": "CREDIT",
+        "batchNo": "000123",
+        "rrn": "123456789012",
+        "authCode": "A1B2C3",
+        "entryMode": "CONTACTLESS",
+        "terminalSn": "T1234567890",
+    }
+    batch = {
+        "batchList": [
+            {
+                "batchNo": str(i),
+                "startTime": "2023-11-19T00:00:00Z",
+                "channelCode": "CARD",
+                "priceCurrency": "USD",
+                "totalCount": 12,
+                "netAmount": "123400",
+                "tipAmount": "1000",
+                "surchargeAmount": "0",
+                "taxAmount": "500",
+            }
+            for i in range(5000)
+        ]
+    }
+    return {
+        "QueryResponse": ({"code": "0", "msg": "ok", "traceId": "t", "data": query}, QueryResponse, 5000),
+        "BatchQueryResponse[5000 items]": ({"code": "0", "msg": "ok", "traceId": "t", "data": batch}, BatchQueryResponse, 10),
+    }
+
+
+def main() -> None:
+    print(f"{'case':<36}{'legacy us':>14}{'plan us':>14}{'speedup':>10}")
+    for name, (root, response_type, number) in build_samples().items():
+        legacy = timeit.timeit(lambda: _legacy_decode(root, response_type), number=number) / number * 1e6
+        plan = timeit.timeit(lambda: decode_response(root, response_type), number=number) / number * 1e6
+        print(f"{name:<36}{legacy:>14.2f}{plan:>14.2f}{legacy / plan:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark query tail latency with and without request hedging.
+
+The local stub server answers ``query`` with a long-tailed (lognormal)
+delay. The same number of calls is made by a plain client and by a client
+with a HedgePolicy, and the script prints latency percentiles for both plus
+the extra requests the hedges cost, measured on the server side.
+
+Run from the repository root:
+
+    python benchmarks/bench_hedging.py
+    python benchmarks/bench_hedging.py --calls 4000 --percentile 95 --max-extra 0.05
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sunbay_nexus_sdk import HedgePolicy, NexusClient  # noqa: E402
+from sunbay_nexus_sdk.constants import PATH_QUERY  # noqa: E402
+from sunbay_nexus_sdk.models.common import SaleAmount  # noqa: E402
+from sunbay_nexus_sdk.models.request import QueryRequest, SaleRequest  # noqa: E402
+from sunbay_nexus_sdk.testing import StubServer  # noqa: E402
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig, Latency  # noqa: E402
+
+
+def run(client: NexusClient, transaction_id: str, calls: int, threads: int) -> List[float]:
+    """
+    Latencies in seconds of ``calls`` queries spread over ``threads`` threads.
+    """
+    latencies: List[float] = []
+    lock = threading.Lock()
+    request = QueryRequest(app_id="app_bench", merchant_id="mch_bench", transaction_id=transaction_id)
+
+    def worker() -> None:
+        for _ in range(calls // threads):
+            started = time.perf_counter()
+            client.query(request)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sorted(latencies)
+
+
+def percentile(ordered: List[float], value: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * value / 100.0))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="queries per client (default: 2000)")
+    parser.add_argument("--threads", type=int, default=4, help="calling threads (default: 4)")
+    parser.add_argument("--median", type=float, default=0.01, help="median server delay in seconds (default: 0.01)")
+    parser.add_argument("--sigma", type=float, default=1.0, help="lognormal sigma of the delay (default: 1.0)")
+    parser.add_argument("--percentile", type=float, default=90.0, help="hedge percentile (default: 90)")
+    parser.add_argument("--max-extra", type=float, default=0.1, help="hedge budget ratio (default: 0.1)")
+    parser.add_argument("--seed", type=int, default=1, help="stub latency seed (default: 1)")
+    args = parser.parse_args()
+
+    latency = Latency("lognormal", args.median, args.sigma, maximum=2.0)
+    with StubServer(processing_time=0.0, seed=args.seed) as server:
+        server.path_faults[PATH_QUERY] = FaultConfig(latency=latency)
+        rows = []
+        policy: Optional[HedgePolicy] = None
+        for name in ("plain", "hedged"):
+            if name == "hedged":
+                policy = HedgePolicy(percentile=args.percentile, max_extra_ratio=args.max_extra)
+            with NexusClient(api_key="sk_test_bench", base_url=server.base_url, hedge_policy=policy) as client:
+                sale = client.sale(
+                    SaleRequest(
+                        app_id="app_bench",
+                        merchant_id="mch_bench",
+                        reference_order_id=f"bench-{name}",
+                        transaction_request_id=f"bench-{name}",
+                        amount=SaleAmount(order_amount=100, price_currency="USD"),
+                        description="hedging benchmark",
+                        terminal_sn="T-BENCH",
+                    )
+                )
+                before = server.stats().get(f"path.{PATH_QUERY}", 0)
+                latencies = run(client, sale.transaction_id, args.calls, args.threads)
+                sent = server.stats().get(f"path.{PATH_QUERY}", 0) - before
+            rows.append((name, latencies, sent))
+
+    print(f"{args.calls} queries, {args.threads} threads, lognormal delay (median {args.median}s, sigma {args.sigma})")
+    if policy is not None:
+        print(f"hedge delay after the run: {policy.current_delay * 1000:.1f} ms (p{args.percentile:g})")
+    print(f"{'client':<8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'p99.9 ms':>10}{'max ms':>10}{'extra':>8}")
+    for name, latencies, sent in rows:
+        cells = [percentile(latencies, p) * 1000 for p in (50, 90, 99, 99.9)] + [latencies[-1] * 1000]
+        extra = sent / len(latencies) - 1
+        print(f"{name:<8}" + "".join(f"{cell:>10.1f}" for cell in cells) + f"{extra:>8.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
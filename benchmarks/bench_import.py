@@ -0,0 +1,110 @@
+"""
+Benchmark import time of the SDK with ``python -X importtime``.
+
+Each statement runs in a fresh interpreter several times; the cumulative
+import time of the ``sunbay_nexus_sdk`` package (and of everything it pulled
+in) is reported as the median. The top-level import must stay below
+``--limit-ms`` and must not import requests, urllib3 or httpx; the script
+exits with status 1 otherwise, so it can run in CI.
+
+Run from the repository root:
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --limit-ms 10 --runs 21
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Statement -> whether the limit and heavy-module checks apply to it.
+STATEMENTS = (
+    ("import sunbay_nexus_sdk", True),
+    ("from sunbay_nexus_sdk import TransactionStatus", True),
+    ("from sunbay_nexus_sdk.models.request import SaleRequest", False),
+    ("from sunbay_nexus_sdk import NexusClient", False),
+    ("from sunbay_nexus_sdk import AsyncNexusClient", False),
+)
+
+# Modules the lightweight imports above must not load.
+HEAVY_MODULES = ("requests", "urllib3", "httpx")
+
+
+def _parse_importtime(stderr: str) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Map module -> (self us, cumulative us, nesting depth) from ``-X importtime`` output.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.partition(":")[2].split("|", 2)
+        # Names are indented by one space plus two per nesting level.
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def measure(statement: str, runs: int) -> Tuple[float, Set[str]]:
+    """
+    Median milliseconds spent importing the SDK for ``statement``, and the modules it loaded.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (str(SRC), os.environ.get("PYTHONPATH")))))
+    samples: List[float] = []
+    loaded: Set[str] = set()
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        modules = _parse_importtime(completed.stderr)
+        loaded = set(modules)
+        # Top-level entries (depth 0) of the SDK's own modules cover everything they imported.
+        samples.append(
+            sum(cumulative for name, (_, cumulative, depth) in modules.items()
+                if depth == 0 and name.split(".")[0] == "sunbay_nexus_sdk") / 1000.0
+        )
+    return statistics.median(samples), loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=11, help="interpreter runs per statement (default: 11)")
+    parser.add_argument(
+        "--limit-ms", type=float, default=15.0, help="budget for the lightweight imports (default: 15 ms)"
+    )
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'statement':<60}{'median ms':>12}")
+    for statement, checked in STATEMENTS:
+        median_ms, loaded = measure(statement, args.runs)
+        flag = ""
+        if checked:
+            heavy = sorted(m for m in HEAVY_MODULES if m in loaded)
+            if median_ms > args.limit_ms:
+                flag = f"  OVER LIMIT ({args.limit_ms:g} ms)"
+                failures.append(statement)
+            if heavy:
+                flag += f"  imports {', '.join(heavy)}"
+                failures.append(statement)
+        print(f"{statement:<60}{median_ms:>12.2f}{flag}")
+
+    if failures:
+        print(f"\n{len(set(failures))} import check(s) failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
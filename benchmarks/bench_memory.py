@@ -0,0 +1,122 @@
+"""
+Benchmark memory per decoded response: slotted models vs. plain dataclasses.
+
+The "before" column decodes the same payloads into unslotted copies of the
+models (built with ``dataclasses.make_dataclass``, nested models included),
+which is what the SDK used before the models got ``__slots__``. Memory is
+measured with tracemalloc while ``--count`` decoded objects are kept alive,
+so nested objects (amounts, batch items) are included in the figures.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --count 50000
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union, get_type_hints
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from samples import response_samples  # noqa: E402
+from sunbay_nexus_sdk.models.common import Amount, BatchQueryItem  # noqa: E402
+from sunbay_nexus_sdk.serialization import decode_response  # noqa: E402
+from sunbay_nexus_sdk.serialization.decoder import get_decoder  # noqa: E402
+
+CASES = (
+    "SaleResponse",
+    "QueryResponse",
+    "BatchCloseResponse",
+    "BatchQueryResponse[10 items]",
+    "CreateCheckoutSessionResponse",
+)
+
+_unslotted: Dict[type, type] = {}
+
+
+def _swap(tp: Any) -> Any:
+    # Replace model types inside Optional[...] / List[...] with their unslotted copies.
+    if dataclasses.is_dataclass(tp):
+        return unslotted(tp)
+    origin = getattr(tp, "__origin__", None)
+    if origin is Union:
+        return Union[tuple(_swap(arg) for arg in tp.__args__)]
+    if origin in (list, List):
+        return List[_swap(tp.__args__[0])]
+    return tp
+
+
+def unslotted(cls: type) -> type:
+    """
+    A plain (``__dict__``-based) dataclass with the same fields as ``cls``.
+    """
+    copy = _unslotted.get(cls)
+    if copy is None:
+        hints = get_type_hints(cls)
+        copy = dataclasses.make_dataclass(
+            f"{cls.__name__}Unslotted",
+            [
+                (f.name, _swap(hints[f.name]), dataclasses.field(default=f.default, default_factory=f.default_factory))
+                for f in dataclasses.fields(cls)
+            ],
+        )
+        _unslotted[cls] = copy
+    return copy
+
+
+def bytes_per_instance(build: Callable[[], Any], count: int) -> float:
+    """
+    Traced bytes per object while ``count`` objects from ``build`` are alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # The list itself costs the same pointer per entry in both variants.
+        objects = [build() for _ in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del objects
+    return used / count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20000, help="objects kept alive per measurement")
+    args = parser.parse_args()
+
+    samples = response_samples()
+    rows = []
+    for name in CASES:
+        body, response_type = samples[name]
+        root = json.loads(body)
+        plain_type = unslotted(response_type)
+        # Compile decode plans up front so they are not counted.
+        get_decoder(response_type)
+        get_decoder(plain_type)
+        after = bytes_per_instance(lambda: decode_response(root, response_type), args.count)
+        before = bytes_per_instance(lambda: decode_response(root, plain_type), args.count)
+        rows.append((name, before, after))
+
+    for cls, values in ((Amount, {"price_currency": "USD", "trans_amount": 10200}), (BatchQueryItem, {"batch_no": "1"})):
+        after = bytes_per_instance(lambda: cls(**values), args.count)
+        before = bytes_per_instance(lambda: unslotted(cls)(**values), args.count)
+        rows.append((cls.__name__, before, after))
+
+    print(f"Python {sys.version.split()[0]}, {args.count} live objects per measurement")
+    print(f"{'model':<36}{'before B':>12}{'after B':>12}{'saved':>9}")
+    for name, before, after in rows:
+        print(f"{name:<36}{before:>12.0f}{after:>12.0f}{(1 - after / before):>9.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
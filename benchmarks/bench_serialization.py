@@ -0,0 +1,113 @@
+"""
+Benchmark request serialization: cached plans vs. asdict + _to_camel_dict.
+
+Run from the repository root:
+
+    python benchmarks/bench_serialization.py
+"""
+
+import json
+import sys
+import timeit
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sunbay_nexus_sdk.models.common import (  # noqa: E402
+    CheckoutAmount,
+    CheckoutProductItem,
+    PaymentMethodInfo,
+    RefundAmount,
+    SaleAmount,
+    TipConfig,
+    TipSuggestions,
+)
+from sunbay_nexus_sdk.models.request import (  # noqa: E402
+    CreateCheckoutSessionRequest,
+    QueryRequest,
+    RefundRequest,
+    SaleRequest,
+)
+from sunbay_nexus_sdk.serialization import encode_json, to_query_params  # noqa: E402
+
+
+def _legacy_to_camel_dict(source: Dict[str, Any]) -> Dict[str, Any]:
+    # Previous HttpClient._to_camel_dict, kept here as the comparison baseline.
+    def _snake_to_camel(name: str) -> str:
+        parts = name.split("_")
+        return parts[0] + "".join(p.capitalize() for p in parts[1:] if p)
+
+    result: Dict[str, Any] = {}
+    for key, value in source.items():
+        camel_key = _snake_to_camel(key)
+        if isinstance(value, dict):
+            result[camel_key] = _legacy_to_camel_dict(value)
+        elif isinstance(value, list):
+            result[camel_key] = [
+                _legacy_to_camel_dict(item) if isinstance(item, dict) else item for item in value
+            ]
+        else:
+            result[camel_key] = value
+    return result
+
+
+def _legacy_encode(request: Any) -> str:
+    return json.dumps(_legacy_to_camel_dict(asdict(request)), ensure_ascii=False)
+
+
+def _legacy_query_params(request: Any) -> Dict[str, Any]:
+    return _legacy_to_camel_dict({k: v for k, v in asdict(request).items() if v is not None})
+
+
+def build_samples() -> Dict[str, Any]:
+    tip_config = TipConfig(suggestions=TipSuggestions(fee_mode="RATE", values=[15, 18, 20]))
+    return {
+        "SaleRequest": SaleRequest(
+            app_id="app_123456",
+            merchant_id="mch_789012",
+            reference_order_id="ORDER20231119001",
+            transaction_request_id="PAY_REQ_1234567890",
+            amount=SaleAmount(order_amount=10000, price_currency="USD", tip_amount=200, tip_config=tip_config),
+            description="Product purchase — café",
+            terminal_sn="T1234567890",
+            payment_method=PaymentMethodInfo(network_type="CREDIT"),
+        ),
+        "RefundRequest": RefundRequest(
+            app_id="app_123456",
+            merchant_id="mch_789012",
+            transaction_request_id="REFUND_REQ_1",
+            amount=RefundAmount(order_amount=500, price_currency="USD"),
+            original_transaction_id="TXN20231119001",
+        ),
+        "CreateCheckoutSessionRequest[200 items]": CreateCheckoutSessionRequest(
+            app_id="app_123456",
+            merchant_id="mch_789012",
+            transaction_request_id="CHK_REQ_1",
+            reference_order_id="ORDER20231119002",
+            amount=CheckoutAmount(order_amount=200 * 150, price_currency="USD"),
+            description="Large basket",
+            product_list=[CheckoutProductItem(amount=150, name=f"Item {i}", num=1) for i in range(200)],
+        ),
+    }
+
+
+def main() -> None:
+    number = 2000
+    print(f"{'case':<42}{'legacy us':>12}{'plan us':>12}{'speedup':>10}")
+    for name, request in build_samples().items():
+        assert encode_json(request) == _legacy_encode(request), name
+        legacy = timeit.timeit(lambda: _legacy_encode(request), number=number) / number * 1e6
+        plan = timeit.timeit(lambda: encode_json(request), number=number) / number * 1e6
+        print(f"{name:<42}{legacy:>12.2f}{plan:>12.2f}{legacy / plan:>9.1f}x")
+
+    query = QueryRequest(app_id="app_123456", merchant_id="mch_789012", transaction_id="TXN20231119001")
+    assert to_query_params(query) == _legacy_query_params(query)
+    legacy = timeit.timeit(lambda: _legacy_query_params(query), number=number) / number * 1e6
+    plan = timeit.timeit(lambda: to_query_params(query), number=number) / number * 1e6
+    print(f"{'QueryRequest (query params)':<42}{legacy:>12.2f}{plan:>12.2f}{legacy / plan:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+In-process fake transport for benchmarking HttpClient without sockets.
+
+FakeTransportAdapter is a requests adapter that answers every request with a
+canned response, so a benchmark of ``HttpClient.post`` measures the SDK's own
+work: header building, serialization, the retry/circuit loop, response
+decoding and logging checks.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class FakeTransportAdapter(BaseAdapter):
+    """
+    Returns ``body`` with ``status`` for every request sent through it.
+    """
+
+    def __init__(self, body: bytes, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+        super().__init__()
+        self.body = body
+        self.status = status
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.requests = 0
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        self.requests += 1
+        response = Response()
+        response.status_code = self.status
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def install(client: Any, adapter: FakeTransportAdapter) -> None:
+    """
+    Route every request of a NexusClient through ``adapter``.
+    """
+    session = client._http_client._session
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
@@ -0,0 +1,161 @@
+"""
+Minimal benchmark harness: ops/sec via timeit, memory per call via tracemalloc,
+JSON result files and comparison between runs.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Case:
+    """
+    One benchmark: ``func`` is called without arguments.
+    """
+
+    name: str
+    group: str
+    func: Callable[[], Any]
+
+
+@dataclass
+class Result:
+    name: str
+    group: str
+    ops_per_sec: float
+    # Median time per call over all repeats, in microseconds.
+    median_us: float
+    # Relative spread (stdev / mean) of the per-repeat timings.
+    spread: float
+    # Highest traced memory while a single call runs, in bytes (transient allocations).
+    peak_bytes: int
+    # Memory still allocated after a call, per call, in bytes (leaks / caches).
+    retained_bytes: float
+
+
+def measure(case: Case, min_time: float = 0.2, repeat: int = 5, memory_calls: int = 20) -> Result:
+    timer = timeit.Timer(case.func)
+    # Pick a loop count that makes one repeat last at least ``min_time``.
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+    timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    best = min(timings)
+    mean = statistics.mean(timings)
+    spread = statistics.stdev(timings) / mean if len(timings) > 1 and mean else 0.0
+
+    case.func()  # warm caches before tracing
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        case.func()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(memory_calls):
+            case.func()
+        retained = (tracemalloc.get_traced_memory()[0] - before) / memory_calls
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=case.name,
+        group=case.group,
+        ops_per_sec=1.0 / best,
+        median_us=statistics.median(timings) * 1e6,
+        spread=spread,
+        peak_bytes=max(peak, 0),
+        retained_bytes=max(retained, 0.0),
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(Path(__file__).resolve().parent),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode().strip() or None
+
+
+def metadata(sdk_version: str, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    meta = {
+        "sdk_version": sdk_version,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    meta.update(extra or {})
+    return meta
+
+
+def save(path: Path, meta: Dict[str, Any], results: List[Result]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"meta": meta, "results": {r.name: asdict(r) for r in results}}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path) -> Dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+def print_results(results: List[Result]) -> None:
+    print(f"{'benchmark':<56}{'ops/sec':>14}{'median us':>12}{'spread':>8}{'peak B':>10}{'kept B':>9}")
+    group = None
+    for r in results:
+        if r.group != group:
+            group = r.group
+            print(f"[{group}]")
+        print(
+            f"  {r.name:<54}{r.ops_per_sec:>14,.0f}{r.median_us:>12.2f}{r.spread:>7.1%}"
+            f"{r.peak_bytes:>10,}{r.retained_bytes:>9,.0f}"
+        )
+
+
+def compare(baseline: Dict[str, Any], results: List[Result], threshold: float) -> List[str]:
+    """
+    Print ops/sec and peak memory changes against a saved run; return the regressed names.
+    """
+    old_meta = baseline.get("meta", {})
+    print(
+        f"\nCompared with {old_meta.get('sdk_version')} ({old_meta.get('git_commit')}, "
+        f"Python {old_meta.get('python')}); regressions beyond {threshold:.0%} are flagged."
+    )
+    print(f"{'benchmark':<56}{'ops/sec':>10}{'peak B':>10}")
+    regressions = []
+    for r in results:
+        old = baseline.get("results", {}).get(r.name)
+        if old is None:
+            print(f"  {r.name:<54}{'new':>10}")
+            continue
+        speed = r.ops_per_sec / old["ops_per_sec"] - 1.0
+        memory = (r.peak_bytes / old["peak_bytes"] - 1.0) if old["peak_bytes"] else 0.0
+        flag = ""
+        if speed < -threshold or memory > threshold:
+            flag = "  REGRESSION"
+            regressions.append(r.name)
+        print(f"  {r.name:<54}{speed:>+10.1%}{memory:>+10.1%}{flag}")
+    return regressions
+
+
+def python_tag() -> str:
+    return f"{platform.python_implementation().lower()}{sys.version_info.major}{sys.version_info.minor}"
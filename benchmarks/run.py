@@ -0,0 +1,130 @@
+"""
+Hot-path benchmark suite for the Sunbay Nexus SDK.
+
+Covers request serialization for every request model (including checkouts
+with large product lists), response decoding for every response model
+(including BatchQueryResponse with thousands of items), header and request
+id generation, and full NexusClient calls through an in-process fake
+transport. Reports ops/sec plus peak and retained memory per call
+(tracemalloc), and stores results as JSON for comparison between versions.
+
+Run from the repository root:
+
+    python benchmarks/run.py                       # run everything, save results/<version>-<python>.json
+    python benchmarks/run.py --filter decode       # only cases whose name contains "decode"
+    python benchmarks/run.py --compare benchmarks/results/1.0.14-cpython311.json --fail-on-regression
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import harness  # noqa: E402
+import samples  # noqa: E402
+from fake_transport import FakeTransportAdapter, install  # noqa: E402
+
+import sunbay_nexus_sdk  # noqa: E402
+from sunbay_nexus_sdk import MetricsRegistry, NexusClient, RequestHooks  # noqa: E402
+from sunbay_nexus_sdk.models.request import QueryRequest  # noqa: E402
+from sunbay_nexus_sdk.serialization import decode_response, get_json_codec, to_query_params  # noqa: E402
+from sunbay_nexus_sdk.utils.id_generator import generate_request_id  # noqa: E402
+
+# Requests sent as query parameters; batch_query is a POST.
+GET_REQUESTS = (QueryRequest,)
+
+
+def build_cases(json_codec: str) -> List[harness.Case]:
+    codec = get_json_codec(json_codec)
+    cases: List[harness.Case] = []
+
+    requests = samples.request_samples()
+    for name, request in requests.items():
+        if isinstance(request, GET_REQUESTS):
+            cases.append(harness.Case(f"query_params.{name}", "serialization", lambda r=request: to_query_params(r)))
+        cases.append(harness.Case(f"encode.{name}", "serialization", lambda r=request: codec.encode_request(r)))
+
+    for name, (body, response_type) in samples.response_samples().items():
+        cases.append(
+            harness.Case(
+                f"decode.{name}",
+                "decoding",
+                lambda b=body, t=response_type: decode_response(codec.loads(b), t),
+            )
+        )
+
+    client = NexusClient(api_key="sk_bench", base_url="https://bench.invalid", json_codec=codec)
+    http = client._http_client
+    cases.append(harness.Case("headers.post", "headers", lambda: http._build_headers(is_post=True)))
+    cases.append(harness.Case("headers.get", "headers", lambda: http._build_headers(is_post=False)))
+    cases.append(harness.Case("generate_request_id", "headers", generate_request_id))
+
+    responses = samples.response_samples()
+    large_checkout = f"CheckoutSaleRequest[{samples.LARGE_PRODUCT_LIST} products]"
+    large_batch = f"BatchQueryResponse[{samples.LARGE_BATCH_LIST} items]"
+    end_to_end = (
+        ("http.post.sale", "sale", requests["SaleRequest"], responses["SaleResponse"][0]),
+        ("http.get.query", "query", requests["QueryRequest"], responses["QueryResponse"][0]),
+        (f"http.post.checkout_sale[{samples.LARGE_PRODUCT_LIST}]", "checkout_sale",
+         requests[large_checkout], responses["CheckoutSaleResponse"][0]),
+        (f"http.post.batch_query[{samples.LARGE_BATCH_LIST}]", "batch_query",
+         requests["BatchQueryRequest"], responses[large_batch][0]),
+    )
+    for name, method, request, body in end_to_end:
+        # One client per case so each gets its own canned response.
+        nexus = NexusClient(api_key="sk_bench", base_url="https://bench.invalid", json_codec=codec)
+        install(nexus, FakeTransportAdapter(body))
+        cases.append(harness.Case(name, "http", lambda c=nexus, m=method, r=request: getattr(c, m)(r)))
+
+    instrumented = NexusClient(
+        api_key="sk_bench",
+        base_url="https://bench.invalid",
+        json_codec=codec,
+        metrics=MetricsRegistry(),
+        hooks=[RequestHooks()],
+    )
+    install(instrumented, FakeTransportAdapter(responses["SaleResponse"][0]))
+    cases.append(
+        harness.Case("http.post.sale+metrics+hooks", "http", lambda: instrumented.sale(requests["SaleRequest"]))
+    )
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", help="only run cases whose name contains this substring")
+    parser.add_argument("--json-codec", default="stdlib", help="stdlib, orjson or auto (default: stdlib)")
+    parser.add_argument("--quick", action="store_true", help="shorter runs, for smoke checks")
+    parser.add_argument("--save", type=Path, help="result file (default: results/<version>-<python>.json)")
+    parser.add_argument("--no-save", action="store_true", help="do not write a result file")
+    parser.add_argument("--compare", type=Path, help="saved result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold (default: 0.10)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    cases = build_cases(args.json_codec)
+    if args.filter:
+        cases = [c for c in cases if args.filter in c.name]
+
+    min_time, repeat = (0.02, 3) if args.quick else (0.2, 5)
+    results = [harness.measure(case, min_time=min_time, repeat=repeat) for case in cases]
+    harness.print_results(results)
+
+    if not args.no_save:
+        path = args.save or harness.RESULTS_DIR / f"{sunbay_nexus_sdk.__version__}-{harness.python_tag()}.json"
+        meta = harness.metadata(sunbay_nexus_sdk.__version__, {"json_codec": args.json_codec, "quick": args.quick})
+        harness.save(path, meta, results)
+        print(f"\nSaved {len(results)} results to {path}")
+
+    if args.compare:
+        regressions = harness.compare(harness.load(args.compare), results, args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
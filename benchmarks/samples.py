@@ -0,0 +1,269 @@
+"""
+Representative request objects and response payloads for every API model.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from sunbay_nexus_sdk.models.common import (
+    AuthAmount,
+    CheckoutAddress,
+    CheckoutAmount,
+    CheckoutProductItem,
+    PaymentMethodInfo,
+    PostAuthAmount,
+    RefundAmount,
+    SaleAmount,
+    TipConfig,
+    TipSuggestions,
+)
+from sunbay_nexus_sdk.models.request import (
+    AbortRequest,
+    AuthRequest,
+    BatchCloseRequest,
+    BatchQueryRequest,
+    CheckoutSaleRequest,
+    CreateCheckoutSessionRequest,
+    ForcedAuthRequest,
+    IncrementalAuthRequest,
+    PostAuthRequest,
+    QueryRequest,
+    RefundRequest,
+    SaleRequest,
+    TipAdjustRequest,
+    VoidRequest,
+)
+from sunbay_nexus_sdk.models.response import (
+    AbortResponse,
+    AuthResponse,
+    BatchCloseResponse,
+    BatchQueryResponse,
+    CheckoutSaleResponse,
+    CreateCheckoutSessionResponse,
+    ForcedAuthResponse,
+    IncrementalAuthResponse,
+    PostAuthResponse,
+    QueryResponse,
+    RefundResponse,
+    SaleResponse,
+    TipAdjustResponse,
+    VoidResponse,
+)
+
+APP_ID = "app_123456"
+MERCHANT_ID = "mch_789012"
+TERMINAL_SN = "T1234567890"
+
+LARGE_PRODUCT_LIST = 1000
+LARGE_BATCH_LIST = 5000
+
+
+def _products(count: int) -> List[CheckoutProductItem]:
+    return [CheckoutProductItem(amount=100, name=f"Product {i} - café", num=1) for i in range(count)]
+
+
+def _address() -> CheckoutAddress:
+    return CheckoutAddress(line_1="1 Market St", city="San Francisco", state="CA", postal_code="94105", country="US")
+
+
+def request_samples() -> Dict[str, Any]:
+    """
+    One populated instance of every request model, plus large checkouts.
+    """
+    sale_amount = SaleAmount(
+        order_amount=10000,
+        price_currency="USD",
+        tip_amount=200,
+        tax_amount=800,
+        tip_config=TipConfig(suggestions=TipSuggestions(fee_mode="RATE", values=[15, 18, 20])),
+    )
+    common = dict(
+        app_id=APP_ID,
+        merchant_id=MERCHANT_ID,
+        reference_order_id="ORDER20231119001",
+        transaction_request_id="PAY_REQ_1234567890",
+        description="Coffee and pastry",
+        terminal_sn=TERMINAL_SN,
+    )
+    checkout_common = dict(
+        app_id=APP_ID,
+        merchant_id=MERCHANT_ID,
+        transaction_request_id="PAY_REQ_1234567890",
+        reference_order_id="ORDER20231119001",
+        description="Online order",
+    )
+    return {
+        "SaleRequest": SaleRequest(
+            amount=sale_amount,
+            payment_method=PaymentMethodInfo(network_type="CREDIT", entry_mode="CONTACTLESS"),
+            attach='{"table": 12}',
+            notify_url="https://merchant.example.com/notify",
+            **common,
+        ),
+        "AuthRequest": AuthRequest(amount=AuthAmount(order_amount=10000, price_currency="USD"), **common),
+        "ForcedAuthRequest": ForcedAuthRequest(amount=AuthAmount(order_amount=10000, price_currency="USD"), **common),
+        "IncrementalAuthRequest": IncrementalAuthRequest(
+            app_id=APP_ID,
+            merchant_id=MERCHANT_ID,
+            original_transaction_id="TXN20231119001",
+            transaction_request_id="PAY_REQ_1234567891",
+            amount=AuthAmount(order_amount=2000, price_currency="USD"),
+            terminal_sn=TERMINAL_SN,
+        ),
+        "PostAuthRequest": PostAuthRequest(
+            app_id=APP_ID,
+            merchant_id=MERCHANT_ID,
+            original_transaction_id="TXN20231119001",
+            transaction_request_id="PAY_REQ_1234567892",
+            amount=PostAuthAmount(order_amount=12000, price_currency="USD", tip_amount=1500),
+            terminal_sn=TERMINAL_SN,
+        ),
+        "RefundRequest": RefundRequest(
+            app_id=APP_ID,
+            merchant_id=MERCHANT_ID,
+            transaction_request_id="PAY_REQ_1234567893",
+            amount=RefundAmount(order_amount=5000, price_currency="USD"),
+            original_transaction_id="TXN20231119001",
+            terminal_sn=TERMINAL_SN,
+        ),
+        "VoidRequest": VoidRequest(
+            app_id=APP_ID,
+            merchant_id=MERCHANT_ID,
+            transaction_request_id="PAY_REQ_1234567894",
+            original_transaction_id="TXN20231119001",
+            terminal_sn=TERMINAL_SN,
+        ),
+        "AbortRequest": AbortRequest(
+            app_id=APP_ID,
+            merchant_id=MERCHANT_ID,
+            original_transaction_request_id="PAY_REQ_1234567890",
+            terminal_sn=TERMINAL_SN,
+        ),
+        "TipAdjustRequest": TipAdjustRequest(
+            app_id=APP_ID,
+            merchant_id=MERCHANT_ID,
+            terminal_sn=TERMINAL_SN,
+            original_transaction_id="TXN20231119001",
+            tip_amount=300,
+        ),
+        "QueryRequest": QueryRequest(app_id=APP_ID, merchant_id=MERCHANT_ID, transaction_id="TXN20231119001"),
+        "BatchQueryRequest": BatchQueryRequest(app_id=APP_ID, merchant_id=MERCHANT_ID, terminal_sn=TERMINAL_SN),
+        "BatchCloseRequest": BatchCloseRequest(
+            app_id=APP_ID,
+            merchant_id=MERCHANT_ID,
+            transaction_request_id="PAY_REQ_1234567895",
+            terminal_sn=TERMINAL_SN,
+        ),
+        "CreateCheckoutSessionRequest": CreateCheckoutSessionRequest(
+            amount=CheckoutAmount(order_amount=300, price_currency="USD"),
+            product_list=_products(3),
+            **checkout_common,
+        ),
+        f"CreateCheckoutSessionRequest[{LARGE_PRODUCT_LIST} products]": CreateCheckoutSessionRequest(
+            amount=CheckoutAmount(order_amount=100 * LARGE_PRODUCT_LIST, price_currency="USD"),
+            product_list=_products(LARGE_PRODUCT_LIST),
+            **checkout_common,
+        ),
+        "CheckoutSaleRequest": CheckoutSaleRequest(
+            amount=CheckoutAmount(order_amount=300, price_currency="USD", tax_amount=24),
+            payment_method="CARD",
+            product_list=_products(3),
+            card_encrypted_data="eyJhbGciOiJSU0EtT0FFUCJ9." + "x" * 512,
+            customer_email="jane@example.com",
+            customer_name="Jane Doe",
+            billing_address=_address(),
+            shipping_address=_address(),
+            **checkout_common,
+        ),
+        f"CheckoutSaleRequest[{LARGE_PRODUCT_LIST} products]": CheckoutSaleRequest(
+            amount=CheckoutAmount(order_amount=100 * LARGE_PRODUCT_LIST, price_currency="USD"),
+            payment_method="CARD",
+            product_list=_products(LARGE_PRODUCT_LIST),
+            **checkout_common,
+        ),
+    }
+
+
+def _envelope(data: Dict[str, Any]) -> bytes:
+    return json.dumps({"code": "0", "msg": "Success", "traceId": "trace_abc123", "data": data}).encode("utf-8")
+
+
+def response_samples() -> Dict[str, Tuple[bytes, type]]:
+    """
+    Encoded API response bodies for every response model, with string amounts as sent by the backend.
+    """
+    transaction = {
+        "transactionId": "TXN20231119001",
+        "referenceOrderId": "ORDER20231119001",
+        "transactionRequestId": "PAY_REQ_1234567890",
+        "transactionStatus": "P",
+    }
+    original = {"originalTransactionId": "TXN20231119000", "originalTransactionRequestId": "PAY_REQ_0"}
+    amount = {"priceCurrency": "USD", "transAmount": "10200", "orderAmount": "10000", "tipAmount": "200"}
+    query = dict(
+        transaction,
+        transactionStatus="S",
+        transactionType="SALE",
+        amount=amount,
+        createTime="2023-11-19T10:00:00Z",
+        completeTime="2023-11-19T10:00:05Z",
+        maskedPan="411111******1111",
+        cardNetworkType="CREDIT",
+        batchNo="000123",
+        voucherNo="000456",
+        stan="000789",
+        rrn="123456789012",
+        authCode="A1B2C3",
+        entryMode="CONTACTLESS",
+        terminalSn=TERMINAL_SN,
+        unknownFutureField={"nested": True},
+    )
+    batch_item = {
+        "batchNo": "000123",
+        "startTime": "2023-11-19T00:00:00Z",
+        "channelCode": "CARD",
+        "priceCurrency": "USD",
+        "totalCount": 12,
+        "netAmount": "123400",
+        "tipAmount": "1000",
+        "surchargeAmount": "0",
+        "taxAmount": "500",
+    }
+    checkout_session = {
+        "checkoutUrl": "https://checkout.sunbay.us/s/abc",
+        "expiresAt": "2023-11-19T11:00:00Z",
+        "sessionId": "cs_123",
+        "appId": APP_ID,
+        "merchantId": MERCHANT_ID,
+        "transactionRequestId": "PAY_REQ_1234567890",
+        "referenceOrderId": "ORDER20231119001",
+        "amount": amount,
+        "productList": [{"amount": 100, "name": "Product", "num": 1}] * 3,
+        "collectBillingAddress": False,
+    }
+    return {
+        "SaleResponse": (_envelope(transaction), SaleResponse),
+        "AuthResponse": (_envelope(transaction), AuthResponse),
+        "ForcedAuthResponse": (_envelope(transaction), ForcedAuthResponse),
+        "IncrementalAuthResponse": (_envelope(transaction), IncrementalAuthResponse),
+        "PostAuthResponse": (_envelope(dict(transaction, **original)), PostAuthResponse),
+        "RefundResponse": (_envelope(dict(transaction, **original)), RefundResponse),
+        "VoidResponse": (_envelope(dict(transaction, **original)), VoidResponse),
+        "AbortResponse": (_envelope(dict(original, transactionStatus="C")), AbortResponse),
+        "TipAdjustResponse": (_envelope(dict(original, tipAmount="300")), TipAdjustResponse),
+        "QueryResponse": (_envelope(query), QueryResponse),
+        "BatchCloseResponse": (
+            _envelope(dict(batch_item, terminalSn=TERMINAL_SN, batchTime="2023-11-19T23:59:59Z", transactionCount=12)),
+            BatchCloseResponse,
+        ),
+        "BatchQueryResponse[10 items]": (_envelope({"batchList": [batch_item] * 10}), BatchQueryResponse),
+        f"BatchQueryResponse[{LARGE_BATCH_LIST} items]": (
+            _envelope({"batchList": [batch_item] * LARGE_BATCH_LIST}),
+            BatchQueryResponse,
+        ),
+        "CreateCheckoutSessionResponse": (_envelope(checkout_session), CreateCheckoutSessionResponse),
+        "CheckoutSaleResponse": (
+            _envelope(dict(transaction, redirectUrl="https://3ds.example.com/r")),
+            CheckoutSaleResponse,
+        ),
+    }
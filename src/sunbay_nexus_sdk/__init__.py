@@ -1,36 +1,153 @@
-"""Sunbay Nexus Python SDK public exports."""
-
-try:
-    from importlib.metadata import version
-
-    __version__ = version("sunbay-nexus-sdk")
-except ImportError:
-    # Fallback for Python < 3.8
-    import pkg_resources
-
-    __version__ = pkg_resources.get_distribution("sunbay-nexus-sdk").version
-except Exception:
-    # Fallback if package is not installed (e.g., during development)
-    __version__ = "1.0.14"
-
-from .client import NexusClient
-from .exceptions import SunbayBusinessError, SunbayNetworkError
-from .enums import (
-    AuthenticationMethod,
-    CardNetworkType,
-    DigitalWalletPaymentMethod,
-    EbtSubId,
-    EntryMode,
-    PaymentCategory,
-    PrintReceipt,
-    TransactionStatus,
-    TransactionType,
-)
+"""Sunbay Nexus Python SDK public exports.
+
+Exports are loaded on first access (PEP 562), so ``import sunbay_nexus_sdk``
+or ``from sunbay_nexus_sdk import TransactionStatus`` does not import
+requests, httpx or the HTTP clients.
+"""
+
+from importlib import import_module
+
+from ._version import __version__
+
+# Not imported from typing: importing typing alone costs a few milliseconds.
+# Type checkers treat a constant named TYPE_CHECKING as True.
+TYPE_CHECKING = False
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "NexusClient": ".client",
+    "AsyncNexusClient": ".async_client",
+    "BulkResult": ".bulk",
+    "ClientRegistry": ".registry",
+    "TransactionStatusTracker": ".tracker",
+    "LaneState": ".dispatcher",
+    "LaneStats": ".dispatcher",
+    "TerminalDispatcher": ".dispatcher",
+    "QueryCache": ".cache",
+    "QueryCacheStats": ".cache",
+    "IdempotencyJournal": ".journal",
+    "JournalEntry": ".journal",
+    "JournalState": ".journal",
+    "SqliteJournal": ".journal",
+    "SunbayBusinessError": ".exceptions",
+    "SunbayNetworkError": ".exceptions",
+    "SunbayCircuitOpenError": ".exceptions",
+    "SunbayRateLimitedError": ".exceptions",
+    "CircuitBreakerConfig": ".http.circuit_breaker",
+    "CircuitState": ".http.circuit_breaker",
+    "CoalescerStats": ".http.coalescing",
+    "RequestCoalescer": ".http.coalescing",
+    "HedgePolicy": ".http.hedging",
+    "LoggingPolicy": ".http.logging_policy",
+    "MetricsHook": ".http.metrics",
+    "MetricsRegistry": ".http.metrics",
+    "render_prometheus": ".http.metrics",
+    "PoolConfig": ".http.pool",
+    "RateLimit": ".http.rate_limit",
+    "RateLimiter": ".http.rate_limit",
+    "RateLimiterStats": ".http.rate_limit",
+    "RequestContext": ".http.hooks",
+    "RequestHooks": ".http.hooks",
+    "RequestOptions": ".http.options",
+    "RetryBudget": ".http.retry",
+    "RetryPolicy": ".http.retry",
+    "RetryStats": ".http.retry",
+    "TransactionStatus": ".enums",
+    "TransactionType": ".enums",
+    "CardNetworkType": ".enums",
+    "DigitalWalletPaymentMethod": ".enums",
+    "EbtSubId": ".enums",
+    "EntryMode": ".enums",
+    "PaymentCategory": ".enums",
+    "AuthenticationMethod": ".enums",
+    "PrintReceipt": ".enums",
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .async_client import AsyncNexusClient
+    from .bulk import BulkResult
+    from .cache import QueryCache, QueryCacheStats
+    from .client import NexusClient
+    from .dispatcher import LaneState, LaneStats, TerminalDispatcher
+    from .enums import (
+        AuthenticationMethod,
+        CardNetworkType,
+        DigitalWalletPaymentMethod,
+        EbtSubId,
+        EntryMode,
+        PaymentCategory,
+        PrintReceipt,
+        TransactionStatus,
+        TransactionType,
+    )
+    from .exceptions import SunbayBusinessError, SunbayCircuitOpenError, SunbayNetworkError, SunbayRateLimitedError
+    from .http.circuit_breaker import CircuitBreakerConfig, CircuitState
+    from .http.coalescing import CoalescerStats, RequestCoalescer
+    from .http.hedging import HedgePolicy
+    from .http.hooks import RequestContext, RequestHooks
+    from .http.logging_policy import LoggingPolicy
+    from .http.metrics import MetricsHook, MetricsRegistry, render_prometheus
+    from .http.options import RequestOptions
+    from .http.pool import PoolConfig
+    from .http.rate_limit import RateLimit, RateLimiter, RateLimiterStats
+    from .http.retry import RetryBudget, RetryPolicy, RetryStats
+    from .journal import IdempotencyJournal, JournalEntry, JournalState, SqliteJournal
+    from .registry import ClientRegistry
+    from .tracker import TransactionStatusTracker
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cache it so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = (
     "NexusClient",
+    "AsyncNexusClient",
+    "BulkResult",
+    "ClientRegistry",
+    "TransactionStatusTracker",
+    "LaneState",
+    "LaneStats",
+    "TerminalDispatcher",
+    "QueryCache",
+    "QueryCacheStats",
+    "IdempotencyJournal",
+    "JournalEntry",
+    "JournalState",
+    "SqliteJournal",
     "SunbayBusinessError",
     "SunbayNetworkError",
+    "SunbayCircuitOpenError",
+    "SunbayRateLimitedError",
+    "CircuitBreakerConfig",
+    "CircuitState",
+    "CoalescerStats",
+    "RequestCoalescer",
+    "HedgePolicy",
+    "LoggingPolicy",
+    "MetricsHook",
+    "MetricsRegistry",
+    "render_prometheus",
+    "PoolConfig",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimiterStats",
+    "RequestContext",
+    "RequestHooks",
+    "RequestOptions",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryStats",
     "TransactionStatus",
     "TransactionType",
     "CardNetworkType",
@@ -41,6 +158,3 @@ __all__ = (
     "AuthenticationMethod",
     "PrintReceipt",
 )
-
-
-
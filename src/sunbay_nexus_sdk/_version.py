@@ -0,0 +1,5 @@
+"""
+SDK version. Single source of truth: pyproject.toml reads it at build time.
+"""
+
+__version__ = "1.0.14"
@@ -0,0 +1,289 @@
+"""
+Asyncio AsyncNexusClient for Sunbay Nexus Python SDK.
+
+Exposes the same methods and models as NexusClient, but every API call is a
+coroutine running on a pooled httpx transport instead of a blocking thread.
+Requires the optional ``async`` extra (``pip install sunbay-nexus-sdk[async]``).
+"""
+
+import logging
+from typing import Dict, Optional, Sequence, Union
+
+from .client import _resolve_settings
+from .constants import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_READ_TIMEOUT,
+    PATH_ABORT,
+    PATH_AUTH,
+    PATH_BATCH_CLOSE,
+    PATH_BATCH_QUERY,
+    PATH_CHECKOUT_SALE,
+    PATH_CREATE_CHECKOUT_SESSION,
+    PATH_FORCED_AUTH,
+    PATH_INCREMENTAL_AUTH,
+    PATH_POST_AUTH,
+    PATH_QUERY,
+    PATH_REFUND,
+    PATH_SALE,
+    PATH_TIP_ADJUST,
+    PATH_VOID,
+)
+from .exceptions import SunbayBusinessError
+from .http import (
+    AsyncHttpClient,
+    LoggingPolicy,
+    MetricsHook,
+    PoolConfig,
+    RateLimiter,
+    RequestHooks,
+    RequestOptions,
+    RetryPolicy,
+)
+from .http.circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry, CircuitBreakerSnapshot
+from .models.request import (
+    AbortRequest,
+    AuthRequest,
+    BatchCloseRequest,
+    BatchQueryRequest,
+    CheckoutSaleRequest,
+    CreateCheckoutSessionRequest,
+    ForcedAuthRequest,
+    IncrementalAuthRequest,
+    PostAuthRequest,
+    QueryRequest,
+    RefundRequest,
+    SaleRequest,
+    TipAdjustRequest,
+    VoidRequest,
+)
+from .models.response import (
+    AbortResponse,
+    AuthResponse,
+    BatchCloseResponse,
+    BatchQueryResponse,
+    CheckoutSaleResponse,
+    CreateCheckoutSessionResponse,
+    ForcedAuthResponse,
+    IncrementalAuthResponse,
+    PostAuthResponse,
+    QueryResponse,
+    RefundResponse,
+    SaleResponse,
+    TipAdjustResponse,
+    VoidResponse,
+)
+from .serialization import JsonCodec
+
+
+class AsyncNexusClient:
+    """
+    Asyncio client for interacting with Sunbay Nexus APIs.
+
+    Create it once per event loop and share it between tasks; close it with
+    ``await client.aclose()`` or use ``async with AsyncNexusClient(...)``.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        logger: Optional[logging.Logger] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[None, CircuitBreakerConfig, CircuitBreakerRegistry] = None,
+        logging_policy: Optional[LoggingPolicy] = None,
+        metrics: Optional[MetricsHook] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        pool_config: Optional[PoolConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        api_key, base_url = _resolve_settings(api_key, base_url)
+
+        self._http_client = AsyncHttpClient(
+            api_key=api_key,
+            base_url=base_url,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+            max_connections=max_connections,
+            logger=logger,
+            json_codec=json_codec,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            logging_policy=logging_policy,
+            metrics=metrics,
+            hooks=hooks,
+            pool_config=pool_config,
+            rate_limiter=rate_limiter,
+        )
+
+    # --- Transaction APIs ---
+
+    async def sale(
+        self, request: SaleRequest, options: Optional[RequestOptions] = None
+    ) -> SaleResponse:
+        if request is None:
+            raise SunbayBusinessError("SaleRequest cannot be null")
+        return await self._http_client.post(PATH_SALE, request, SaleResponse, options)
+
+    async def auth(
+        self, request: AuthRequest, options: Optional[RequestOptions] = None
+    ) -> AuthResponse:
+        if request is None:
+            raise SunbayBusinessError("AuthRequest cannot be null")
+        return await self._http_client.post(PATH_AUTH, request, AuthResponse, options)
+
+    async def forced_auth(
+        self, request: ForcedAuthRequest, options: Optional[RequestOptions] = None
+    ) -> ForcedAuthResponse:
+        if request is None:
+            raise SunbayBusinessError("ForcedAuthRequest cannot be null")
+        return await self._http_client.post(PATH_FORCED_AUTH, request, ForcedAuthResponse, options)
+
+    async def incremental_auth(
+        self, request: IncrementalAuthRequest, options: Optional[RequestOptions] = None
+    ) -> IncrementalAuthResponse:
+        if request is None:
+            raise SunbayBusinessError("IncrementalAuthRequest cannot be null")
+        return await self._http_client.post(PATH_INCREMENTAL_AUTH, request, IncrementalAuthResponse, options)
+
+    async def post_auth(
+        self, request: PostAuthRequest, options: Optional[RequestOptions] = None
+    ) -> PostAuthResponse:
+        if request is None:
+            raise SunbayBusinessError("PostAuthRequest cannot be null")
+        return await self._http_client.post(PATH_POST_AUTH, request, PostAuthResponse, options)
+
+    async def refund(
+        self, request: RefundRequest, options: Optional[RequestOptions] = None
+    ) -> RefundResponse:
+        if request is None:
+            raise SunbayBusinessError("RefundRequest cannot be null")
+        return await self._http_client.post(PATH_REFUND, request, RefundResponse, options)
+
+    async def void_transaction(
+        self, request: VoidRequest, options: Optional[RequestOptions] = None
+    ) -> VoidResponse:
+        if request is None:
+            raise SunbayBusinessError("VoidRequest cannot be null")
+        return await self._http_client.post(PATH_VOID, request, VoidResponse, options)
+
+    async def abort(
+        self, request: AbortRequest, options: Optional[RequestOptions] = None
+    ) -> AbortResponse:
+        if request is None:
+            raise SunbayBusinessError("AbortRequest cannot be null")
+        return await self._http_client.post(PATH_ABORT, request, AbortResponse, options)
+
+    async def tip_adjust(
+        self, request: TipAdjustRequest, options: Optional[RequestOptions] = None
+    ) -> TipAdjustResponse:
+        if request is None:
+            raise SunbayBusinessError("TipAdjustRequest cannot be null")
+        return await self._http_client.post(PATH_TIP_ADJUST, request, TipAdjustResponse, options)
+
+    # --- Query APIs ---
+
+    async def query(
+        self, request: QueryRequest, options: Optional[RequestOptions] = None
+    ) -> QueryResponse:
+        if request is None:
+            raise SunbayBusinessError("QueryRequest cannot be null")
+        return await self._http_client.get(PATH_QUERY, request, QueryResponse, options)
+
+    # --- Settlement APIs ---
+
+    async def batch_query(
+        self, request: BatchQueryRequest, options: Optional[RequestOptions] = None
+    ) -> BatchQueryResponse:
+        """
+        Batch query.
+
+        Query batch information grouped by channel code and price currency.
+        """
+        if request is None:
+            raise SunbayBusinessError("BatchQueryRequest cannot be null")
+        return await self._http_client.post(PATH_BATCH_QUERY, request, BatchQueryResponse, options)
+
+    async def batch_close(
+        self, request: BatchCloseRequest, options: Optional[RequestOptions] = None
+    ) -> BatchCloseResponse:
+        """
+        Batch close.
+
+        Close the current transaction batch and trigger settlement process.
+        """
+        if request is None:
+            raise SunbayBusinessError("BatchCloseRequest cannot be null")
+        return await self._http_client.post(PATH_BATCH_CLOSE, request, BatchCloseResponse, options)
+
+    # --- Online checkout APIs ---
+
+    async def create_checkout_session(
+        self, request: CreateCheckoutSessionRequest, options: Optional[RequestOptions] = None
+    ) -> CreateCheckoutSessionResponse:
+        """
+        Create a Hosted Payment Page checkout session (POST /v1/checkout/create-session).
+        """
+        if request is None:
+            raise SunbayBusinessError("CreateCheckoutSessionRequest cannot be null")
+        return await self._http_client.post(
+            PATH_CREATE_CHECKOUT_SESSION, request, CreateCheckoutSessionResponse, options
+        )
+
+    async def checkout_sale(
+        self, request: CheckoutSaleRequest, options: Optional[RequestOptions] = None
+    ) -> CheckoutSaleResponse:
+        """
+        Direct online payment without a prior HPP session (POST /v1/checkout/sale).
+        """
+        if request is None:
+            raise SunbayBusinessError("CheckoutSaleRequest cannot be null")
+        return await self._http_client.post(PATH_CHECKOUT_SALE, request, CheckoutSaleResponse, options)
+
+    # --- Health ---
+
+    def circuit_breaker_states(self) -> Dict[str, CircuitBreakerSnapshot]:
+        """
+        Return per-path circuit breaker snapshots (state, failure rate, retry_after).
+
+        Empty when the client was created without ``circuit_breaker``.
+        """
+        return self._http_client.circuit_breaker_states()
+
+    @property
+    def metrics(self) -> Optional[MetricsHook]:
+        """
+        The metrics hook passed as ``metrics=``, or None when metrics are disabled.
+        """
+        return self._http_client.metrics
+
+    # --- Lifecycle ---
+
+    async def warm_up(self, connections: int = 1) -> int:
+        """
+        Open up to ``connections`` pooled connections before the first call.
+
+        Sends concurrent ``HEAD`` requests to the base URL (httpx cannot open
+        idle connections directly). Returns how many connections were opened.
+        """
+        return await self._http_client.warm_up(connections)
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled async transport. The client cannot be used afterwards.
+        """
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncNexusClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -0,0 +1,153 @@
+"""
+Concurrent bulk execution of Sunbay Nexus API calls.
+
+BulkExecutor runs requests for any endpoint on a bounded thread pool that
+shares the client's connection pool. The endpoint is chosen from the request
+type (SaleRequest -> sale, QueryRequest -> query, ...), so one batch may mix
+tip adjusts, queries and voids.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Set
+
+from .exceptions import SunbayBusinessError
+from .http import RequestOptions
+from .http.forks import LazyThreadPool
+from .models.base import BaseResponse
+from .models.request import (
+    AbortRequest,
+    AuthRequest,
+    BatchCloseRequest,
+    BatchQueryRequest,
+    CheckoutSaleRequest,
+    CreateCheckoutSessionRequest,
+    ForcedAuthRequest,
+    IncrementalAuthRequest,
+    PostAuthRequest,
+    QueryRequest,
+    RefundRequest,
+    SaleRequest,
+    TipAdjustRequest,
+    VoidRequest,
+)
+
+# Request type -> NexusClient method name.
+OPERATIONS: Dict[type, str] = {
+    SaleRequest: "sale",
+    AuthRequest: "auth",
+    ForcedAuthRequest: "forced_auth",
+    IncrementalAuthRequest: "incremental_auth",
+    PostAuthRequest: "post_auth",
+    RefundRequest: "refund",
+    VoidRequest: "void_transaction",
+    AbortRequest: "abort",
+    TipAdjustRequest: "tip_adjust",
+    QueryRequest: "query",
+    BatchQueryRequest: "batch_query",
+    BatchCloseRequest: "batch_close",
+    CreateCheckoutSessionRequest: "create_checkout_session",
+    CheckoutSaleRequest: "checkout_sale",
+}
+
+
+def operation_for(request: Any) -> str:
+    """
+    Return the NexusClient method name that handles ``request``.
+    """
+    for cls in type(request).__mro__:
+        operation = OPERATIONS.get(cls)
+        if operation is not None:
+            return operation
+    raise SunbayBusinessError(f"Unsupported request type: {type(request).__name__}")
+
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of one request in a bulk run: exactly one of response / error is set.
+    """
+
+    request: Any
+    response: Optional[BaseResponse]
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkExecutor:
+    """
+    Bounded thread pool that dispatches requests to a NexusClient.
+
+    Args:
+        client: NexusClient used for every call.
+        max_workers: Number of worker threads. Keep it at or below the
+            client's ``max_connections`` so workers do not queue for sockets.
+    """
+
+    def __init__(self, client: Any, max_workers: int) -> None:
+        self._client = client
+        self._pool = LazyThreadPool(max_workers, "sunbay-bulk")
+
+    @property
+    def max_workers(self) -> int:
+        return self._pool.max_workers
+
+    def _call(self, request: Any, options: Optional[RequestOptions]) -> BaseResponse:
+        return getattr(self._client, operation_for(request))(request, options)
+
+    def submit(self, request: Any, options: Optional[RequestOptions] = None) -> "Future[BaseResponse]":
+        """
+        Schedule one request and return a Future resolving to its response.
+        """
+        operation_for(request)
+        return self._pool.get().submit(self._call, request, options)
+
+    def map(
+        self,
+        requests: Iterable[Any],
+        options: Optional[RequestOptions] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[BulkResult]:
+        """
+        Run requests concurrently and yield BulkResult items in completion order.
+
+        The input iterable is consumed lazily: at most ``max_in_flight``
+        requests (default: ``max_workers``) are pending at any time, so huge or
+        unbounded generators are safe. Errors are reported per item and never
+        abort the rest of the batch.
+        """
+        limit = max(int(max_in_flight or self._pool.max_workers), 1)
+        pool = self._pool.get()
+        pending: Set["Future[BaseResponse]"] = set()
+        origin: Dict["Future[BaseResponse]", Any] = {}
+        iterator = iter(requests)
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    request = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future = pool.submit(self._call, request, options)
+                pending.add(future)
+                origin[future] = request
+            if not pending:
+                return
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                request = origin.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield BulkResult(request, future.result(), None)
+                else:
+                    yield BulkResult(request, None, error)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads. Pending work completes when ``wait`` is True.
+        """
+        self._pool.shutdown(wait)
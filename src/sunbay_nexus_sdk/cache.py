@@ -0,0 +1,267 @@
+"""
+Response cache for ``query``.
+
+Order, receipt and support screens query the same transaction again and
+again, while a transaction in a final status (SUCCESS, FAIL, CLOSED) almost
+never changes. A QueryCache passed to NexusClient keeps recent
+QueryResponse objects in a bounded LRU with a TTL per transaction status, and
+answers later queries by transaction_id, transaction_request_id or
+reference_order_id without a network call. NexusClient drops the cached
+original transaction when it sends a refund, void, tip adjust or post auth
+for it.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .enums import TransactionStatus
+from .exceptions import SunbayBusinessError
+from .http.forks import reset_lock_after_fork
+from .models.request import QueryRequest
+from .models.response import QueryResponse
+
+# Seconds a response is cached per transaction status. Statuses not listed
+# (INITIAL, PROCESSING) use ``default_ttl``, which does not cache by default.
+DEFAULT_TTLS: Mapping[str, float] = {
+    TransactionStatus.SUCCESS.value: 3600.0,
+    TransactionStatus.FAIL.value: 3600.0,
+    TransactionStatus.CLOSED.value: 3600.0,
+}
+
+# Lookup order: the most specific identifier of a request first.
+_ID_FIELDS = ("transaction_id", "transaction_request_id", "reference_order_id")
+
+# (app_id, merchant_id, identifier field, identifier value)
+_Key = Tuple[str, str, str, str]
+
+
+@dataclass
+class QueryCacheStats:
+    """
+    Counters of a QueryCache since it was created or last cleared.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _detached(response: QueryResponse) -> QueryResponse:
+    # A deep copy, so callers mutating a response (e.g. its amount) cannot
+    # change the cached one, without the call metadata (retry_stats, elapsed).
+    return copy.deepcopy(replace(response))
+
+
+class _Entry:
+    __slots__ = ("response", "expires", "keys")
+
+    def __init__(self, response: QueryResponse, expires: float, keys: List[_Key]) -> None:
+        self.response = response
+        self.expires = expires
+        self.keys = keys
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of QueryResponse objects with a TTL per transaction
+    status. Safe to share between threads.
+
+    Entries are keyed by app_id and merchant_id, not by API key: do not share
+    one cache between clients of tenants that must not see each other's
+    transactions.
+
+    Args:
+        max_entries: Transactions kept; the least recently used are evicted.
+        ttls: Seconds to cache a response per ``transaction_status`` value
+            (e.g. ``{"S": 86400, "P": 2}``); replaces DEFAULT_TTLS.
+        default_ttl: Seconds for statuses missing from ``ttls``. 0 (the
+            default) does not cache them.
+
+    Example:
+        client = NexusClient(api_key="sk_live_xxx", query_cache=QueryCache(max_entries=50_000))
+        client.query(request)  # later identical queries are answered locally
+        print(client.query_cache.stats().hit_ratio)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0.0,
+    ) -> None:
+        if max_entries < 1:
+            raise SunbayBusinessError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._ttls = {str(getattr(status, "value", status)): ttl for status, ttl in (ttls or DEFAULT_TTLS).items()}
+        self._default_ttl = default_ttl
+        # Each transaction is stored once under its first identifier; _index
+        # maps every identifier to that primary key.
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        self._index: Dict[_Key, _Key] = {}
+        # Generation of the last invalidation of each identifier, so a query
+        # sent before it cannot cache the state it made stale. Bounded like
+        # the entries; _floor is the newest generation dropped from it.
+        self._generation = 0
+        self._invalidated: "OrderedDict[_Key, int]" = OrderedDict()
+        self._floor = 0
+        self._stats = QueryCacheStats()
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+
+    def get(self, request: QueryRequest) -> Optional[QueryResponse]:
+        """
+        The cached response for ``request``, or None. Every identifier set on
+        the request must match the cached transaction.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._lookup(request, now)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+        return _detached(entry.response)
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter of invalidations; read it before sending a query and pass it
+        to ``put``.
+        """
+        return self._generation
+
+    def put(self, request: QueryRequest, response: QueryResponse, generation: Optional[int] = None) -> bool:
+        """
+        Cache ``response`` if its status has a positive TTL. Returns True when cached.
+
+        With ``generation`` (the value of ``generation`` when the query was
+        sent), a response is refused when one of its identifiers was
+        invalidated since: it may predate a refund or void.
+        """
+        ttl = self._ttls.get(response.transaction_status or "", self._default_ttl)
+        if ttl <= 0 or not response.is_success():
+            return False
+        # transaction_id and transaction_request_id identify one transaction;
+        # a reference_order_id may be shared by a sale and its refunds, so it
+        # is only an alias when the query itself used it.
+        identifiers = (
+            response.transaction_id or request.transaction_id,
+            response.transaction_request_id or request.transaction_request_id,
+            request.reference_order_id,
+        )
+        keys = [
+            (request.app_id, request.merchant_id, name, value)
+            for name, value in zip(_ID_FIELDS, identifiers)
+            if value
+        ]
+        if not keys:
+            return False
+        with self._lock:
+            if generation is not None and self._stale(keys, generation):
+                return False
+            for key in keys:
+                other = self._index.get(key)
+                if other is not None and self._entries[other].response.transaction_id == response.transaction_id:
+                    self._remove(other)
+            # A reference_order_id cached for another transaction now answers
+            # with this one; that transaction stays cached under its own ids.
+            self._entries[keys[0]] = _Entry(_detached(response), time.monotonic() + ttl, keys)
+            for key in keys:
+                self._index[key] = keys[0]
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+        return True
+
+    def invalidate(
+        self,
+        app_id: str,
+        merchant_id: str,
+        transaction_id: Optional[str] = None,
+        transaction_request_id: Optional[str] = None,
+        reference_order_id: Optional[str] = None,
+    ) -> int:
+        """
+        Drop the transactions matching any of the given identifiers. Returns
+        how many were dropped.
+        """
+        identifiers = (transaction_id, transaction_request_id, reference_order_id)
+        dropped = 0
+        with self._lock:
+            self._generation += 1
+            for name, value in zip(_ID_FIELDS, identifiers):
+                if not value:
+                    continue
+                key = (app_id, merchant_id, name, value)
+                self._invalidated[key] = self._generation
+                self._invalidated.move_to_end(key)
+                if self._remove(self._index.get(key)):
+                    dropped += 1
+            while len(self._invalidated) > self._max_entries:
+                self._floor = self._invalidated.popitem(last=False)[1]
+            self._stats.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the stats.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+            # Queries in flight may predate the clear: refuse their responses.
+            self._generation += 1
+            self._invalidated.clear()
+            self._floor = self._generation
+            self._stats = QueryCacheStats()
+
+    def stats(self) -> QueryCacheStats:
+        """
+        Snapshot of the hit, miss, eviction and invalidation counters.
+        """
+        with self._lock:
+            return replace(self._stats, size=len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, request: QueryRequest, now: float) -> Optional[_Entry]:
+        wanted = [(name, getattr(request, name)) for name in _ID_FIELDS if getattr(request, name)]
+        if not wanted:
+            return None
+        primary = self._index.get((request.app_id, request.merchant_id) + wanted[0])
+        entry = self._entries.get(primary) if primary is not None else None
+        if entry is None:
+            return None
+        if entry.expires <= now:
+            self._remove(primary)
+            return None
+        if any(getattr(entry.response, name) not in (None, value) for name, value in wanted[1:]):
+            return None
+        self._entries.move_to_end(primary)  # type: ignore[arg-type]
+        return entry
+
+    def _stale(self, keys: List[_Key], generation: int) -> bool:
+        if generation < self._floor:
+            return True
+        return any(self._invalidated.get(key, 0) > generation for key in keys)
+
+    def _remove(self, primary: Optional[_Key]) -> bool:
+        entry = self._entries.pop(primary, None) if primary is not None else None  # type: ignore[arg-type]
+        if entry is None:
+            return False
+        for key in entry.keys:
+            if self._index.get(key) == primary:
+                del self._index[key]
+        return True
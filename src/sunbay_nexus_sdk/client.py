@@ -7,8 +7,13 @@ interface used by integrators.
 
 import logging
 import os
-from typing import Optional
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
+from requests import Session
+
+from .bulk import BulkExecutor, BulkResult
+from .cache import QueryCache
 from .constants import (
     DEFAULT_BASE_URL,
     DEFAULT_CONNECT_TIMEOUT,
@@ -31,7 +36,21 @@ from .constants import (
     PATH_VOID,
 )
 from .exceptions import SunbayBusinessError
-from .http import HttpClient
+from .http import (
+    HedgePolicy,
+    HttpClient,
+    LoggingPolicy,
+    MetricsHook,
+    PoolConfig,
+    RateLimiter,
+    RequestCoalescer,
+    RequestHooks,
+    RequestOptions,
+    RetryPolicy,
+)
+from .http.circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry, CircuitBreakerSnapshot
+from .journal import IdempotencyJournal, JournaledPoster, JournalEntry
+from .models.base import BaseResponse
 from .models.request import (
     AbortRequest,
     AuthRequest,
@@ -64,6 +83,33 @@ from .models.response import (
     TipAdjustResponse,
     VoidResponse,
 )
+from .serialization import JsonCodec
+
+T = TypeVar("T", bound=BaseResponse)
+
+
+class _PinnedBaseUrl(str):
+    """
+    A base URL that SUNBAY_BASE_URL does not override. ClientRegistry builds
+    tenant clients with it, having applied the environment once itself.
+    """
+
+
+def _resolve_settings(api_key: Optional[str], base_url: str) -> Tuple[str, str]:
+    """
+    Apply environment defaults shared by NexusClient and AsyncNexusClient.
+    """
+    if api_key is None:
+        api_key = os.getenv("SUNBAY_API_KEY")
+    if not api_key:
+        raise SunbayBusinessError("API key cannot be null or empty")
+
+    # Allow overriding base_url via environment for different environments
+    # (e.g. dev / uat / prod) while keeping a sensible default.
+    env_base_url = os.getenv("SUNBAY_BASE_URL")
+    if env_base_url and not isinstance(base_url, _PinnedBaseUrl):
+        base_url = env_base_url
+    return api_key, str(base_url)
 
 
 class NexusClient:
@@ -71,6 +117,28 @@ class NexusClient:
     Main client for interacting with Sunbay Nexus APIs.
 
     This client is designed to be thread-safe and reused across threads.
+    Close it with ``close()`` or use ``with NexusClient(...) as client``. It is
+    fork-safe: a child process (gunicorn prefork, multiprocessing) opens its
+    own connections instead of reusing the parent's.
+
+    ``session`` lets several clients share one requests Session and its
+    connection pool; ``max_connections`` and ``pool_config`` are then taken
+    from the session's adapter. ClientRegistry uses it for multi-tenant setups.
+
+    ``hedge_policy`` turns on request hedging for ``query`` (the only GET
+    call): a slow call is sent a second time on another connection and the
+    first answer wins. ``coalescer`` makes concurrent identical ``query`` and
+    ``batch_query`` calls share one network call and its response.
+
+    ``journal`` (an IdempotencyJournal such as SqliteJournal) makes
+    transaction POSTs safe to retry: outcomes lost to a timeout or a crash
+    are resolved with ``query`` by transaction_request_id instead of
+    resubmitted blindly, and concurrent duplicates share one call. The
+    client does not close the journal.
+
+    ``query_cache`` answers repeated ``query`` calls for transactions in a
+    final status from memory. Refund, void, tip adjust and post auth calls
+    drop their original transaction from it.
     """
 
     def __init__(
@@ -82,17 +150,21 @@ class NexusClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         logger: Optional[logging.Logger] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[None, CircuitBreakerConfig, CircuitBreakerRegistry] = None,
+        logging_policy: Optional[LoggingPolicy] = None,
+        metrics: Optional[MetricsHook] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        pool_config: Optional[PoolConfig] = None,
+        session: Optional[Session] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        journal: Optional[IdempotencyJournal] = None,
+        query_cache: Optional[QueryCache] = None,
     ) -> None:
-        if api_key is None:
-            api_key = os.getenv("SUNBAY_API_KEY")
-        if not api_key:
-            raise SunbayBusinessError("API key cannot be null or empty")
-
-        # Allow overriding base_url via environment for different environments
-        # (e.g. dev / uat / prod) while keeping a sensible default.
-        env_base_url = os.getenv("SUNBAY_BASE_URL")
-        if env_base_url:
-            base_url = env_base_url
+        api_key, base_url = _resolve_settings(api_key, base_url)
 
         self._http_client = HttpClient(
             api_key=api_key,
@@ -102,65 +174,143 @@ class NexusClient:
             max_retries=max_retries,
             max_connections=max_connections,
             logger=logger,
+            json_codec=json_codec,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            logging_policy=logging_policy,
+            metrics=metrics,
+            hooks=hooks,
+            pool_config=pool_config,
+            session=session,
+            hedge_policy=hedge_policy,
+            coalescer=coalescer,
+            rate_limiter=rate_limiter,
         )
+        # Bulk worker pool is created on first use and sized to the
+        # connection pool so workers never queue for sockets.
+        self._bulk = BulkExecutor(self, max_workers=max_connections)
+        self._poster = JournaledPoster(self, journal, logger) if journal is not None else None
+        self._query_cache = query_cache
+
+    def _post_transaction(
+        self, path: str, request: Any, response_type: Type[T], options: Optional[RequestOptions]
+    ) -> T:
+        if self._poster is None:
+            return self._http_client.post(path, request, response_type, options)
+        return self._poster.post(path, request, response_type, options)
+
+    def _post_follow_up(
+        self, path: str, request: Any, response_type: Type[T], options: Optional[RequestOptions]
+    ) -> T:
+        # Calls changing an earlier transaction make its cached query stale,
+        # whatever their outcome. Invalidating before sending also makes the
+        # cache refuse responses of queries already in flight.
+        self._invalidate_original(request)
+        try:
+            if path == PATH_TIP_ADJUST:
+                return self._http_client.post(path, request, response_type, options)
+            return self._post_transaction(path, request, response_type, options)
+        finally:
+            self._invalidate_original(request)
+
+    def _invalidate_original(self, request: Any) -> None:
+        if self._query_cache is not None:
+            self._query_cache.invalidate(
+                request.app_id,
+                request.merchant_id,
+                transaction_id=request.original_transaction_id,
+                transaction_request_id=request.original_transaction_request_id,
+                reference_order_id=getattr(request, "reference_order_id", None),
+            )
 
     # --- Transaction APIs ---
 
-    def sale(self, request: SaleRequest) -> SaleResponse:
+    def sale(
+        self, request: SaleRequest, options: Optional[RequestOptions] = None
+    ) -> SaleResponse:
         if request is None:
             raise SunbayBusinessError("SaleRequest cannot be null")
-        return self._http_client.post(PATH_SALE, request, SaleResponse)
+        return self._post_transaction(PATH_SALE, request, SaleResponse, options)
 
-    def auth(self, request: AuthRequest) -> AuthResponse:
+    def auth(
+        self, request: AuthRequest, options: Optional[RequestOptions] = None
+    ) -> AuthResponse:
         if request is None:
             raise SunbayBusinessError("AuthRequest cannot be null")
-        return self._http_client.post(PATH_AUTH, request, AuthResponse)
+        return self._post_transaction(PATH_AUTH, request, AuthResponse, options)
 
-    def forced_auth(self, request: ForcedAuthRequest) -> ForcedAuthResponse:
+    def forced_auth(
+        self, request: ForcedAuthRequest, options: Optional[RequestOptions] = None
+    ) -> ForcedAuthResponse:
         if request is None:
             raise SunbayBusinessError("ForcedAuthRequest cannot be null")
-        return self._http_client.post(PATH_FORCED_AUTH, request, ForcedAuthResponse)
+        return self._post_transaction(PATH_FORCED_AUTH, request, ForcedAuthResponse, options)
 
-    def incremental_auth(self, request: IncrementalAuthRequest) -> IncrementalAuthResponse:
+    def incremental_auth(
+        self, request: IncrementalAuthRequest, options: Optional[RequestOptions] = None
+    ) -> IncrementalAuthResponse:
         if request is None:
             raise SunbayBusinessError("IncrementalAuthRequest cannot be null")
-        return self._http_client.post(PATH_INCREMENTAL_AUTH, request, IncrementalAuthResponse)
+        return self._post_transaction(PATH_INCREMENTAL_AUTH, request, IncrementalAuthResponse, options)
 
-    def post_auth(self, request: PostAuthRequest) -> PostAuthResponse:
+    def post_auth(
+        self, request: PostAuthRequest, options: Optional[RequestOptions] = None
+    ) -> PostAuthResponse:
         if request is None:
             raise SunbayBusinessError("PostAuthRequest cannot be null")
-        return self._http_client.post(PATH_POST_AUTH, request, PostAuthResponse)
+        return self._post_follow_up(PATH_POST_AUTH, request, PostAuthResponse, options)
 
-    def refund(self, request: RefundRequest) -> RefundResponse:
+    def refund(
+        self, request: RefundRequest, options: Optional[RequestOptions] = None
+    ) -> RefundResponse:
         if request is None:
             raise SunbayBusinessError("RefundRequest cannot be null")
-        return self._http_client.post(PATH_REFUND, request, RefundResponse)
+        return self._post_follow_up(PATH_REFUND, request, RefundResponse, options)
 
-    def void_transaction(self, request: VoidRequest) -> VoidResponse:
+    def void_transaction(
+        self, request: VoidRequest, options: Optional[RequestOptions] = None
+    ) -> VoidResponse:
         if request is None:
             raise SunbayBusinessError("VoidRequest cannot be null")
-        return self._http_client.post(PATH_VOID, request, VoidResponse)
+        return self._post_follow_up(PATH_VOID, request, VoidResponse, options)
 
-    def abort(self, request: AbortRequest) -> AbortResponse:
+    def abort(
+        self, request: AbortRequest, options: Optional[RequestOptions] = None
+    ) -> AbortResponse:
         if request is None:
             raise SunbayBusinessError("AbortRequest cannot be null")
-        return self._http_client.post(PATH_ABORT, request, AbortResponse)
+        return self._http_client.post(PATH_ABORT, request, AbortResponse, options)
 
-    def tip_adjust(self, request: TipAdjustRequest) -> TipAdjustResponse:
+    def tip_adjust(
+        self, request: TipAdjustRequest, options: Optional[RequestOptions] = None
+    ) -> TipAdjustResponse:
         if request is None:
             raise SunbayBusinessError("TipAdjustRequest cannot be null")
-        return self._http_client.post(PATH_TIP_ADJUST, request, TipAdjustResponse)
+        return self._post_follow_up(PATH_TIP_ADJUST, request, TipAdjustResponse, options)
 
     # --- Query APIs ---
 
-    def query(self, request: QueryRequest) -> QueryResponse:
+    def query(
+        self, request: QueryRequest, options: Optional[RequestOptions] = None
+    ) -> QueryResponse:
         if request is None:
             raise SunbayBusinessError("QueryRequest cannot be null")
-        return self._http_client.get(PATH_QUERY, request, QueryResponse)
+        cache = self._query_cache
+        if cache is None:
+            return self._http_client.get(PATH_QUERY, request, QueryResponse, options)
+        cached = cache.get(request)
+        if cached is not None:
+            return cached
+        generation = cache.generation
+        response = self._http_client.get(PATH_QUERY, request, QueryResponse, options)
+        cache.put(request, response, generation)
+        return response
 
     # --- Settlement APIs ---
 
-    def batch_query(self, request: BatchQueryRequest) -> BatchQueryResponse:
+    def batch_query(
+        self, request: BatchQueryRequest, options: Optional[RequestOptions] = None
+    ) -> BatchQueryResponse:
         """
         Batch query.
 
@@ -168,15 +318,18 @@ class NexusClient:
 
         Args:
             request: Batch query request
+            options: Optional per-call overrides (e.g. retry policy)
 
         Returns:
             Batch query response
         """
         if request is None:
             raise SunbayBusinessError("BatchQueryRequest cannot be null")
-        return self._http_client.post(PATH_BATCH_QUERY, request, BatchQueryResponse)
+        return self._http_client.post(PATH_BATCH_QUERY, request, BatchQueryResponse, options)
 
-    def batch_close(self, request: BatchCloseRequest) -> BatchCloseResponse:
+    def batch_close(
+        self, request: BatchCloseRequest, options: Optional[RequestOptions] = None
+    ) -> BatchCloseResponse:
         """
         Batch close.
 
@@ -185,18 +338,19 @@ class NexusClient:
 
         Args:
             request: Batch close request
+            options: Optional per-call overrides (e.g. retry policy)
 
         Returns:
             Batch close response
         """
         if request is None:
             raise SunbayBusinessError("BatchCloseRequest cannot be null")
-        return self._http_client.post(PATH_BATCH_CLOSE, request, BatchCloseResponse)
+        return self._http_client.post(PATH_BATCH_CLOSE, request, BatchCloseResponse, options)
 
     # --- Online checkout APIs ---
 
     def create_checkout_session(
-        self, request: CreateCheckoutSessionRequest
+        self, request: CreateCheckoutSessionRequest, options: Optional[RequestOptions] = None
     ) -> CreateCheckoutSessionResponse:
         """
         Create a Hosted Payment Page checkout session (POST /v1/checkout/create-session).
@@ -206,10 +360,12 @@ class NexusClient:
         if request is None:
             raise SunbayBusinessError("CreateCheckoutSessionRequest cannot be null")
         return self._http_client.post(
-            PATH_CREATE_CHECKOUT_SESSION, request, CreateCheckoutSessionResponse
+            PATH_CREATE_CHECKOUT_SESSION, request, CreateCheckoutSessionResponse, options
         )
 
-    def checkout_sale(self, request: CheckoutSaleRequest) -> CheckoutSaleResponse:
+    def checkout_sale(
+        self, request: CheckoutSaleRequest, options: Optional[RequestOptions] = None
+    ) -> CheckoutSaleResponse:
         """
         Direct online payment without a prior HPP session (POST /v1/checkout/sale).
 
@@ -217,24 +373,106 @@ class NexusClient:
         """
         if request is None:
             raise SunbayBusinessError("CheckoutSaleRequest cannot be null")
-        return self._http_client.post(PATH_CHECKOUT_SALE, request, CheckoutSaleResponse)
+        return self._post_transaction(PATH_CHECKOUT_SALE, request, CheckoutSaleResponse, options)
+
+    # --- Bulk APIs ---
+
+    def submit(self, request: Any, options: Optional[RequestOptions] = None) -> "Future[BaseResponse]":
+        """
+        Schedule a request on the bulk worker pool and return a Future.
+
+        The endpoint is chosen from the request type (e.g. QueryRequest -> query).
+        """
+        return self._bulk.submit(request, options)
+
+    def map(
+        self,
+        requests: Iterable[Any],
+        options: Optional[RequestOptions] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[BulkResult]:
+        """
+        Run many requests concurrently and yield BulkResult items as they complete.
+
+        Requests may target different endpoints. The iterable is consumed
+        lazily with at most ``max_in_flight`` pending calls (default: the
+        worker count, i.e. ``max_connections``). A failing item is reported in
+        its BulkResult.error and does not stop the batch.
+
+        Example:
+            for result in client.map(tip_adjust_requests):
+                if not result.ok:
+                    log_failure(result.request, result.error)
+        """
+        return self._bulk.map(requests, options, max_in_flight)
+
+    # --- Journal ---
+
+    def resolve_pending(self, older_than: Optional[float] = None) -> List[JournalEntry]:
+        """
+        Resolve journaled transactions whose outcome is still unknown, e.g.
+        after a restart, with ``query``. Only entries not updated for
+        ``older_than`` seconds (default: connect + read timeout) are resolved,
+        so calls in flight elsewhere are left alone.
+
+        Returns the resolved entries (COMPLETED, REJECTED, or still PENDING
+        when ``query`` failed). Raises SunbayBusinessError without a journal.
+        """
+        if self._poster is None:
+            raise SunbayBusinessError("Client was created without a journal")
+        return self._poster.resolve_pending(older_than)
+
+    @property
+    def query_cache(self) -> Optional[QueryCache]:
+        """
+        The cache passed as ``query_cache=``, or None when queries are not cached.
+        """
+        return self._query_cache
+
+    # --- Health ---
+
+    def circuit_breaker_states(self) -> Dict[str, CircuitBreakerSnapshot]:
+        """
+        Return per-path circuit breaker snapshots (state, failure rate, retry_after).
+
+        Empty when the client was created without ``circuit_breaker``.
+        """
+        return self._http_client.circuit_breaker_states()
+
+    @property
+    def metrics(self) -> Optional[MetricsHook]:
+        """
+        The metrics hook passed as ``metrics=``, or None when metrics are disabled.
+        """
+        return self._http_client.metrics
 
     # --- Lifecycle ---
 
-    def __enter__(self) -> "NexusClient":
+    def warm_up(self, connections: int = 1) -> int:
         """
-        Context manager entry. Allows using NexusClient with 'with' statement.
+        Open up to ``connections`` pooled connections (TCP and TLS handshakes)
+        before the first call, so early requests after a deploy do not pay for
+        them. Returns how many connections were opened (at most ``max_connections``).
 
-        Note: Python requests Session will automatically close on program exit
-        via garbage collection, so explicit cleanup is not necessary.
+        Raises:
+            SunbayNetworkError: when no connection could be opened.
         """
-        return self
+        return self._http_client.warm_up(connections)
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+    def close(self, timeout: Optional[float] = None) -> bool:
         """
-        Context manager exit. No explicit cleanup needed as Python's garbage
-        collector will handle resource cleanup automatically.
+        Close the client: stop the bulk workers, wait up to ``timeout``
+        seconds (None: no limit) for calls in flight, then close pooled
+        connections. Calls made afterwards, including queued bulk items that
+        had not started yet, raise SunbayBusinessError.
+
+        Returns True when every call in flight finished in time.
         """
-        pass
+        self._bulk.shutdown(wait=False)
+        return self._http_client.close(timeout)
 
+    def __enter__(self) -> "NexusClient":
+        return self
 
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -17,6 +17,13 @@ DEFAULT_MAX_CONNECTIONS: int = 200
 # API response success code.
 RESPONSE_SUCCESS_CODE: str = "0"
 
+# Business codes meaning "no such transaction".
+TRANSACTION_NOT_FOUND_CODES: tuple = ("T0404",)
+
+# Business codes of a transient condition ("system busy"): the same call may
+# succeed later.
+TRANSIENT_BUSINESS_CODES: tuple = ("S0001",)
+
 # HTTP status ranges.
 HTTP_STATUS_OK_START: int = 200
 HTTP_STATUS_OK_END: int = 300
@@ -24,12 +31,17 @@ HTTP_STATUS_CLIENT_ERROR_START: int = 400
 HTTP_STATUS_CLIENT_ERROR_END: int = 500
 HTTP_STATUS_SERVER_ERROR_START: int = 500
 
+# HTTP statuses that signal a transient condition and may be retried safely.
+HTTP_STATUS_TOO_MANY_REQUESTS: int = 429
+RETRYABLE_HTTP_STATUSES: tuple = (429, 502, 503, 504)
+
 # Header names.
 HEADER_AUTHORIZATION: str = "Authorization"
 HEADER_REQUEST_ID: str = "X-Client-Request-Id"
 HEADER_TIMESTAMP: str = "X-Timestamp"
 HEADER_CONTENT_TYPE: str = "Content-Type"
 HEADER_USER_AGENT: str = "User-Agent"
+HEADER_RETRY_AFTER: str = "Retry-After"
 
 AUTHORIZATION_BEARER_PREFIX: str = "Bearer "
 CONTENT_TYPE_JSON: str = "application/json"
@@ -0,0 +1,335 @@
+"""
+Per-terminal dispatch of semi-integration transactions.
+
+A POS terminal runs one pushed transaction at a time; a second ``sale`` sent
+to a busy terminal fails. TerminalDispatcher keeps one FIFO lane per
+``terminal_sn``: calls for the same terminal run one after another, calls for
+different terminals run in parallel on a bounded worker pool. With a
+TransactionStatusTracker, a lane also stays busy after a pushed transaction
+was accepted, until that transaction reaches a final status. ``abort`` is
+never queued: it is sent at once and frees the terminal's lane.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Deque, Dict, NamedTuple, Optional, Tuple
+
+from .bulk import operation_for
+from .exceptions import SunbayBusinessError
+from .http import RequestOptions
+from .http.forks import LazyThreadPool, reset_lock_after_fork
+from .models.base import BaseResponse
+from .models.request import AbortRequest, AuthRequest, ForcedAuthRequest, SaleRequest
+from .models.response import AbortResponse
+from .tracker import FINAL_TRANSACTION_STATUSES, TransactionStatusTracker
+
+# Requests always pushed to the terminal; the others have a push_to_terminal flag.
+_ALWAYS_PUSHED = (SaleRequest, AuthRequest, ForcedAuthRequest)
+
+# (transaction_id, transaction_request_id) of the transaction holding a lane.
+_Held = Tuple[Optional[str], Optional[str]]
+
+
+class LaneState(str, Enum):
+    """
+    What a terminal lane is doing.
+    """
+
+    # A call of the lane is in flight.
+    RUNNING = "RUNNING"
+    # A pushed transaction holds the terminal until it is final.
+    HELD = "HELD"
+    # Calls wait for a worker; none is in flight.
+    QUEUED = "QUEUED"
+
+
+class LaneStats(NamedTuple):
+    """
+    State of one terminal lane. Wait times (seconds) run from ``submit`` to
+    the start of the call.
+    """
+
+    queued: int
+    state: LaneState
+    completed: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.completed if self.completed else 0.0
+
+
+class _Item:
+    __slots__ = ("request", "options", "future", "queued_at")
+
+    def __init__(self, request: Any, options: Optional[RequestOptions]) -> None:
+        self.request = request
+        self.options = options
+        self.future: "Future[BaseResponse]" = Future()
+        self.queued_at = time.monotonic()
+
+
+class _Lane:
+    __slots__ = ("items", "busy", "running", "held", "completed", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.items: Deque[_Item] = deque()
+        # A worker turn is scheduled or running, or the lane is held by a
+        # pushed transaction that is not final yet.
+        self.busy = False
+        self.running = False
+        self.held: Optional[_Held] = None
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class TerminalDispatcher:
+    """
+    Serialize calls per terminal while running different terminals in parallel.
+
+    Args:
+        client: NexusClient used for every call.
+        max_concurrency: Terminals with a call in flight at the same time.
+            Keep it at or below the client's ``max_connections``.
+        tracker: When given, a lane stays busy after a pushed transaction
+            (sale, auth, forced_auth, or a call with ``push_to_terminal``) is
+            accepted in a non-final status, until the tracker sees it reach
+            SUCCESS, FAIL or CLOSED, or gives up.
+        logger: Optional logger (defaults to ``sunbay_nexus_sdk.dispatcher``).
+
+    Example:
+        with TransactionStatusTracker(client) as tracker:
+            dispatcher = TerminalDispatcher(client, max_concurrency=50, tracker=tracker)
+            future = dispatcher.submit(sale_request)  # queued behind the terminal's current sale
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_concurrency: int = 16,
+        tracker: Optional[TransactionStatusTracker] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._client = client
+        self._pool = LazyThreadPool(max_concurrency, "sunbay-dispatch")
+        self._tracker = tracker
+        self._logger = logger or logging.getLogger("sunbay_nexus_sdk.dispatcher")
+        # Lanes with queued, running or held calls; idle lanes are dropped.
+        self._lanes: Dict[str, _Lane] = {}
+        self._closed = False
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        reset_lock_after_fork(self)
+
+    def submit(self, request: Any, options: Optional[RequestOptions] = None) -> "Future[BaseResponse]":
+        """
+        Queue a call on the lane of ``request.terminal_sn`` and return a
+        Future resolving to its response.
+        """
+        if isinstance(request, AbortRequest):
+            raise SunbayBusinessError("AbortRequest is not queued, use abort()")
+        operation_for(request)
+        terminal_sn = getattr(request, "terminal_sn", None)
+        if not terminal_sn:
+            raise SunbayBusinessError(f"{type(request).__name__} has no terminal_sn to dispatch on")
+        item = _Item(request, options)
+        with self._lock:
+            if self._closed:
+                raise SunbayBusinessError("TerminalDispatcher is closed")
+            lane = self._lanes.get(terminal_sn)
+            if lane is None:
+                lane = self._lanes[terminal_sn] = _Lane()
+            lane.items.append(item)
+            start = not lane.busy
+            lane.busy = True
+        if start:
+            self._schedule(terminal_sn)
+        return item.future
+
+    def abort(self, request: AbortRequest, options: Optional[RequestOptions] = None) -> AbortResponse:
+        """
+        Send an abort right away, bypassing the lanes and the concurrency
+        limit. A lane held by the aborted transaction is freed at once
+        instead of waiting for the tracker to see it CLOSED.
+        """
+        response = self._client.abort(request, options)
+        ids = (request.original_transaction_id, request.original_transaction_request_id)
+        with self._lock:
+            held = [
+                (terminal_sn, lane.held)
+                for terminal_sn, lane in self._lanes.items()
+                if lane.held is not None
+                and (not request.terminal_sn or terminal_sn == request.terminal_sn)
+                and any(value is not None and value == held for value, held in zip(ids, lane.held))
+            ]
+        for terminal_sn, key in held:
+            self._logger.debug("Abort frees terminal %s", terminal_sn)
+            self._release(terminal_sn, key)
+        return response
+
+    def depth(self, terminal_sn: str) -> int:
+        """
+        Calls queued on a terminal's lane, not counting the one in flight.
+        """
+        with self._lock:
+            lane = self._lanes.get(terminal_sn)
+            return len(lane.items) if lane is not None else 0
+
+    def lanes(self) -> Dict[str, LaneStats]:
+        """
+        Queue depth, state and wait times of every lane with queued, running
+        or held calls, by terminal_sn. A lane is dropped when it goes idle,
+        so its counters cover the calls since it last was.
+        """
+        with self._lock:
+            return {
+                terminal_sn: LaneStats(len(lane.items), _state(lane), lane.completed, lane.total_wait, lane.max_wait)
+                for terminal_sn, lane in self._lanes.items()
+            }
+
+    def close(self, cancel_pending: bool = False, wait: bool = True) -> None:
+        """
+        Stop accepting calls. Queued calls are cancelled when
+        ``cancel_pending`` is True and still run otherwise; ``wait`` blocks
+        until they and the calls in flight finished. Without ``wait`` the
+        worker threads stop once the last queued call finished.
+        """
+        with self._lock:
+            self._closed = True
+            cancelled = []
+            if cancel_pending:
+                for lane in self._lanes.values():
+                    cancelled.extend(lane.items)
+                    lane.items.clear()
+            if wait:
+                self._idle.wait_for(self._drained)
+            drained = self._drained()
+        for item in cancelled:
+            item.future.cancel()
+        if drained:
+            self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "TerminalDispatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _after_fork(self) -> None:
+        # Calls running or held in the parent never finish in a forked child.
+        self._idle = threading.Condition(self._lock)
+        self._lanes = {}
+
+    def _drained(self) -> bool:
+        # Idle lanes are dropped; a held lane without queued calls has
+        # nothing left to run.
+        return all(lane.held is not None and not lane.items for lane in self._lanes.values())
+
+    def _lane_idle(self, terminal_sn: str) -> bool:
+        # Called with the lock held when a lane has nothing left to run.
+        # Returns True when the workers of a closed dispatcher can stop.
+        del self._lanes[terminal_sn]
+        self._idle.notify_all()
+        return self._closed and self._drained()
+
+    def _schedule(self, terminal_sn: str) -> None:
+        # One call per turn: a lane with more work goes back to the end of the
+        # executor queue, so busy terminals cannot starve the others.
+        self._pool.get().submit(self._run_next, terminal_sn)
+
+    def _run_next(self, terminal_sn: str) -> None:
+        with self._lock:
+            lane = self._lanes[terminal_sn]
+            if not lane.items:
+                stop = self._lane_idle(terminal_sn)
+                item = None
+            else:
+                item = lane.items.popleft()
+        if item is None:
+            if stop:
+                self._pool.shutdown(wait=False)
+            return
+        if not item.future.set_running_or_notify_cancel():
+            self._release(terminal_sn, None)
+            return
+        waited = time.monotonic() - item.queued_at
+        with self._lock:
+            lane.running = True
+            lane.completed += 1
+            lane.total_wait += waited
+            lane.max_wait = max(lane.max_wait, waited)
+
+        try:
+            response = getattr(self._client, operation_for(item.request))(item.request, item.options)
+        except BaseException as exc:  # noqa: B902 - resolve the Future instead of losing the error
+            item.future.set_exception(exc)
+            self._release(terminal_sn, None)
+            return
+        held = self._hold(terminal_sn, item.request, response)
+        item.future.set_result(response)
+        if held is None:
+            self._release(terminal_sn, None)
+
+    def _hold(self, terminal_sn: str, request: Any, response: BaseResponse) -> Optional[_Held]:
+        # Keep the lane busy until the pushed transaction is final.
+        tracker = self._tracker
+        transaction_id = getattr(response, "transaction_id", None)
+        if tracker is None or not transaction_id:
+            return None
+        if not (isinstance(request, _ALWAYS_PUSHED) or getattr(request, "push_to_terminal", False)):
+            return None
+        if getattr(response, "transaction_status", None) in FINAL_TRANSACTION_STATUSES:
+            return None
+        key: _Held = (transaction_id, getattr(request, "transaction_request_id", None))
+        with self._lock:
+            lane = self._lanes[terminal_sn]
+            lane.held = key
+            lane.running = False
+            # close() may be waiting for the lanes to go idle or held.
+            self._idle.notify_all()
+        try:
+            tracker.track(
+                request.app_id,
+                request.merchant_id,
+                transaction_id=transaction_id,
+                callback=lambda _: self._release(terminal_sn, key),
+            )
+        except SunbayBusinessError:
+            # Tracker closed: nothing will tell us when the terminal is free.
+            with self._lock:
+                self._lanes[terminal_sn].held = None
+            return None
+        return key
+
+    def _release(self, terminal_sn: str, held: Optional[_Held]) -> None:
+        # Free the lane after a call, or after the transaction ``held`` ended
+        # (tracker callback or abort, whichever comes first).
+        with self._lock:
+            lane = self._lanes.get(terminal_sn)
+            if held is not None:
+                if lane is None or lane.held != held:
+                    return
+                lane.held = None
+            lane.running = False
+            if lane.items:
+                stop = None
+            else:
+                stop = self._lane_idle(terminal_sn)
+        if stop is None:
+            self._schedule(terminal_sn)
+        elif stop:
+            self._pool.shutdown(wait=False)
+
+
+def _state(lane: _Lane) -> LaneState:
+    if lane.running:
+        return LaneState.RUNNING
+    if lane.held is not None:
+        return LaneState.HELD
+    return LaneState.QUEUED
@@ -11,6 +11,13 @@ from typing import Optional
 class SunbayError(Exception):
     """Base class for all Sunbay Nexus SDK exceptions."""
 
+    # Retry bookkeeping (RetryStats) of the failed call, set by the HTTP client.
+    retry_stats = None
+    # X-Client-Request-Id sent with the failed call.
+    client_request_id = None
+    # Total call duration in seconds, including retries.
+    elapsed = None
+
 
 class SunbayBusinessError(SunbayError):
     """
@@ -33,12 +40,42 @@ class SunbayNetworkError(SunbayError):
 Network exception used for HTTP/network level errors.
     """
 
-    def __init__(self, message: str, retryable: bool, *, cause: Optional[BaseException] = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        retryable: bool,
+        *,
+        cause: Optional[BaseException] = None,
+        status_code: Optional[int] = None,
+    ) -> None:
         super().__init__(message)
         self.retryable = retryable
+        self.status_code = status_code
         self.__cause__ = cause
 
     def __str__(self) -> str:
         return f"SunbayNetworkError(message={str(super())!r}, retryable={self.retryable!r})"
 
 
+class SunbayCircuitOpenError(SunbayNetworkError):
+    """
+Network exception raised without sending the request because the circuit
+breaker for the API path is open.
+    """
+
+    def __init__(self, path: str, retry_after: float) -> None:
+        super().__init__(f"Circuit breaker open for {path}", retryable=True)
+        self.path = path
+        self.retry_after = retry_after
+
+
+class SunbayRateLimitedError(SunbayNetworkError):
+    """
+Network exception raised without sending the request because the client-side
+rate limiter would have made it wait longer than allowed.
+    """
+
+    def __init__(self, scope: str, retry_after: float) -> None:
+        super().__init__(f"Rate limit exceeded for {scope}", retryable=True)
+        self.scope = scope
+        self.retry_after = retry_after
@@ -7,27 +7,34 @@ response parsing) so that the public client only deals with business logic.
 
 from __future__ import annotations
 
-import json
 import logging
-import platform
-import sys
+import os
+import threading
 import time
-from dataclasses import asdict, is_dataclass
-from typing import Any, Dict, Optional, Type, TypeVar
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Type, Union
 
-import requests
 from requests import Response, Session
 from requests.exceptions import RequestException, Timeout
 
-from .. import __version__, constants
-from ..exceptions import SunbayBusinessError, SunbayNetworkError
-from ..models.base import BaseResponse
-from ..utils.id_generator import generate_request_id
-
-T = TypeVar("T", bound=BaseResponse)
-
-
-class HttpClient:
+from .. import constants
+from ..exceptions import SunbayBusinessError, SunbayError, SunbayNetworkError
+from ..serialization import JsonCodec
+from .adapter import SunbayHTTPAdapter, consume_connect_time, set_connect_time
+from .base import BaseHttpClient, T
+from .options import RequestOptions
+from .circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry
+from .coalescing import COALESCED_POST_PATHS, CoalescerStats, RequestCoalescer
+from .hedging import HedgePolicy
+from .hooks import RequestContext, RequestHooks
+from .logging_policy import CallLog, LoggingPolicy
+from .metrics import MetricsHook, MetricsRegistry, render_prometheus
+from .pool import PoolConfig
+from .rate_limit import RateLimit, RateLimiter, RateLimiterStats
+from .retry import RetryBudget, RetryPolicy, RetryStats
+
+
+class HttpClient(BaseHttpClient):
     """
     Low-level HTTP client used by NexusClient.
     """
@@ -41,359 +48,407 @@ class HttpClient:
         max_retries: int,
         max_connections: int,
         logger: Optional[logging.Logger] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[None, CircuitBreakerConfig, CircuitBreakerRegistry] = None,
+        logging_policy: Optional[LoggingPolicy] = None,
+        metrics: Optional[MetricsHook] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_config: Optional[PoolConfig] = None,
+        session: Optional[Session] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
-        self._api_key = api_key
-        self._base_url = base_url.rstrip("/")
-        self._connect_timeout = connect_timeout
-        self._read_timeout = read_timeout
-        self._max_retries = max_retries
-        # Logger follows mainstream SDK practice:
-        # - use standard logging
-        # - do not configure handlers or levels here
-        # - let application decide how to handle output
-        self._logger = logger or logging.getLogger("sunbay_nexus_sdk.http")
-
-        self._session = Session()
-        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_connections)
-        self._session.mount("http://", adapter)
-        self._session.mount("https://", adapter)
-
-    def post(self, path: str, request_body: Any, response_type: Type[T]) -> T:
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+            logger=logger,
+            json_codec=json_codec,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            logging_policy=logging_policy,
+            metrics=metrics,
+            hooks=hooks,
+            rate_limiter=rate_limiter,
+        )
+
+        # Calls in flight, so close() can drain them. Reset in a forked child,
+        # which inherits the parent's count but none of its threads.
+        self._calls = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._pid = os.getpid()
+
+        # Hedged GETs run on worker threads so the caller can take whichever
+        # answer comes first. Two workers per connection: the pool, not the
+        # executor, is what limits concurrent requests.
+        self._hedge_policy = hedge_policy
+        self._hedge_workers = 2 * max(max_connections, 1)
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        self._coalescer = coalescer
+
+        self._adapter: Optional[SunbayHTTPAdapter]
+        self._owns_session = session is None
+        if session is None:
+            self._session = Session()
+            self._adapter = SunbayHTTPAdapter(pool_config, metrics=metrics, pool_maxsize=max_connections)
+            self._session.mount("http://", self._adapter)
+            self._session.mount("https://", self._adapter)
+        else:
+            # Shared session (e.g. ClientRegistry): its adapters own the pool,
+            # so max_connections and pool_config do not apply here.
+            self._session = session
+            adapter = session.get_adapter(self._base_url)
+            self._adapter = adapter if isinstance(adapter, SunbayHTTPAdapter) else None
+
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Open up to ``connections`` pooled connections (TCP and TLS handshakes)
+        to the API host, in parallel. Returns how many were opened.
+
+        Raises:
+            SunbayNetworkError: when no connection could be opened.
+        """
+        if self._adapter is None:
+            raise SunbayBusinessError("warm_up needs a session with a SunbayHTTPAdapter mounted")
+        # Same TLS verification settings as the calls (REQUESTS_CA_BUNDLE etc.).
+        settings = self._session.merge_environment_settings(self._base_url, {}, None, None, None)
+        opened = self._adapter.warm_up(
+            self._base_url, connections, self._connect_timeout, self._logger, verify=settings["verify"]
+        )
+        if connections > 0 and opened == 0:
+            raise SunbayNetworkError(f"Could not open any connection to {self._base_url}", retryable=True)
+        self._logger.debug("Warmed up %d connection(s) to %s", opened, self._base_url)
+        return opened
+
+    def post(
+        self,
+        path: str,
+        request_body: Any,
+        response_type: Type[T],
+        options: Optional[RequestOptions] = None,
+    ) -> T:
         url = f"{self._base_url}{path}"
         json_body = self._serialize_request_body(request_body)
-        headers = self._build_headers(is_post=True)
-
-        if self._logger.isEnabledFor(logging.INFO):
-            self._logger.info(
-                "Request %s %s - Headers: %s, Body: %s",
-                "POST",
-                url,
-                headers,
-                json_body,
-            )
 
-        try:
-            response = self._session.post(
-                url,
-                headers=headers,
-                data=json_body,
-                timeout=(self._connect_timeout, self._read_timeout),
+        def call() -> T:
+            headers = self._build_headers(is_post=True, options=options)
+            context = self._new_context("POST", path, url, headers, self._merchant_id_of(request_body))
+
+            call_log = self._start_call_log("POST", path, url, headers, json_body)
+
+            return self._execute(
+                context,
+                response_type,
+                options,
+                call_log,
+                lambda: self._session.post(
+                    url,
+                    headers=headers,
+                    data=json_body,
+                    timeout=(self._connect_timeout, self._read_timeout),
+                ),
             )
-            return self._handle_response("POST", url, response, response_type)
-        except Timeout as exc:
-            self._logger.warning("Request timeout %s %s: %s", "POST", url, exc)
-            raise SunbayNetworkError("Request timeout", retryable=True, cause=exc) from exc
-        except RequestException as exc:
-            self._logger.warning("Network error %s %s: %s", "POST", url, exc)
-            raise SunbayNetworkError(f"Network error: {exc}", retryable=True, cause=exc) from exc
-
-    def get(self, path: str, request_obj: Any, response_type: Type[T]) -> T:
+
+        if path not in COALESCED_POST_PATHS:
+            return call()
+        return self._coalesced(("POST", url, json_body), options, call)
+
+    def get(
+        self,
+        path: str,
+        request_obj: Any,
+        response_type: Type[T],
+        options: Optional[RequestOptions] = None,
+    ) -> T:
         url = f"{self._base_url}{path}"
         params = self._build_query_params(request_obj)
-        headers = self._build_headers(is_post=False)
-
-        if self._logger.isEnabledFor(logging.INFO):
-            self._logger.info(
-                "Request %s %s - Headers: %s, Params: %s",
-                "GET",
-                url,
-                headers,
-                params,
-            )
 
-        attempts = 0
-        max_attempts = max(self._max_retries, 1)
+        def call() -> T:
+            headers = self._build_headers(is_post=False, options=options)
+            context = self._new_context("GET", path, url, headers, self._merchant_id_of(request_obj))
 
-        while True:
-            attempts += 1
-            try:
-                response = self._session.get(
+            call_log = self._start_call_log("GET", path, url, headers, params)
+
+            return self._execute(
+                context,
+                response_type,
+                options,
+                call_log,
+                lambda: self._session.get(
                     url,
                     headers=headers,
                     params=params,
                     timeout=(self._connect_timeout, self._read_timeout),
-                )
-                return self._handle_response("GET", url, response, response_type)
-            except Timeout as exc:
-                if attempts >= max_attempts:
-                    self._logger.warning("Request timeout %s %s after %s attempts", "GET", url, attempts)
-                    raise SunbayNetworkError("Request timeout", retryable=True, cause=exc) from exc
-                if self._logger.isEnabledFor(logging.DEBUG):
-                    self._logger.debug(
-                        "Request timeout %s %s (attempt %s/%s), will retry",
-                        "GET",
-                        url,
-                        attempts,
-                        max_attempts,
-                    )
-                self._sleep_before_retry(attempts)
-            except RequestException as exc:
-                if attempts >= max_attempts:
-                    self._logger.warning("Network error %s %s after %s attempts: %s", "GET", url, attempts, exc)
-                    raise SunbayNetworkError(f"Network error: {exc}", retryable=True, cause=exc) from exc
-                if self._logger.isEnabledFor(logging.DEBUG):
-                    self._logger.debug(
-                        "Network error %s %s (attempt %s/%s): %s, will retry",
-                        "GET",
-                        url,
-                        attempts,
-                        max_attempts,
-                        exc,
-                    )
-                self._sleep_before_retry(attempts)
-
-    @staticmethod
-    def _sleep_before_retry(attempts: int) -> None:
-        delay_seconds = 1.0 * attempts
-        time.sleep(delay_seconds)
-
-    @staticmethod
-    def _serialize_request_body(request_body: Any) -> str:
-        if is_dataclass(request_body):
-            raw_payload = asdict(request_body)
-        elif isinstance(request_body, dict):
-            raw_payload = request_body
-        else:
-            raise SunbayBusinessError("Request body must be a dataclass instance or dict")
-
-        # Convert Python-style field names (snake_case) to API-style (camelCase),
-        # aligning with Java SDK behaviour and backend expectations.
-        payload = HttpClient._to_camel_dict(raw_payload)
-        return json.dumps(payload, ensure_ascii=False)
-
-    @staticmethod
-    def _build_query_params(request_obj: Any) -> Dict[str, Any]:
-        if request_obj is None:
-            return {}
-        if is_dataclass(request_obj):
-            data = asdict(request_obj)
-        elif isinstance(request_obj, dict):
-            data = request_obj
-        else:
-            raise SunbayBusinessError("Request object for GET must be a dataclass instance or dict")
+                ),
+                hedge=self._hedge_policy_for(options),
+            )
 
-        filtered = {k: v for k, v in data.items() if v is not None}
-        return HttpClient._to_camel_dict(filtered)
+        return self._coalesced(("GET", url, tuple(sorted(params.items()))), options, call)
 
-    @staticmethod
-    def _to_camel_dict(source: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Convert a dict with snake_case keys to camelCase keys recursively.
+    def _coalesced(self, key: Tuple[Any, ...], options: Optional[RequestOptions], call: Callable[[], T]) -> T:
+        # A call with its own request id, headers or policies would lose them
+        # by joining another call, so it is never merged into one.
+        coalescer = self._coalescer
+        if coalescer is None or (
+            options is not None
+            and (options.request_id or options.headers or options.retry_policy or options.hedge_policy)
+        ):
+            return call()
+        return coalescer.run((self._api_key,) + key, call)
 
-        This keeps the Python dataclass field style while matching the
-        JSON/query parameter naming convention expected by the HTTP API.
+    def close(self, timeout: Optional[float] = None) -> bool:
         """
+        Stop accepting calls, wait up to ``timeout`` seconds (None: no limit)
+        for calls in flight, then close pooled connections. A shared session
+        (``session=``) is left open for its owner.
 
-        def _snake_to_camel(name: str) -> str:
-            parts = name.split("_")
-            if not parts:
-                return name
-            head = parts[0]
-            tail = [p.capitalize() for p in parts[1:] if p]
-            return head + "".join(tail)
-
-        result: Dict[str, Any] = {}
-        for key, value in source.items():
-            camel_key = _snake_to_camel(key)
-            if isinstance(value, dict):
-                result[camel_key] = HttpClient._to_camel_dict(value)
-            elif isinstance(value, list):
-                result[camel_key] = [
-                    HttpClient._to_camel_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                result[camel_key] = value
-        return result
-
-    def _build_headers(self, *, is_post: bool) -> Dict[str, str]:
-        # Build User-Agent following mainstream SDK practice (e.g., AWS Boto3, Stripe)
-        # Format: SDKName/Version Python/PythonVersion OS/OSVersion
-        python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-        os_name = platform.system()
-        os_version = platform.release()
-        user_agent = f"SunbayNexusSDK-Python/{__version__} Python/{python_version} {os_name}/{os_version}"
-
-        headers: Dict[str, str] = {
-            constants.HEADER_AUTHORIZATION: f"{constants.AUTHORIZATION_BEARER_PREFIX}{self._api_key}",
-            constants.HEADER_REQUEST_ID: generate_request_id(),
-            constants.HEADER_TIMESTAMP: str(int(time.time() * 1000)),
-            constants.HEADER_USER_AGENT: user_agent,
-        }
-        if is_post:
-            headers[constants.HEADER_CONTENT_TYPE] = constants.CONTENT_TYPE_JSON
-        return headers
-
-    @staticmethod
-    def _parse_response_body(body: Optional[str], response_type: Type[T]) -> T:
-        if body is None or not body.strip():
-            raise SunbayNetworkError("Empty response body", retryable=False)
-
+        Returns True when every call in flight finished before the pools were closed.
+        """
+        self._check_fork()
+        with self._calls:
+            self._closed = True
+            drained = self._calls.wait_for(lambda: self._in_flight == 0, timeout)
+            in_flight = self._in_flight
+        if not drained:
+            self._logger.warning("Closing HTTP client with %d call(s) still in flight", in_flight)
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        if self._owns_session:
+            self._session.close()
+        return drained
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._calls = threading.Condition()
+            self._in_flight = 0
+            self._hedge_executor = None
+            self._hedge_lock = threading.Lock()
+            self._pid = os.getpid()
+
+    def _begin_call(self) -> None:
+        self._check_fork()
+        with self._calls:
+            if self._closed:
+                raise SunbayBusinessError("Client is closed")
+            self._in_flight += 1
+
+    def _end_call(self) -> None:
+        with self._calls:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._calls.notify_all()
+
+    def _execute(
+        self,
+        context: RequestContext,
+        response_type: Type[T],
+        options: Optional[RequestOptions],
+        call_log: Optional[CallLog],
+        send: Callable[[], Response],
+        hedge: Optional[HedgePolicy] = None,
+    ) -> T:
+        self._begin_call()
         try:
-            root = json.loads(body)
-        except json.JSONDecodeError as exc:
-            raise SunbayNetworkError("Failed to parse response body as JSON", retryable=False, cause=exc) from exc
-
-        code = root.get("code")
-        msg = root.get("msg")
-        trace_id = root.get("traceId")
-        data = root.get("data")
-
-        if data is None:
-            payload: Dict[str, Any] = {}
-        elif isinstance(data, dict):
-            # Convert API camelCase fields in data payload to Python snake_case
-            # so that dataclass constructors receive matching keyword arguments.
-            payload = HttpClient._to_snake_dict(data)
-        else:
-            payload = {"data": data}
-
-        # Normalize nested amount structures and inject base fields, allowing
-        # data fields to override only when explicitly set.
-        HttpClient._normalize_amount_fields(payload)
-        payload.setdefault("code", code)
-        payload.setdefault("msg", msg)
-        payload.setdefault("trace_id", trace_id)
-
-        # Handle batch_list field: convert list of dicts to list of BatchQueryItem objects
-        if "batch_list" in payload and payload["batch_list"] is not None:
-            from ..models.common import BatchQueryItem
-            batch_list = payload["batch_list"]
-            if isinstance(batch_list, list):
-                payload["batch_list"] = [
-                    BatchQueryItem(**item) if isinstance(item, dict) else item
-                    for item in batch_list
-                ]
-
-        obj = response_type(**payload)  # type: ignore[arg-type]
-        if not isinstance(obj, BaseResponse):
-            raise SunbayNetworkError("Response type is not a subclass of BaseResponse", retryable=False)
-        return obj
-
-    def _handle_response(
+            return self._execute_with_retries(context, response_type, options, call_log, send, hedge)
+        except SunbayError as exc:
+            if call_log is not None:
+                call_log.failure(self._logger, exc)
+            raise
+        finally:
+            self._end_call()
+
+    def _execute_with_retries(
         self,
-        method: str,
-        url: str,
-        response: Response,
+        context: RequestContext,
         response_type: Type[T],
+        options: Optional[RequestOptions],
+        call_log: Optional[CallLog],
+        send: Callable[[], Response],
+        hedge: Optional[HedgePolicy] = None,
     ) -> T:
-        status = response.status_code
-        text = response.text
-
-        if self._logger.isEnabledFor(logging.INFO):
-            self._logger.info("Response %s %s - Status: %s, Body: %s", method, url, status, text)
+        method, path, url = context.method, context.path, context.url
+        policy = self._retry_policy_for(options)
+        policy.record_call()
+        stats = RetryStats()
 
-        if constants.HTTP_STATUS_OK_START <= status < constants.HTTP_STATUS_OK_END:
-            obj = self._parse_response_body(text, response_type)
-            if not obj.is_success():
-                self._logger.error(
-                    "API error %s %s - code: %s, msg: %s, trace_id: %s",
+        while True:
+            stats.attempts += 1
+            rate_wait = self._reserve_rate(context, stats)
+            if rate_wait > 0:
+                time.sleep(rate_wait)
+            breaker = self._acquire_circuit(context, stats)
+            self._before_send(context, stats)
+            started = time.monotonic()
+            try:
+                response = send() if hedge is None else self._send_hedged(hedge, context, stats, send)
+            except RequestException as exc:
+                self._record_circuit(breaker, None, started)
+                context.status, context.error = None, exc
+                if self._metrics is not None:
+                    self._record_attempt(path, method, None, started, connect=consume_connect_time(), error=exc)
+                delay = policy.next_delay(method, stats, exc=exc)
+                if delay is None:
+                    raise self._network_error(
+                        context, exc, timeout=isinstance(exc, Timeout), stats=stats
+                    ) from exc
+                self._on_retry(context, stats, policy, exc, delay)
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            status = response.status_code
+            self._record_circuit(breaker, status, started)
+            self._record_rate(context, status, response.headers.get(constants.HEADER_RETRY_AFTER))
+            context.status, context.error = status, None
+            if self._metrics is not None:
+                self._record_attempt(
+                    path,
                     method,
-                    url,
-                    obj.code,
-                    obj.msg,
-                    obj.trace_id,
+                    status,
+                    started,
+                    ttfb=response.elapsed.total_seconds(),
+                    connect=consume_connect_time(),
                 )
-                raise SunbayBusinessError(obj.msg or "API error", code=obj.code, trace_id=obj.trace_id)
-            return obj
-
-        message_parts = [f"HTTP {status}"]
-        if constants.HTTP_STATUS_CLIENT_ERROR_START <= status < constants.HTTP_STATUS_CLIENT_ERROR_END:
-            message_parts.append("(Client Error)")
-        elif status >= constants.HTTP_STATUS_SERVER_ERROR_START:
-            message_parts.append("(Server Error)")
-        if text:
-            message_parts.append(f"- {text}")
-        message = " ".join(message_parts)
-
-        self._logger.error("HTTP error %s %s - Status: %s, Message: %s", method, url, status, message)
-        raise SunbayNetworkError(message, retryable=False)
-
-    @staticmethod
-    def _to_snake_dict(source: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Convert a dict with camelCase keys to snake_case keys recursively.
-
-        This mirrors the behaviour of the Java SDK's JSON mapping where
-        JSON uses camelCase but Java/Python fields use standard naming.
-        """
-
-        def _camel_to_snake(name: str) -> str:
-            chars = []
-            for ch in name:
-                if ch.isupper():
-                    if chars:
-                        chars.append("_")
-                    chars.append(ch.lower())
-                else:
-                    chars.append(ch)
-            return "".join(chars)
-
-        result: Dict[str, Any] = {}
-        for key, value in source.items():
-            snake_key = _camel_to_snake(key)
-            if isinstance(value, dict):
-                result[snake_key] = HttpClient._to_snake_dict(value)
-            elif isinstance(value, list):
-                result[snake_key] = [
-                    HttpClient._to_snake_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                result[snake_key] = value
-        return result
-
-    @staticmethod
-    def _normalize_amount_fields(payload: Dict[str, Any]) -> None:
-        """
-        Normalize numeric fields inside amount-like structures.
-
-        The HTTP API may encode monetary fields as strings. This helper converts
-        known numeric amount fields to int so that they match the Python
-        dataclass type hints (e.g. Amount).
+            if status in policy.retry_on_status:
+                delay = policy.next_delay(
+                    method,
+                    stats,
+                    status=status,
+                    retry_after=response.headers.get(constants.HEADER_RETRY_AFTER),
+                )
+                if delay is not None:
+                    self._on_retry(context, stats, policy, f"HTTP {status}", delay)
+                    response.close()
+                    time.sleep(delay)
+                    continue
 
-        All amount fields are in the smallest currency unit (e.g., cents for USD, fen for CNY)
-        and are represented as integers.
-        """
+            return self._process_response(context, status, response.content, response_type, stats, call_log)
 
-        numeric_keys = (
-            "trans_amount",
-            "order_amount",
-            "tax_amount",
-            "surcharge_amount",
-            "tip_amount",
-            "cashback_amount",
-            "net_amount",
-        )
+    def _hedge_policy_for(self, options: Optional[RequestOptions]) -> Optional[HedgePolicy]:
+        if options is not None and options.hedge_policy is not None:
+            return options.hedge_policy
+        return self._hedge_policy
 
-        def _convert_fields(amount_dict: Dict[str, Any]) -> None:
-            for key in numeric_keys:
-                value = amount_dict.get(key)
-                if isinstance(value, str):
-                    try:
-                        amount_dict[key] = int(value)
-                    except ValueError:
-                        # Keep original value if it cannot be parsed.
-                        continue
-
-        for field_name in ("amount", "total_amount"):
-            obj = payload.get(field_name)
-            if isinstance(obj, dict):
-                _convert_fields(obj)
-
-        # Handle batch_list field for BatchQueryResponse
-        batch_list = payload.get("batch_list")
-        if isinstance(batch_list, list):
-            for item in batch_list:
-                if isinstance(item, dict):
-                    _convert_fields(item)
-
-        # Handle batch-related fields in BatchCloseResponse
-        for batch_field in ("net_amount", "tip_amount", "surcharge_amount", "tax_amount"):
-            value = payload.get(batch_field)
-            if isinstance(value, str):
-                try:
-                    payload[batch_field] = int(value)
-                except ValueError:
-                    continue
+    def _rate_allows_hedge(self, context: RequestContext) -> bool:
+        # A hedge is an extra request: it needs a token, but never waits for one.
+        limiter = self._rate_limiter
+        return limiter is None or limiter.try_acquire(self._api_key, context.merchant_id, context.path)
 
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            with self._hedge_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=self._hedge_workers, thread_name_prefix="sunbay-hedge"
+                    )
+        return self._hedge_executor
+
+    def _send_hedged(
+        self, hedge: HedgePolicy, context: RequestContext, stats: RetryStats, send: Callable[[], Response]
+    ) -> Response:
+        # One attempt: send, and if nothing came back within the hedge delay,
+        # send the same request again on another pooled connection.
+        hedge.record_request()
+        executor = self._hedge_pool()
+        delay = hedge.current_delay
+        futures = [executor.submit(_timed_send, hedge, send)]
+        done, _ = wait(futures, timeout=delay)
+        if not done and hedge.try_hedge() and self._rate_allows_hedge(context):
+            stats.hedges += 1
+            self._logger.debug("Hedging %s %s after %.3fs", context.method, context.url, delay)
+            futures.append(executor.submit(_timed_send, hedge, send))
+        winner = _first_answer(futures)
+        for future in futures:
+            if future is not winner:
+                _abandon(future)
+        if len(futures) > 1 and self._metrics is not None:
+            self._metrics.record_hedge(context.path, context.method, winner is not futures[0])
+        response, connect = winner.result()
+        # The connect time was measured on the worker thread.
+        set_connect_time(connect)
+        return response
+
+
+# A response and the connect time measured while sending it.
+_Sent = Tuple[Response, Optional[float]]
+
+
+def _timed_send(hedge: HedgePolicy, send: Callable[[], Response]) -> _Sent:
+    started = time.monotonic()
+    try:
+        response = send()
+    finally:
+        connect = consume_connect_time()
+    if response.status_code not in constants.RETRYABLE_HTTP_STATUSES:
+        hedge.record_latency(time.monotonic() - started)
+    return response, connect
+
+
+def _answered(future: Future[_Sent]) -> bool:
+    return future.exception() is None and future.result()[0].status_code not in constants.RETRYABLE_HTTP_STATUSES
+
+
+def _first_answer(futures: List[Future[_Sent]]) -> Future[_Sent]:
+    # First request with a usable answer; the first one sent when none has.
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in futures:
+            if future in done and _answered(future):
+                return future
+    return futures[0]
+
+
+def _abandon(future: Future[_Sent]) -> None:
+    # A blocking requests call cannot be interrupted: a request that already
+    # started is left to finish, and its response is closed so the
+    # connection goes back to the pool.
+    if not future.cancel():
+        future.add_done_callback(_close_response)
+
+
+def _close_response(future: Future[_Sent]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result()[0].close()
+
+
+def __getattr__(name: str) -> Any:
+    # AsyncHttpClient imports httpx, so load it only when the async client is used.
+    if name == "AsyncHttpClient":
+        from .async_http import AsyncHttpClient
+
+        return AsyncHttpClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = (
+    "AsyncHttpClient",
+    "BaseHttpClient",
+    "CoalescerStats",
+    "HedgePolicy",
+    "HttpClient",
+    "LoggingPolicy",
+    "MetricsHook",
+    "MetricsRegistry",
+    "PoolConfig",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimiterStats",
+    "RequestCoalescer",
+    "RequestContext",
+    "RequestHooks",
+    "RequestOptions",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryStats",
+    "render_prometheus",
+)
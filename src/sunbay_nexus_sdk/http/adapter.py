@@ -0,0 +1,301 @@
+"""
+requests transport adapter used by HttpClient.
+
+SunbayHTTPAdapter behaves like requests' HTTPAdapter and adds:
+
+- PoolConfig: blocking checkout, idle connection TTL, TCP keepalive and
+  socket options for every new connection
+- ``warm_up``: open pooled connections (TCP + TLS) ahead of the first call
+- optional metrics: connection pool checkouts, returns and connect times are
+  reported to a MetricsHook
+- fork safety: in a child process (gunicorn prefork, multiprocessing) the
+  inherited pools are dropped and rebuilt before the first request, so parent
+  and child never share a socket
+
+The per-pool wrapper is only installed when metrics or an idle TTL need it,
+so the default checkout path stays urllib3's own.
+"""
+
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+from requests import Request
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolManager
+
+from .metrics import MetricsHook
+from .pool import PoolConfig
+
+# Connect time of the last connection opened on this thread. urllib3 opens
+# connections on the calling thread, so HttpClient can pick it up right after
+# the attempt that triggered it.
+_local = threading.local()
+
+# Upper bound of threads opening connections in parallel during warm_up.
+_WARM_UP_THREADS = 16
+
+# Serializes pool rebuilds after fork. It is replaced in the child, because a
+# lock held by another parent thread at fork time would never be released.
+_fork_lock = threading.Lock()
+
+
+def _reinit_fork_lock() -> None:
+    global _fork_lock
+    _fork_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_fork_lock)
+
+# Pool managers inherited from the parent, kept alive in the child. Closing
+# or collecting them takes locks (pool queues, response buffers) that parent
+# threads may have held at fork time and would deadlock.
+_inherited: List[Any] = []
+
+
+def consume_connect_time() -> Optional[float]:
+    """
+    Return and clear the connect time recorded on this thread, if any.
+    """
+    value = getattr(_local, "connect", None)
+    _local.connect = None
+    return value
+
+
+def set_connect_time(value: Optional[float]) -> None:
+    """
+    Record ``value`` as this thread's connect time, for an attempt that was
+    sent from another thread (hedged requests).
+    """
+    _local.connect = value
+
+
+def _close_inherited(conn: Any) -> None:
+    # Only the descriptor is closed: conn.close() would also close a response
+    # a parent thread was reading at fork time, and block on its buffer lock.
+    # socket.close() is not enough either, it is deferred while that response
+    # still holds a makefile() reference.
+    sock = getattr(conn, "sock", None)
+    if sock is not None:
+        try:
+            os.close(sock.detach())
+        except OSError:
+            pass
+
+
+class _PoolWrapper:
+    """
+    Wraps the checkout/return/new-connection methods of one urllib3 pool.
+    """
+
+    def __init__(self, pool: Any, metrics: Optional[MetricsHook], idle_ttl: Optional[float]) -> None:
+        self._pool = pool
+        self._metrics = metrics
+        self._idle_ttl = idle_ttl
+        self._label = f"{pool.scheme}://{pool.host}:{pool.port}"
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._get_conn = pool._get_conn
+        self._put_conn = pool._put_conn
+        self._new_conn = pool._new_conn
+        pool._get_conn = self.get_conn
+        pool._put_conn = self.put_conn
+        if metrics is not None:
+            pool._new_conn = self.new_conn
+
+    @property
+    def max_size(self) -> int:
+        queue = self._pool.pool
+        return getattr(queue, "maxsize", 0) if queue is not None else 0
+
+    def get_conn(self, timeout: Optional[float] = None) -> Any:
+        started = time.monotonic()
+        conn = self._get_conn(timeout=timeout)
+        if self._idle_ttl is not None and conn is not None:
+            idle_since = getattr(conn, "_sunbay_idle_since", None)
+            if idle_since is not None and started - idle_since > self._idle_ttl:
+                # urllib3 reconnects closed connections on the next request.
+                conn.close()
+        if self._metrics is not None:
+            wait = time.monotonic() - started
+            with self._lock:
+                self._in_use += 1
+                in_use = self._in_use
+            self._metrics.record_pool_checkout(self._label, wait, in_use, self.max_size)
+        return conn
+
+    def put_conn(self, conn: Any) -> None:
+        if self._idle_ttl is not None and conn is not None:
+            conn._sunbay_idle_since = time.monotonic()
+        self._put_conn(conn)
+        if self._metrics is not None:
+            with self._lock:
+                self._in_use = max(0, self._in_use - 1)
+                in_use = self._in_use
+            self._metrics.record_pool_release(self._label, in_use, self.max_size)
+
+    def new_conn(self) -> Any:
+        conn = self._new_conn()
+        connect = conn.connect
+
+        def timed_connect() -> None:
+            started = time.monotonic()
+            try:
+                connect()
+            finally:
+                _local.connect = time.monotonic() - started
+
+        conn.connect = timed_connect
+        return conn
+
+
+class _SunbayPoolManager(PoolManager):
+    def __init__(
+        self, *args: Any, metrics: Optional[MetricsHook], idle_ttl: Optional[float], **kwargs: Any
+    ) -> None:
+        self._metrics = metrics
+        self._idle_ttl = idle_ttl
+        # Every connection opened through this manager, including checked-out
+        # ones, so a forked child can close all inherited sockets.
+        self.connections: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        super().__init__(*args, **kwargs)
+
+    def _new_pool(self, scheme: str, host: str, port: int, request_context: Any = None) -> Any:
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        new_conn = pool._new_conn
+
+        def tracked_new_conn() -> Any:
+            conn = new_conn()
+            self.connections.add(conn)
+            return conn
+
+        pool._new_conn = tracked_new_conn
+        if self._metrics is not None or self._idle_ttl is not None:
+            _PoolWrapper(pool, self._metrics, self._idle_ttl)
+        return pool
+
+
+class SunbayHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter configured from a PoolConfig, optionally reporting to ``metrics``.
+    """
+
+    def __init__(
+        self,
+        pool_config: Optional[PoolConfig] = None,
+        metrics: Optional[MetricsHook] = None,
+        pool_maxsize: int = 10,
+    ) -> None:
+        self._pool_config = pool_config or PoolConfig()
+        self._metrics = metrics
+        super().__init__(
+            pool_connections=self._pool_config.num_pools,
+            pool_maxsize=pool_maxsize,
+            pool_block=self._pool_config.block,
+        )
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        pool_kwargs.setdefault("socket_options", self._pool_config.build_socket_options())
+        self.poolmanager = _SunbayPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            metrics=self._metrics,
+            idle_ttl=self._pool_config.idle_ttl,
+            **pool_kwargs,
+        )
+        self._pid = os.getpid()
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            with _fork_lock:
+                if self._pid != os.getpid():
+                    self._reset_after_fork()
+
+    def _reset_after_fork(self) -> None:
+        # Inherited connections are shared with the parent. Build fresh pools,
+        # then close this process' copies of the old sockets, including those
+        # checked out by parent threads at fork time: close() without
+        # shutdown() leaves the parent's side of each connection intact.
+        inherited = [self.poolmanager, *self.proxy_manager.values()]
+        self.proxy_manager = {}
+        self.init_poolmanager(self._pool_connections, self._pool_maxsize, block=self._pool_block)
+        for manager in inherited:
+            for conn in list(getattr(manager, "connections", ())):
+                _close_inherited(conn)
+        _inherited.extend(inherited)
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        self._check_fork()
+        return super().send(request, *args, **kwargs)
+
+    def close(self) -> None:
+        manager = self.poolmanager
+        super().close()
+        # urllib3 2 closes the connections of cleared pools only when the
+        # pools are garbage collected; close them now.
+        for conn in list(getattr(manager, "connections", ())):
+            conn.close()
+
+    def warm_up(
+        self, url: str, connections: int, timeout: float, logger: logging.Logger, verify: Any = True
+    ) -> int:
+        """
+        Open up to ``connections`` connections to ``url``'s host and leave them
+        in the pool. Returns how many were opened.
+
+        ``verify`` must match what requests will use for the calls, because
+        it is part of the key of the urllib3 pool the connections go to.
+        """
+        self._check_fork()
+        if hasattr(self, "get_connection_with_tls_context"):
+            # requests >= 2.32 keys pools by TLS settings as well as host.
+            request = Request("GET", url).prepare()
+            pool = self.get_connection_with_tls_context(request, verify)
+        else:
+            pool = self.get_connection(url)
+        count = max(0, min(connections, self._pool_maxsize))
+        if count == 0:
+            return 0
+
+        def open_one(_: int) -> Tuple[Any, bool]:
+            try:
+                conn = pool._get_conn(timeout=timeout)
+            except Exception as exc:
+                logger.warning("Warm-up checkout for %s failed: %s", url, exc)
+                return None, False
+            try:
+                if getattr(conn, "sock", None) is None:
+                    conn.timeout = timeout
+                    conn.connect()
+                return conn, True
+            except Exception as exc:
+                logger.warning("Warm-up connection to %s failed: %s", url, exc)
+                conn.close()
+                return None, True
+
+        with ThreadPoolExecutor(max_workers=min(count, _WARM_UP_THREADS)) as executor:
+            outcomes: List[Tuple[Any, bool]] = list(executor.map(open_one, range(count)))
+        # Connections are returned only after all were opened, otherwise the
+        # workers would keep reusing the first one.
+        opened = 0
+        for conn, checked_out in outcomes:
+            if checked_out:
+                pool._put_conn(conn)
+                opened += conn is not None
+        return opened
+
+    def __setstate__(self, state: Any) -> None:
+        # The pool config and hook are not pickled; HTTPAdapter.__setstate__
+        # calls init_poolmanager, so give the restored adapter defaults.
+        self._pool_config = PoolConfig()
+        self._metrics = None
+        super().__setstate__(state)
@@ -0,0 +1,275 @@
+"""
+Asyncio HTTP client for Sunbay Nexus SDK.
+
+Built on httpx, which is an optional dependency installed via
+``pip install sunbay-nexus-sdk[async]``. Serialization, headers and response
+parsing are shared with the synchronous HttpClient through BaseHttpClient.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Type, Union
+
+from .. import constants
+from ..exceptions import SunbayError, SunbayNetworkError
+from ..serialization import JsonCodec
+from .base import BaseHttpClient, T
+from .options import RequestOptions
+from .circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry
+from .hooks import RequestContext, RequestHooks
+from .logging_policy import CallLog, LoggingPolicy
+from .metrics import MetricsHook
+from .pool import PoolConfig
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, RetryStats
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on installed extras
+    httpx = None  # type: ignore[assignment]
+
+
+class _AttemptTrace:
+    """
+    httpcore trace callback that measures connect time and time to first byte.
+    """
+
+    __slots__ = ("started", "connect_started", "connect", "ttfb")
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.connect_started: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        if event_name == "connection.connect_tcp.started":
+            self.connect_started = now
+        elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            if self.connect_started is not None:
+                self.connect = now - self.connect_started
+        elif event_name.endswith(".receive_response_headers.complete"):
+            self.ttfb = now - self.started
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    Low-level asyncio HTTP client used by AsyncNexusClient.
+
+    A single httpx.AsyncClient holds the connection pool, so one event loop can
+    keep many requests in flight while sharing at most ``max_connections``
+    sockets.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        connect_timeout: float,
+        read_timeout: float,
+        max_retries: int,
+        max_connections: int,
+        logger: Optional[logging.Logger] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[None, CircuitBreakerConfig, CircuitBreakerRegistry] = None,
+        logging_policy: Optional[LoggingPolicy] = None,
+        metrics: Optional[MetricsHook] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_config: Optional[PoolConfig] = None,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                "AsyncNexusClient requires httpx. Install it with: pip install sunbay-nexus-sdk[async]"
+            )
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=max_retries,
+            logger=logger,
+            json_codec=json_codec,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            logging_policy=logging_policy,
+            metrics=metrics,
+            hooks=hooks,
+            rate_limiter=rate_limiter,
+        )
+
+        pool_config = pool_config or PoolConfig()
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=pool_config.idle_ttl if pool_config.idle_ttl is not None else 5.0,
+        )
+        self._max_connections = max_connections
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=limits, socket_options=pool_config.build_socket_options()),
+            # The pool timeout bounds how long a request waits for a free
+            # connection; it shares the connect budget like requests does.
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout, pool=connect_timeout),
+        )
+
+    async def warm_up(self, connections: int = 1) -> int:
+        """
+        Open up to ``connections`` pooled connections to the API host.
+
+        httpx has no API to open idle connections, so this sends concurrent
+        ``HEAD`` requests to the base URL; any HTTP response counts as an
+        opened connection. Returns how many were opened.
+
+        Raises:
+            SunbayNetworkError: when no connection could be opened.
+        """
+        count = max(0, min(connections, self._max_connections))
+        if count == 0:
+            return 0
+        results = await asyncio.gather(
+            *(self._client.head(self._base_url) for _ in range(count)), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for error in errors[:1]:
+            self._logger.warning("Warm-up connection to %s failed: %s", self._base_url, error)
+        opened = count - len(errors)
+        if opened == 0:
+            raise SunbayNetworkError(
+                f"Could not open any connection to {self._base_url}", retryable=True, cause=errors[0]
+            )
+        self._logger.debug("Warmed up %d connection(s) to %s", opened, self._base_url)
+        return opened
+
+    async def post(
+        self,
+        path: str,
+        request_body: Any,
+        response_type: Type[T],
+        options: Optional[RequestOptions] = None,
+    ) -> T:
+        url = f"{self._base_url}{path}"
+        json_body = self._serialize_request_body(request_body)
+        headers = self._build_headers(is_post=True, options=options)
+        context = self._new_context("POST", path, url, headers, self._merchant_id_of(request_body))
+
+        call_log = self._start_call_log("POST", path, url, headers, json_body)
+
+        return await self._execute(
+            context,
+            response_type,
+            options,
+            call_log,
+            lambda extensions: self._client.post(url, headers=headers, content=json_body, extensions=extensions),
+        )
+
+    async def get(
+        self,
+        path: str,
+        request_obj: Any,
+        response_type: Type[T],
+        options: Optional[RequestOptions] = None,
+    ) -> T:
+        url = f"{self._base_url}{path}"
+        params = self._build_query_params(request_obj)
+        headers = self._build_headers(is_post=False, options=options)
+        context = self._new_context("GET", path, url, headers, self._merchant_id_of(request_obj))
+
+        call_log = self._start_call_log("GET", path, url, headers, params)
+
+        return await self._execute(
+            context,
+            response_type,
+            options,
+            call_log,
+            lambda extensions: self._client.get(url, headers=headers, params=params, extensions=extensions),
+        )
+
+    async def _execute(
+        self,
+        context: RequestContext,
+        response_type: Type[T],
+        options: Optional[RequestOptions],
+        call_log: Optional[CallLog],
+        send: Callable[[Optional[Dict[str, Any]]], Awaitable["httpx.Response"]],
+    ) -> T:
+        try:
+            return await self._execute_with_retries(context, response_type, options, call_log, send)
+        except SunbayError as exc:
+            if call_log is not None:
+                call_log.failure(self._logger, exc)
+            raise
+
+    async def _execute_with_retries(
+        self,
+        context: RequestContext,
+        response_type: Type[T],
+        options: Optional[RequestOptions],
+        call_log: Optional[CallLog],
+        send: Callable[[Optional[Dict[str, Any]]], Awaitable["httpx.Response"]],
+    ) -> T:
+        method, path, url = context.method, context.path, context.url
+        policy = self._retry_policy_for(options)
+        policy.record_call()
+        stats = RetryStats()
+
+        while True:
+            stats.attempts += 1
+            rate_wait = self._reserve_rate(context, stats)
+            if rate_wait > 0:
+                await asyncio.sleep(rate_wait)
+            breaker = self._acquire_circuit(context, stats)
+            self._before_send(context, stats)
+            started = time.monotonic()
+            # Connect and TTFB timings come from httpcore trace events, which
+            # are only requested when metrics are enabled.
+            trace = _AttemptTrace() if self._metrics is not None else None
+            try:
+                response = await send({"trace": trace} if trace is not None else None)
+            except httpx.HTTPError as exc:
+                self._record_circuit(breaker, None, started)
+                context.status, context.error = None, exc
+                if trace is not None:
+                    self._record_attempt(path, method, None, started, connect=trace.connect, error=exc)
+                delay = policy.next_delay(method, stats, exc=exc)
+                if delay is None:
+                    raise self._network_error(
+                        context, exc, timeout=isinstance(exc, httpx.TimeoutException), stats=stats
+                    ) from exc
+                self._on_retry(context, stats, policy, exc, delay)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            status = response.status_code
+            self._record_circuit(breaker, status, started)
+            self._record_rate(context, status, response.headers.get(constants.HEADER_RETRY_AFTER))
+            context.status, context.error = status, None
+            if trace is not None:
+                self._record_attempt(path, method, status, started, ttfb=trace.ttfb, connect=trace.connect)
+            if status in policy.retry_on_status:
+                delay = policy.next_delay(
+                    method,
+                    stats,
+                    status=status,
+                    retry_after=response.headers.get(constants.HEADER_RETRY_AFTER),
+                )
+                if delay is not None:
+                    self._on_retry(context, stats, policy, f"HTTP {status}", delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+            return self._process_response(context, status, response.content, response_type, stats, call_log)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying httpx.AsyncClient and release pooled connections.
+        """
+        await self._client.aclose()
@@ -0,0 +1,401 @@
+"""
+Transport-independent HTTP logic shared by the sync and async clients.
+
+Header building, request serialization and response parsing do not depend on
+the underlying HTTP library, so both HttpClient (requests) and AsyncHttpClient
+(httpx) inherit them from BaseHttpClient and only implement the I/O.
+"""
+
+from __future__ import annotations
+
+import logging
+import platform
+import sys
+import time
+from dataclasses import is_dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence, Type, TypeVar, Union
+
+from .. import constants
+from .._version import __version__
+from ..exceptions import (
+    SunbayBusinessError,
+    SunbayCircuitOpenError,
+    SunbayError,
+    SunbayNetworkError,
+    SunbayRateLimitedError,
+)
+from ..models.base import BaseResponse
+from ..serialization import JsonCodec, decode_response, get_json_codec, to_query_params
+from ..utils.id_generator import generate_request_id
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerRegistry, CircuitBreakerSnapshot
+from .hooks import RequestContext, RequestHooks
+from .logging_policy import CallLog, LoggingPolicy, new_call_log
+from .metrics import AttemptTiming, MetricsHook
+from .options import RequestOptions
+from .rate_limit import RateLimiter
+from .retry import RetryBudget, RetryPolicy, RetryStats
+
+T = TypeVar("T", bound=BaseResponse)
+
+# Characters of an HTTP error body kept in the SunbayNetworkError message.
+# Fixed: the logging policy only changes what is logged.
+_ERROR_BODY_LENGTH = 2048
+
+
+class BaseHttpClient:
+    """
+    Common state and helpers for Sunbay Nexus HTTP clients.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        connect_timeout: float,
+        read_timeout: float,
+        max_retries: int,
+        logger: Optional[logging.Logger] = None,
+        json_codec: Union[None, str, JsonCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[None, CircuitBreakerConfig, CircuitBreakerRegistry] = None,
+        logging_policy: Optional[LoggingPolicy] = None,
+        metrics: Optional[MetricsHook] = None,
+        hooks: Optional[Sequence[RequestHooks]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self._api_key = api_key
+        self._base_url = base_url.rstrip("/")
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._max_retries = max_retries
+        # Logger follows mainstream SDK practice:
+        # - use standard logging
+        # - do not configure handlers or levels here
+        # - let application decide how to handle output
+        self._logger = logger or logging.getLogger("sunbay_nexus_sdk.http")
+        # Redaction of the API key and card holder data is always on unless
+        # the application passes a policy that turns it off.
+        self._logging_policy = logging_policy or LoggingPolicy()
+        self._json_codec = get_json_codec(json_codec)
+        # Without an explicit policy, keep the historical behaviour of retrying
+        # GET requests up to max_retries attempts, now with jittered backoff,
+        # transient HTTP statuses and a retry budget.
+        self._retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries, budget=RetryBudget())
+        if isinstance(circuit_breaker, CircuitBreakerConfig):
+            circuit_breaker = CircuitBreakerRegistry(circuit_breaker, self._logger)
+        self._circuit_breakers = circuit_breaker
+        self._metrics = metrics
+        self._hooks = tuple(hooks or ())
+        self._rate_limiter = rate_limiter
+
+    @property
+    def metrics(self) -> Optional[MetricsHook]:
+        """
+        The metrics hook passed at construction, or None when metrics are disabled.
+        """
+        return self._metrics
+
+    def circuit_breaker_states(self) -> Dict[str, CircuitBreakerSnapshot]:
+        """
+        Return circuit breaker snapshots keyed by API path (empty when disabled).
+        """
+        if self._circuit_breakers is None:
+            return {}
+        return self._circuit_breakers.snapshots()
+
+    def _acquire_circuit(self, context: RequestContext, stats: RetryStats) -> Optional[CircuitBreaker]:
+        if self._circuit_breakers is None:
+            return None
+        breaker = self._circuit_breakers.get(context.path)
+        try:
+            breaker.acquire()
+        except SunbayCircuitOpenError as exc:
+            self._logger.warning("Circuit open %s, failing fast (retry after %.1fs)", context.path, exc.retry_after)
+            self._fail(context, exc, stats)
+            raise
+        return breaker
+
+    @staticmethod
+    def _record_circuit(breaker: Optional[CircuitBreaker], status: Optional[int], started: float) -> None:
+        # Transport errors (status None), throttling and 5xx count as failures.
+        if breaker is not None:
+            failed = (
+                status is None
+                or status == constants.HTTP_STATUS_TOO_MANY_REQUESTS
+                or status >= constants.HTTP_STATUS_SERVER_ERROR_START
+            )
+            breaker.record(not failed, time.monotonic() - started)
+
+    def _retry_policy_for(self, options: Optional[RequestOptions]) -> RetryPolicy:
+        if options is not None and options.retry_policy is not None:
+            return options.retry_policy
+        return self._retry_policy
+
+    def _new_context(
+        self, method: str, path: str, url: str, headers: Dict[str, str], merchant_id: Optional[str] = None
+    ) -> RequestContext:
+        return RequestContext(
+            method=method,
+            path=path,
+            url=url,
+            headers=headers,
+            request_id=headers.get(constants.HEADER_REQUEST_ID),
+            merchant_id=merchant_id,
+        )
+
+    def _reserve_rate(self, context: RequestContext, stats: RetryStats) -> float:
+        # Seconds to wait before the attempt; every attempt takes its own token.
+        if self._rate_limiter is None:
+            return 0.0
+        try:
+            return self._rate_limiter.reserve(self._api_key, context.merchant_id, context.path)
+        except SunbayRateLimitedError as exc:
+            self._logger.warning("Rate limit exceeded %s (%s), failing fast", context.path, exc.scope)
+            self._fail(context, exc, stats)
+            raise
+
+    def _record_rate(self, context: RequestContext, status: Optional[int], retry_after: Optional[str]) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.record_response(self._api_key, context.merchant_id, context.path, status, retry_after)
+
+    def _fire(self, event: str, context: RequestContext, *args: Any) -> None:
+        for hook in self._hooks:
+            try:
+                getattr(hook, event)(context, *args)
+            except Exception:
+                # Instrumentation must never break the API call itself.
+                self._logger.exception("Request hook %s.%s failed", type(hook).__name__, event)
+
+    def _before_send(self, context: RequestContext, stats: RetryStats) -> None:
+        context.attempt = stats.attempts
+        if self._hooks:
+            self._fire("before_send", context)
+            context.request_id = context.headers.get(constants.HEADER_REQUEST_ID)
+
+    def _complete(self, context: RequestContext, obj: T, stats: RetryStats) -> T:
+        context.elapsed = time.monotonic() - context.started
+        context.response = obj
+        context.trace_id = obj.trace_id
+        obj.retry_stats = stats
+        obj.client_request_id = context.request_id
+        obj.elapsed = context.elapsed
+        if self._hooks:
+            self._fire("after_receive", context)
+        return obj
+
+    def _fail(self, context: RequestContext, error: SunbayError, stats: Optional[RetryStats]) -> SunbayError:
+        context.elapsed = time.monotonic() - context.started
+        context.error = error
+        context.trace_id = getattr(error, "trace_id", None)
+        error.retry_stats = stats
+        error.client_request_id = context.request_id
+        error.elapsed = context.elapsed
+        if self._hooks:
+            self._fire("on_error", context)
+        return error
+
+    def _record_attempt(
+        self,
+        path: str,
+        method: str,
+        status: Optional[int],
+        started: float,
+        *,
+        ttfb: Optional[float] = None,
+        connect: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if self._metrics is not None:
+            timing = AttemptTiming(connect=connect, ttfb=ttfb, total=time.monotonic() - started)
+            self._metrics.record_attempt(path, method, status, timing, error)
+
+    def _on_retry(
+        self,
+        context: RequestContext,
+        stats: RetryStats,
+        policy: RetryPolicy,
+        reason: Any,
+        delay: float,
+    ) -> None:
+        if self._metrics is not None:
+            self._metrics.record_retry(context.path, context.method)
+        if self._hooks:
+            self._fire("on_retry", context, delay)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Request failed %s %s (attempt %s/%s): %s, will retry in %.3fs",
+                context.method,
+                context.url,
+                stats.attempts,
+                policy.max_attempts,
+                reason,
+                delay,
+            )
+
+    def _network_error(
+        self,
+        context: RequestContext,
+        exc: BaseException,
+        *,
+        timeout: bool,
+        stats: RetryStats,
+    ) -> SunbayError:
+        method, url = context.method, context.url
+        if timeout:
+            self._logger.warning("Request timeout %s %s after %s attempts", method, url, stats.attempts)
+            error = SunbayNetworkError("Request timeout", retryable=True, cause=exc)
+        else:
+            self._logger.warning("Network error %s %s after %s attempts: %s", method, url, stats.attempts, exc)
+            error = SunbayNetworkError(f"Network error: {exc}", retryable=True, cause=exc)
+        return self._fail(context, error, stats)
+
+    def _serialize_request_body(self, request_body: Any) -> bytes:
+        if not (is_dataclass(request_body) or isinstance(request_body, dict)):
+            raise SunbayBusinessError("Request body must be a dataclass instance or dict")
+
+        # Python-style field names (snake_case) are written as API-style
+        # (camelCase) keys, aligning with Java SDK behaviour and backend
+        # expectations. The per-type plan is compiled once and cached.
+        return self._json_codec.encode_request(request_body)
+
+    @staticmethod
+    def _merchant_id_of(request: Any) -> Optional[str]:
+        if isinstance(request, dict):
+            return request.get("merchant_id") or request.get("merchantId")
+        return getattr(request, "merchant_id", None)
+
+    @staticmethod
+    def _build_query_params(request_obj: Any) -> Dict[str, Any]:
+        if request_obj is None:
+            return {}
+        if not (is_dataclass(request_obj) or isinstance(request_obj, dict)):
+            raise SunbayBusinessError("Request object for GET must be a dataclass instance or dict")
+        return to_query_params(request_obj)
+
+    def _start_call_log(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        headers: Dict[str, str],
+        payload: Union[None, bytes, Mapping[str, Any]],
+    ) -> Optional[CallLog]:
+        # Returns None for calls that are not logged, so the hot path pays
+        # nothing beyond a level check and a sampling decision.
+        return new_call_log(self._logger, self._logging_policy, method, path, url, headers, payload)
+
+    def _build_headers(self, *, is_post: bool, options: Optional[RequestOptions] = None) -> Dict[str, str]:
+        # Build User-Agent following mainstream SDK practice (e.g., AWS Boto3, Stripe)
+        # Format: SDKName/Version Python/PythonVersion OS/OSVersion
+        python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        os_name = platform.system()
+        os_version = platform.release()
+        user_agent = f"SunbayNexusSDK-Python/{__version__} Python/{python_version} {os_name}/{os_version}"
+
+        request_id = options.request_id if options is not None and options.request_id else generate_request_id()
+        headers: Dict[str, str] = dict(options.headers) if options is not None and options.headers else {}
+        headers.update(
+            {
+                constants.HEADER_AUTHORIZATION: f"{constants.AUTHORIZATION_BEARER_PREFIX}{self._api_key}",
+                constants.HEADER_REQUEST_ID: request_id,
+                constants.HEADER_TIMESTAMP: str(int(time.time() * 1000)),
+                constants.HEADER_USER_AGENT: user_agent,
+            }
+        )
+        if is_post:
+            headers[constants.HEADER_CONTENT_TYPE] = constants.CONTENT_TYPE_JSON
+        return headers
+
+    def _parse_response_body(self, body: Optional[bytes], response_type: Type[T]) -> T:
+        if body is None or not body.strip():
+            raise SunbayNetworkError("Empty response body", retryable=False)
+
+        try:
+            root = self._json_codec.loads(body)
+        except ValueError as exc:
+            raise SunbayNetworkError("Failed to parse response body as JSON", retryable=False, cause=exc) from exc
+        if not isinstance(root, dict):
+            raise SunbayNetworkError("Response body is not a JSON object", retryable=False)
+
+        if not (isinstance(response_type, type) and issubclass(response_type, BaseResponse)):
+            raise SunbayNetworkError("Response type is not a subclass of BaseResponse", retryable=False)
+
+        # The decoder for each response type is compiled once from its dataclass
+        # fields: camelCase keys map straight to fields, nested amounts become
+        # objects, string amounts become int and unknown fields are ignored.
+        return decode_response(root, response_type)
+
+    def _process_response(
+        self,
+        context: RequestContext,
+        status: int,
+        body: Optional[bytes],
+        response_type: Type[T],
+        retry_stats: RetryStats,
+        call_log: Optional[CallLog] = None,
+    ) -> T:
+        context.status = status
+        try:
+            obj = self._check_response(context.method, context.url, status, body, response_type, call_log)
+        except SunbayError as exc:
+            if self._metrics is not None and isinstance(exc, SunbayBusinessError):
+                self._metrics.record_business_code(context.path, context.method, exc.code)
+            self._fail(context, exc, retry_stats)
+            raise
+        if self._metrics is not None:
+            self._metrics.record_business_code(context.path, context.method, obj.code)
+        return self._complete(context, obj, retry_stats)
+
+    def _check_response(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        body: Optional[bytes],
+        response_type: Type[T],
+        call_log: Optional[CallLog] = None,
+    ) -> T:
+        if call_log is not None:
+            call_log.response(self._logger, status, body)
+
+        if constants.HTTP_STATUS_OK_START <= status < constants.HTTP_STATUS_OK_END:
+            obj = self._parse_response_body(body, response_type)
+            if not obj.is_success():
+                self._logger.error(
+                    "API error %s %s - code: %s, msg: %s, trace_id: %s",
+                    method,
+                    url,
+                    obj.code,
+                    obj.msg,
+                    obj.trace_id,
+                )
+                raise SunbayBusinessError(obj.msg or "API error", code=obj.code, trace_id=obj.trace_id)
+            return obj
+
+        message_parts = [f"HTTP {status}"]
+        if constants.HTTP_STATUS_CLIENT_ERROR_START <= status < constants.HTTP_STATUS_CLIENT_ERROR_END:
+            message_parts.append("(Client Error)")
+        elif status >= constants.HTTP_STATUS_SERVER_ERROR_START:
+            message_parts.append("(Server Error)")
+        reason = " ".join(message_parts)
+        message = f"{reason} - {_error_body(body)}" if body else reason
+
+        self._logger.error(
+            "HTTP error %s %s - Status: %s, Message: %s",
+            method,
+            url,
+            status,
+            f"{reason} - {self._logging_policy.format_body(body)}" if body else reason,
+        )
+        raise SunbayNetworkError(
+            message,
+            retryable=status in constants.RETRYABLE_HTTP_STATUSES,
+            status_code=status,
+        )
+
+
+def _error_body(body: bytes) -> str:
+    text = body.decode("utf-8", errors="replace")
+    if len(text) > _ERROR_BODY_LENGTH:
+        text = f"{text[:_ERROR_BODY_LENGTH]}...({len(text) - _ERROR_BODY_LENGTH} more chars)"
+    return text
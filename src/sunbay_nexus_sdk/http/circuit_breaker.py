@@ -0,0 +1,222 @@
+"""
+Per-endpoint circuit breaker for Sunbay Nexus HTTP clients.
+
+Each API path gets its own breaker with the usual three states:
+
+- CLOSED: calls pass through; outcomes are recorded in a sliding window.
+- OPEN: calls fail fast with SunbayCircuitOpenError until ``open_duration`` elapses.
+- HALF_OPEN: a limited number of probe calls are let through; if they all
+  succeed the breaker closes, otherwise it opens again.
+
+A call counts as failed when it raised a transport error (timeout, connection
+error) or returned HTTP 429/5xx. Business errors (``code != "0"``) mean the
+backend is healthy and count as successes. Calls slower than
+``slow_call_duration`` count towards the slow-call rate.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Dict, Optional, Tuple
+
+from ..exceptions import SunbayCircuitOpenError
+from .forks import reset_lock_after_fork
+
+
+class CircuitState(str, Enum):
+    """
+    Circuit breaker state.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """
+    Circuit breaker thresholds, applied to every API path independently.
+
+    failure_rate_threshold: Open when the failed-call ratio in the window reaches this value.
+    slow_call_rate_threshold: Open when the slow-call ratio reaches this value (1.0 = only if all are slow).
+    slow_call_duration: Calls taking longer than this many seconds are slow.
+    window_size: Number of most recent calls considered.
+    minimum_calls: Calls required in the window before rates are evaluated.
+    open_duration: Seconds to stay open before allowing probe calls.
+    half_open_max_calls: Probe calls allowed (and required to succeed) in half-open state.
+    """
+
+    failure_rate_threshold: float = 0.5
+    slow_call_rate_threshold: float = 1.0
+    slow_call_duration: float = 10.0
+    window_size: int = 50
+    minimum_calls: int = 20
+    open_duration: float = 30.0
+    half_open_max_calls: int = 3
+
+
+@dataclass
+class CircuitBreakerSnapshot:
+    """
+    Point-in-time view of one breaker, for health checks and load balancers.
+    """
+
+    path: str
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    # Seconds until an open breaker lets probe calls through (0 when not open).
+    retry_after: float
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one API path.
+    """
+
+    def __init__(self, path: str, config: CircuitBreakerConfig, logger: Optional[logging.Logger] = None) -> None:
+        self.path = path
+        self._config = config
+        self._logger = logger or logging.getLogger("sunbay_nexus_sdk.http")
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+        self._state = CircuitState.CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque()
+        self._failures = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self._config.open_duration:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is self._state:
+            return
+        self._logger.warning("Circuit breaker %s: %s -> %s", self.path, self._state.value, state.value)
+        self._state = state
+        self._window.clear()
+        self._failures = 0
+        self._slow = 0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+
+    def acquire(self) -> None:
+        """
+        Ask permission for one call. Raises SunbayCircuitOpenError when rejected.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state is CircuitState.CLOSED:
+                return
+            if state is CircuitState.HALF_OPEN:
+                if self._probes_in_flight + self._probe_successes < self._config.half_open_max_calls:
+                    self._probes_in_flight += 1
+                    return
+            retry_after = max(0.0, self._config.open_duration - (now - self._opened_at))
+        raise SunbayCircuitOpenError(self.path, retry_after=retry_after)
+
+    def record(self, success: bool, duration: float) -> None:
+        """
+        Record the outcome of a call previously allowed by acquire().
+        """
+        slow = duration >= self._config.slow_call_duration
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if not success or slow:
+                    self._transition(CircuitState.OPEN)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self._config.half_open_max_calls:
+                    self._transition(CircuitState.CLOSED)
+                return
+            if self._state is CircuitState.OPEN:
+                return
+
+            self._window.append((not success, slow))
+            self._failures += not success
+            self._slow += slow
+            if len(self._window) > self._config.window_size:
+                old_failed, old_slow = self._window.popleft()
+                self._failures -= old_failed
+                self._slow -= old_slow
+
+            calls = len(self._window)
+            if calls >= self._config.minimum_calls and (
+                self._failures / calls >= self._config.failure_rate_threshold
+                or self._slow / calls >= self._config.slow_call_rate_threshold
+            ):
+                self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """
+        Give back a permit for a call that was abandoned (e.g. cancelled) without an outcome.
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def snapshot(self) -> CircuitBreakerSnapshot:
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            calls = len(self._window)
+            retry_after = 0.0
+            if state is CircuitState.OPEN:
+                retry_after = max(0.0, self._config.open_duration - (now - self._opened_at))
+            return CircuitBreakerSnapshot(
+                path=self.path,
+                state=state,
+                calls=calls,
+                failure_rate=self._failures / calls if calls else 0.0,
+                slow_call_rate=self._slow / calls if calls else 0.0,
+                retry_after=retry_after,
+            )
+
+
+class CircuitBreakerRegistry:
+    """
+    Lazily creates one CircuitBreaker per API path.
+    """
+
+    def __init__(self, config: Optional[CircuitBreakerConfig] = None, logger: Optional[logging.Logger] = None) -> None:
+        self._config = config or CircuitBreakerConfig()
+        self._logger = logger
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+
+    def get(self, path: str) -> CircuitBreaker:
+        breaker = self._breakers.get(path)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(path)
+                if breaker is None:
+                    breaker = CircuitBreaker(path, self._config, self._logger)
+                    self._breakers[path] = breaker
+        return breaker
+
+    def snapshots(self) -> Dict[str, CircuitBreakerSnapshot]:
+        """
+        Snapshot of every breaker that has seen traffic, keyed by path.
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.path: breaker.snapshot() for breaker in breakers}
@@ -0,0 +1,116 @@
+"""
+Single-flight coalescing of identical read-only calls.
+
+During incidents many threads of one process ask the same question at the
+same moment (the same ``query``, ``batch_query`` for the same terminal).
+With a RequestCoalescer, HttpClient sends the first of these calls and
+makes the others wait for it: all of them get the same decoded response,
+or the same exception. Calls are identical when they share the API key,
+method, URL and normalized parameters. Calls with RequestOptions setting a
+request id, headers or a retry or hedge policy are never coalesced.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from .. import constants
+from ..exceptions import SunbayBusinessError, SunbayNetworkError
+from .forks import reset_lock_after_fork
+
+R = TypeVar("R")
+
+# POST endpoints that only read, and can be coalesced like GET calls.
+COALESCED_POST_PATHS = frozenset((constants.PATH_BATCH_QUERY,))
+
+
+@dataclass
+class CoalescerStats:
+    """
+    Counters of a RequestCoalescer: calls sent, calls that joined one in
+    flight instead, and joined calls that gave up waiting.
+    """
+
+    sent: int = 0
+    joined: int = 0
+    timeouts: int = 0
+
+
+class RequestCoalescer:
+    """
+    Groups identical concurrent calls into one network call. Safe to share
+    between threads and clients (the API key is part of the call identity).
+
+    Args:
+        wait_timeout: Seconds a joined call waits for the shared one before
+            raising a retryable SunbayNetworkError. None waits as long as the
+            shared call takes (bounded by its timeouts and retries).
+
+    Example:
+        client = NexusClient(api_key="sk_live_xxx", coalescer=RequestCoalescer(wait_timeout=10.0))
+    """
+
+    def __init__(self, wait_timeout: Optional[float] = None) -> None:
+        if wait_timeout is not None and wait_timeout <= 0:
+            raise SunbayBusinessError("wait_timeout must be positive")
+        self.wait_timeout = wait_timeout
+        self._flights: Dict[Hashable, "Future[Any]"] = {}
+        self._stats = CoalescerStats()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+
+    def run(self, key: Hashable, call: Callable[[], R]) -> R:
+        """
+        Return the result of ``call``, or of the identical call with the same
+        ``key`` already in flight.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # Calls in flight in the parent have no thread in a forked child.
+                self._flights = {}
+                self._pid = os.getpid()
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+                self._stats.sent += 1
+            else:
+                self._stats.joined += 1
+        assert flight is not None
+        if not leader:
+            return self._wait(flight)
+
+        try:
+            result = call()
+        except BaseException as exc:
+            self._finish(key)
+            flight.set_exception(exc)
+            raise
+        self._finish(key)
+        flight.set_result(result)
+        return result
+
+    def stats(self) -> CoalescerStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def _finish(self, key: Hashable) -> None:
+        # Calls starting from now on send a new request.
+        with self._lock:
+            self._flights.pop(key, None)
+
+    def _wait(self, flight: "Future[R]") -> R:
+        started = time.monotonic()
+        try:
+            return flight.result(self.wait_timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._stats.timeouts += 1
+            raise SunbayNetworkError(
+                f"Timed out after {time.monotonic() - started:.3f}s waiting for a coalesced call",
+                retryable=True,
+            ) from None
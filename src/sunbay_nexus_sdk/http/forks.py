@@ -0,0 +1,72 @@
+"""
+Lock handling across ``os.fork()``.
+
+A lock held by another thread at fork time stays locked forever in the child,
+because that thread does not exist there. Objects that may be shared between
+a parent and its children (retry budgets, circuit breakers, metrics) register
+here, and their ``_lock`` is replaced by a fresh one in every child process.
+An owner with an ``_after_fork()`` method also gets it called then, to drop
+state that belongs to the parent's threads.
+"""
+
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+_owners: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def reset_lock_after_fork(owner: Any) -> None:
+    """
+    Give ``owner._lock`` a new ``threading.Lock`` in child processes, then
+    call ``owner._after_fork()`` if it has one.
+    """
+    _owners.add(owner)
+
+
+class LazyThreadPool:
+    """
+    ThreadPoolExecutor started on first use. A forked child inherits the
+    executor but not its worker threads, so it starts a new one.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self.max_workers = max(int(max_workers), 1)
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+
+    def get(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self._thread_name_prefix
+                )
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads; the next ``get`` starts new ones.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _after_fork(self) -> None:
+        self._executor = None
+
+
+def _after_fork_in_child() -> None:
+    for owner in list(_owners):
+        owner._lock = threading.Lock()
+        after_fork = getattr(owner, "_after_fork", None)
+        if after_fork is not None:
+            after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
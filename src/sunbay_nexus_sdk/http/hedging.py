@@ -0,0 +1,110 @@
+"""
+Request hedging for idempotent GET calls.
+
+When a GET (e.g. ``query``) has not answered within the hedge delay,
+HttpClient sends the same request again on another pooled connection and
+uses whichever successful answer arrives first. The delay is fixed or
+follows a live percentile of recent latencies, so only the slow tail is
+hedged, and a token budget keeps the extra requests below a fraction of
+the hedgeable traffic.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+from ..exceptions import SunbayBusinessError
+from .forks import reset_lock_after_fork
+from .retry import RetryBudget
+
+# The percentile is recomputed after this many new latencies, not on every call.
+_RECOMPUTE_EVERY = 32
+
+
+class HedgePolicy:
+    """
+    When GET calls are hedged. Safe to share between threads and clients.
+
+    Args:
+        delay: Seconds without a response before the hedge is sent. Used as
+            is when ``percentile`` is None, otherwise until ``min_samples``
+            latencies have been seen.
+        percentile: Hedge calls slower than this percentile (0-100, exclusive)
+            of recent successful GET latencies.
+        min_samples: Latencies needed before the percentile replaces ``delay``.
+        window: Number of recent latencies the percentile is computed over.
+        max_extra_ratio: Hedges allowed as a fraction of hedgeable requests;
+            0.05 keeps the extra load under about 5%.
+        budget: Shared RetryBudget to draw hedges from, instead of a private
+            one built from ``max_extra_ratio``.
+
+    Example:
+        client = NexusClient(api_key="sk_live_xxx", hedge_policy=HedgePolicy(percentile=95.0))
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.5,
+        percentile: Optional[float] = 95.0,
+        min_samples: int = 50,
+        window: int = 1000,
+        max_extra_ratio: float = 0.05,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        if delay < 0:
+            raise SunbayBusinessError("delay must not be negative")
+        if percentile is not None and not 0 < percentile < 100:
+            raise SunbayBusinessError("percentile must be between 0 and 100")
+        if not 1 <= min_samples <= window:
+            raise SunbayBusinessError("min_samples must be between 1 and window")
+        if not 0 <= max_extra_ratio <= 1:
+            raise SunbayBusinessError("max_extra_ratio must be between 0 and 1")
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        # Bursts are capped at the hedges earned by about 100 requests, so a
+        # slow spell cannot spend more than a short run of quiet traffic saved.
+        self.budget = budget or RetryBudget(
+            ratio=max_extra_ratio, min_retries_per_second=0.0, max_tokens=max(1.0, 100 * max_extra_ratio)
+        )
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._since_update = 0
+        self._live_delay: Optional[float] = None
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+
+    @property
+    def current_delay(self) -> float:
+        """
+        Seconds the next call waits before it is hedged.
+        """
+        live = self._live_delay
+        return self.delay if live is None else live
+
+    def record_latency(self, latency: float) -> None:
+        """
+        Feed the latency of one successful request into the percentile.
+        """
+        if self.percentile is None:
+            return
+        with self._lock:
+            self._latencies.append(latency)
+            self._since_update += 1
+            if self._since_update < _RECOMPUTE_EVERY or len(self._latencies) < self.min_samples:
+                return
+            ordered = sorted(self._latencies)
+            self._since_update = 0
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100.0))
+        self._live_delay = ordered[index]
+
+    def record_request(self) -> None:
+        """
+        Record one hedgeable request against the hedge budget.
+        """
+        self.budget.deposit()
+
+    def try_hedge(self) -> bool:
+        """
+        Take a hedge from the budget. Returns False when it is exhausted.
+        """
+        return self.budget.try_withdraw()
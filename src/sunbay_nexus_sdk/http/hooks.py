@@ -0,0 +1,87 @@
+"""
+Request lifecycle hooks for Sunbay Nexus HTTP clients.
+
+Hooks receive a RequestContext that lives for one API call (all attempts).
+Typical uses are propagating trace context into headers, opening and
+closing tracing spans, and correlating the client request id with the
+server ``traceId``.
+
+Lifecycle of one call::
+
+    before_send -> [on_retry -> before_send]* -> after_receive | on_error
+
+Exactly one of ``after_receive`` (the call returned a response) or
+``on_error`` (the call raised) runs per call. Exceptions raised by hooks are
+logged and swallowed so that instrumentation never breaks a payment call.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class RequestContext:
+    """
+    State of one API call, shared by every hook invocation for that call.
+
+    method: HTTP method.
+    path: API path, e.g. ``/v1/semi-integration/transaction/sale``.
+    url: Full request URL.
+    headers: Outgoing headers. ``before_send`` may add or change entries
+        (e.g. ``traceparent``); changes apply to the next attempt.
+    request_id: Value of the ``X-Client-Request-Id`` header.
+    started: ``time.monotonic()`` when the call started.
+    attempt: 1-based number of the attempt being sent or just finished.
+    status: HTTP status of the last attempt (None for transport errors).
+    error: Error of the last failed attempt, or the error the call raises.
+    response: Parsed response (set before ``after_receive``).
+    trace_id: Server ``traceId`` when the backend returned one.
+    merchant_id: ``merchant_id`` of the request, when it has one.
+    elapsed: Total call duration in seconds, including retries (set at the end).
+    state: Free-form storage for hooks, e.g. a tracing span.
+    """
+
+    method: str
+    path: str
+    url: str
+    headers: Dict[str, str]
+    request_id: Optional[str] = None
+    started: float = field(default_factory=time.monotonic)
+    attempt: int = 0
+    status: Optional[int] = None
+    error: Optional[BaseException] = None
+    response: Any = None
+    trace_id: Optional[str] = None
+    merchant_id: Optional[str] = None
+    elapsed: Optional[float] = None
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+class RequestHooks:
+    """
+    Base class for request lifecycle hooks; every method is a no-op.
+
+    Hooks run inline on the calling thread (or event loop for
+    AsyncNexusClient) and should return quickly.
+    """
+
+    def before_send(self, context: RequestContext) -> None:
+        """
+        Called before every attempt, after the SDK headers are built.
+        """
+
+    def after_receive(self, context: RequestContext) -> None:
+        """
+        Called once when the call returns a response (``context.response``).
+        """
+
+    def on_retry(self, context: RequestContext, delay: float) -> None:
+        """
+        Called when a failed attempt will be retried after ``delay`` seconds.
+        """
+
+    def on_error(self, context: RequestContext) -> None:
+        """
+        Called once when the call raises ``context.error``.
+        """
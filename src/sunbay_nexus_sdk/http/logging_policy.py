@@ -0,0 +1,243 @@
+"""
+Request/response logging policy for Sunbay Nexus HTTP clients.
+
+A LoggingPolicy decides which calls are logged (per-path sampling, optional
+slow-request-only mode) and how headers and bodies are rendered (redaction of
+secrets and card holder data, truncation). Headers and bodies are wrapped in
+lazy objects, so they are only redacted and formatted when a log record is
+actually emitted by a handler.
+"""
+
+import json
+import logging
+import random
+import time
+from typing import Any, Collection, Dict, Mapping, Optional, Union
+
+from .. import constants
+
+REDACTED = "[REDACTED]"
+
+DEFAULT_REDACTED_HEADERS = (constants.HEADER_AUTHORIZATION,)
+
+# Compared case-insensitively with underscores removed, so both the API
+# (camelCase) and Python (snake_case) spellings match.
+DEFAULT_REDACTED_FIELDS = (
+    "card_encrypted_data",
+    "masked_pan",
+    "customer_email",
+)
+
+DEFAULT_MAX_BODY_LENGTH = 2048
+
+
+def _normalize_field(name: str) -> str:
+    return name.replace("_", "").lower()
+
+
+class LoggingPolicy:
+    """
+    Controls INFO-level request/response logging.
+
+    Args:
+        redact_headers: Header names whose values are replaced (case-insensitive).
+        redact_fields: JSON body / query fields whose values are replaced, at any depth.
+        max_body_length: Truncate rendered bodies to this many characters (None: no limit).
+        log_bodies: When False, bodies are replaced by their size.
+        sample_rate: Fraction of calls logged for paths not listed in ``sample_rates``.
+        sample_rates: Per API path sampling rates, e.g. ``{PATH_QUERY: 0.01}``.
+        slow_threshold: When set, only calls that took at least this many
+            seconds, or ended in an error, are logged (request and response
+            together, after the call).
+    """
+
+    def __init__(
+        self,
+        redact_headers: Collection[str] = DEFAULT_REDACTED_HEADERS,
+        redact_fields: Collection[str] = DEFAULT_REDACTED_FIELDS,
+        max_body_length: Optional[int] = DEFAULT_MAX_BODY_LENGTH,
+        log_bodies: bool = True,
+        sample_rate: float = 1.0,
+        sample_rates: Optional[Mapping[str, float]] = None,
+        slow_threshold: Optional[float] = None,
+    ) -> None:
+        self.redact_headers = frozenset(h.lower() for h in redact_headers)
+        self.redact_fields = frozenset(_normalize_field(f) for f in redact_fields)
+        self.max_body_length = max_body_length
+        self.log_bodies = log_bodies
+        self.sample_rate = sample_rate
+        self.sample_rates = dict(sample_rates or {})
+        self.slow_threshold = slow_threshold
+
+    def sampled(self, path: str) -> bool:
+        """
+        Decide whether a call to ``path`` is logged.
+        """
+        rate = self.sample_rates.get(path, self.sample_rate)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        return random.random() < rate
+
+    def format_headers(self, headers: Mapping[str, str]) -> str:
+        return str({k: REDACTED if k.lower() in self.redact_headers else v for k, v in headers.items()})
+
+    def format_body(self, body: Union[None, bytes, Mapping[str, Any]]) -> Optional[str]:
+        """
+        Render a request/response body (bytes) or query parameters (mapping) for logging.
+        """
+        if body is None:
+            return None
+        if not self.log_bodies:
+            return f"<{len(body)} {'bytes' if isinstance(body, bytes) else 'params'} omitted>"
+
+        if isinstance(body, bytes):
+            text = body.decode("utf-8", errors="replace")
+            if self.redact_fields:
+                try:
+                    parsed = json.loads(text)
+                except ValueError:
+                    parsed = None
+                if isinstance(parsed, (dict, list)):
+                    text = json.dumps(self._redact(parsed), ensure_ascii=False)
+        else:
+            text = str(self._redact(dict(body)) if self.redact_fields else dict(body))
+
+        limit = self.max_body_length
+        if limit is not None and len(text) > limit:
+            text = f"{text[:limit]}...({len(text) - limit} more chars)"
+        return text
+
+    def _redact(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                k: REDACTED if _normalize_field(str(k)) in self.redact_fields and v is not None else self._redact(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, list):
+            return [self._redact(v) for v in value]
+        return value
+
+
+class _Lazy:
+    """
+    Defers formatting to ``str()``, which logging only calls for emitted records.
+    """
+
+    __slots__ = ("_render", "_value", "_text")
+
+    def __init__(self, render: Any, value: Any) -> None:
+        self._render = render
+        self._value = value
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = str(self._render(self._value))
+        return self._text
+
+    __repr__ = __str__
+
+
+class CallLog:
+    """
+    Logging state of one sampled API call.
+    """
+
+    __slots__ = ("policy", "method", "url", "headers", "payload", "started", "logged")
+
+    def __init__(
+        self,
+        policy: LoggingPolicy,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        payload: Union[None, bytes, Mapping[str, Any]],
+    ) -> None:
+        self.policy = policy
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.payload = payload
+        self.started = time.monotonic()
+        # Whether the response was logged.
+        self.logged = False
+
+    def request(self, logger: logging.Logger) -> None:
+        """
+        Log the outgoing request, unless only slow calls are logged.
+        """
+        if self.policy.slow_threshold is None:
+            self._log_request(logger)
+
+    def _log_request(self, logger: logging.Logger) -> None:
+        logger.info(
+            "Request %s %s - Headers: %s, %s: %s",
+            self.method,
+            self.url,
+            _Lazy(self.policy.format_headers, self.headers),
+            "Body" if self.method == "POST" else "Params",
+            _Lazy(self.policy.format_body, self.payload),
+        )
+
+    def response(self, logger: logging.Logger, status: int, body: Optional[bytes]) -> None:
+        """
+        Log the response (and, in slow-only mode, the request) of a finished call.
+        """
+        elapsed = time.monotonic() - self.started
+        threshold = self.policy.slow_threshold
+        if threshold is not None:
+            ok = constants.HTTP_STATUS_OK_START <= status < constants.HTTP_STATUS_OK_END
+            if ok and elapsed < threshold:
+                return
+            self._log_request(logger)
+        self.logged = True
+        logger.info(
+            "Response %s %s - Status: %s, Elapsed: %.3fs, Body: %s",
+            self.method,
+            self.url,
+            status,
+            elapsed,
+            _Lazy(self.policy.format_body, body),
+        )
+
+    def failure(self, logger: logging.Logger, error: BaseException) -> None:
+        """
+        Log a call that ended in an error (transport failure, business error,
+        circuit open, ...), whatever the slow threshold, unless its response
+        was logged already.
+        """
+        if self.logged:
+            return
+        if self.policy.slow_threshold is not None:
+            self._log_request(logger)
+        self.logged = True
+        code = getattr(error, "code", None)
+        logger.info(
+            "Failed %s %s - Elapsed: %.3fs, Error: %s%s",
+            self.method,
+            self.url,
+            time.monotonic() - self.started,
+            error.args[0] if error.args else type(error).__name__,
+            f" (code {code})" if code is not None else "",
+        )
+
+
+def new_call_log(
+    logger: logging.Logger,
+    policy: LoggingPolicy,
+    method: str,
+    path: str,
+    url: str,
+    headers: Dict[str, str],
+    payload: Union[None, bytes, Mapping[str, Any]],
+) -> Optional[CallLog]:
+    """
+    Start logging a call, or return None when INFO is disabled or the call is not sampled.
+    """
+    if not logger.isEnabledFor(logging.INFO) or not policy.sampled(path):
+        return None
+    call_log = CallLog(policy, method, url, headers, payload)
+    call_log.request(logger)
+    return call_log
@@ -0,0 +1,308 @@
+"""
+Metrics instrumentation for Sunbay Nexus HTTP clients.
+
+Pass a MetricsHook (usually the in-process MetricsRegistry) as ``metrics=`` to
+NexusClient / AsyncNexusClient. The client then reports, per API path:
+
+- latency of every attempt, split into connect, time to first byte and total
+- HTTP status and transport error counters
+- business ``code`` counters
+- retries
+
+The sync client additionally reports connection pool checkout waits,
+connections in use and hedged requests. ``render_prometheus`` exports a registry in the
+Prometheus text exposition format.
+"""
+
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .forks import reset_lock_after_fork
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+REQUEST_DURATION = "sunbay_request_duration_seconds"
+RESPONSES = "sunbay_responses_total"
+TRANSPORT_ERRORS = "sunbay_transport_errors_total"
+BUSINESS_CODES = "sunbay_business_codes_total"
+RETRIES = "sunbay_retries_total"
+HEDGES = "sunbay_hedges_total"
+POOL_CHECKOUT_WAIT = "sunbay_pool_checkout_wait_seconds"
+POOL_IN_USE = "sunbay_pool_connections_in_use"
+POOL_MAX = "sunbay_pool_max_connections"
+
+_HELP = {
+    REQUEST_DURATION: "Latency of one HTTP attempt by phase (connect, ttfb, total).",
+    RESPONSES: "HTTP responses by status code.",
+    TRANSPORT_ERRORS: "Attempts that failed without an HTTP response, by exception class.",
+    BUSINESS_CODES: "API responses by business code.",
+    RETRIES: "Retried attempts.",
+    HEDGES: "Hedged requests sent, by whether the hedge answered first.",
+    POOL_CHECKOUT_WAIT: "Time spent waiting for a pooled connection.",
+    POOL_IN_USE: "Connections currently checked out of the pool.",
+    POOL_MAX: "Configured connection pool size.",
+}
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class AttemptTiming:
+    """
+    Timing of one HTTP attempt, in seconds.
+
+    connect: Time to open the connection (TCP + TLS); None when a pooled connection was reused.
+    ttfb: Time until the response headers arrived; None when unknown.
+    total: Time until the response body was read (or the attempt failed).
+    """
+
+    connect: Optional[float]
+    ttfb: Optional[float]
+    total: float
+
+
+class MetricsHook:
+    """
+    Receives instrumentation events from an HTTP client.
+
+    Every method is a no-op; subclass and override the ones you need to feed
+    another metrics system (StatsD, OpenTelemetry, ...). Methods are called on
+    the request's thread and must be fast and thread-safe.
+    """
+
+    def record_attempt(
+        self,
+        path: str,
+        method: str,
+        status: Optional[int],
+        timing: AttemptTiming,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        One HTTP attempt finished. ``status`` is None when ``error`` is set.
+        """
+
+    def record_business_code(self, path: str, method: str, code: Optional[str]) -> None:
+        """
+        A 2xx response carried the given business code ("0" on success).
+        """
+
+    def record_retry(self, path: str, method: str) -> None:
+        """
+        A failed attempt is about to be retried.
+        """
+
+    def record_hedge(self, path: str, method: str, won: bool) -> None:
+        """
+        A hedged request was sent; ``won`` is True when its answer was used.
+        """
+
+    def record_pool_checkout(self, pool: str, wait: float, in_use: int, max_size: int) -> None:
+        """
+        A connection was taken from ``pool`` after waiting ``wait`` seconds.
+        """
+
+    def record_pool_release(self, pool: str, in_use: int, max_size: int) -> None:
+        """
+        A connection was returned to ``pool``.
+        """
+
+
+@dataclass
+class HistogramSnapshot:
+    """
+    Point-in-time copy of one histogram. ``counts`` are per bucket (not
+    cumulative); the last entry counts observations above the largest bound.
+    """
+
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    count: int
+    sum: float
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+def _labels(**labels: str) -> _Labels:
+    return tuple(sorted(labels.items()))
+
+
+class MetricsRegistry(MetricsHook):
+    """
+    Thread-safe in-process metrics store.
+
+    Args:
+        buckets: Upper bounds (seconds) of the latency histogram buckets.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+        self._counters: Dict[Tuple[str, _Labels], float] = {}
+        self._gauges: Dict[Tuple[str, _Labels], float] = {}
+        self._histograms: Dict[Tuple[str, _Labels], _Histogram] = {}
+
+    # --- MetricsHook ---
+
+    def record_attempt(
+        self,
+        path: str,
+        method: str,
+        status: Optional[int],
+        timing: AttemptTiming,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            if timing.connect is not None:
+                self._observe(REQUEST_DURATION, timing.connect, path=path, method=method, phase="connect")
+            if timing.ttfb is not None:
+                self._observe(REQUEST_DURATION, timing.ttfb, path=path, method=method, phase="ttfb")
+            self._observe(REQUEST_DURATION, timing.total, path=path, method=method, phase="total")
+            if status is not None:
+                self._inc(RESPONSES, path=path, method=method, status=str(status))
+            else:
+                self._inc(TRANSPORT_ERRORS, path=path, method=method, error=type(error).__name__)
+
+    def record_business_code(self, path: str, method: str, code: Optional[str]) -> None:
+        with self._lock:
+            self._inc(BUSINESS_CODES, path=path, method=method, code=str(code))
+
+    def record_retry(self, path: str, method: str) -> None:
+        with self._lock:
+            self._inc(RETRIES, path=path, method=method)
+
+    def record_hedge(self, path: str, method: str, won: bool) -> None:
+        with self._lock:
+            self._inc(HEDGES, path=path, method=method, won="true" if won else "false")
+
+    def record_pool_checkout(self, pool: str, wait: float, in_use: int, max_size: int) -> None:
+        with self._lock:
+            self._observe(POOL_CHECKOUT_WAIT, wait, pool=pool)
+            self._gauges[(POOL_IN_USE, _labels(pool=pool))] = in_use
+            self._gauges[(POOL_MAX, _labels(pool=pool))] = max_size
+
+    def record_pool_release(self, pool: str, in_use: int, max_size: int) -> None:
+        with self._lock:
+            self._gauges[(POOL_IN_USE, _labels(pool=pool))] = in_use
+
+    # --- Storage (callers hold the lock) ---
+
+    def _inc(self, name: str, **labels: str) -> None:
+        key = (name, _labels(**labels))
+        self._counters[key] = self._counters.get(key, 0) + 1
+
+    def _observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, _labels(**labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = _Histogram(self._buckets)
+        histogram.observe(value)
+
+    # --- Reading ---
+
+    def value(self, name: str, **labels: str) -> float:
+        """
+        Current value of a counter or gauge (0 when never recorded).
+        """
+        key = (name, _labels(**labels))
+        with self._lock:
+            return self._counters.get(key, self._gauges.get(key, 0))
+
+    def histogram(self, name: str, **labels: str) -> Optional[HistogramSnapshot]:
+        """
+        Copy of a histogram, or None when never recorded.
+        """
+        with self._lock:
+            histogram = self._histograms.get((name, _labels(**labels)))
+            if histogram is None:
+                return None
+            return HistogramSnapshot(histogram.buckets, list(histogram.counts), histogram.count, histogram.sum)
+
+    def reset(self) -> None:
+        """
+        Drop every recorded metric.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        return render_prometheus(self)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: _Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels)
+    if extra is not None:
+        items.append(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(registry: MetricsRegistry) -> str:
+    """
+    Export a MetricsRegistry in the Prometheus text exposition format (version 0.0.4).
+    """
+    with registry._lock:
+        counters = sorted(registry._counters.items())
+        gauges = sorted(registry._gauges.items())
+        histograms = sorted(
+            (key, HistogramSnapshot(h.buckets, list(h.counts), h.count, h.sum))
+            for key, h in registry._histograms.items()
+        )
+
+    lines: List[str] = []
+    seen = set()
+
+    def header(name: str, kind: str) -> None:
+        if name not in seen:
+            seen.add(name)
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} {kind}")
+
+    for (name, labels), value in counters:
+        header(name, "counter")
+        lines.append(f"{name}{_format_labels(labels)} {_format_number(value)}")
+    for (name, labels), value in gauges:
+        header(name, "gauge")
+        lines.append(f"{name}{_format_labels(labels)} {_format_number(value)}")
+    for (name, labels), snapshot in histograms:
+        header(name, "histogram")
+        cumulative = 0
+        for bound, count in zip(snapshot.buckets + (float("inf"),), snapshot.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels(labels, ('le', _format_number(bound)))} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_number(snapshot.sum)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {snapshot.count}")
+    return "\n".join(lines) + "\n" if lines else ""
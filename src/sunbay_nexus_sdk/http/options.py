@@ -0,0 +1,29 @@
+"""
+Per-call request options.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .hedging import HedgePolicy
+from .retry import RetryPolicy
+
+
+@dataclass
+class RequestOptions:
+    """
+    Options that override client-level settings for a single API call.
+
+    retry_policy: Retry policy for this call instead of the client's policy.
+    request_id: X-Client-Request-Id to send instead of a generated one, e.g. to
+        propagate an upstream request id. Meant for single calls.
+    headers: Extra headers (e.g. trace context). SDK-managed headers such as
+        Authorization take precedence.
+    hedge_policy: Hedge policy for this GET call instead of the client's
+        (NexusClient only).
+    """
+
+    retry_policy: Optional[RetryPolicy] = None
+    request_id: Optional[str] = None
+    headers: Optional[Dict[str, str]] = None
+    hedge_policy: Optional[HedgePolicy] = None
@@ -0,0 +1,72 @@
+"""
+Connection pool configuration for Sunbay Nexus HTTP clients.
+
+PoolConfig tunes how the clients keep connections to the API: what happens
+when every pooled connection is busy, how long an idle connection may be
+reused, TCP keepalive probes and extra socket options. The pool size itself
+stays the clients' ``max_connections`` argument.
+"""
+
+import socket
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+
+from ..exceptions import SunbayBusinessError
+
+SocketOption = Tuple[int, int, Union[int, bytes]]
+
+
+@dataclass
+class PoolConfig:
+    """
+    Connection pool settings.
+
+    Attributes:
+        block: When all ``max_connections`` are busy, wait for one to be
+            returned (up to the connect timeout) instead of opening an extra
+            connection that is closed after the call. The async client always waits.
+        num_pools: Number of per-host pools kept (one host is used normally).
+        idle_ttl: Seconds a connection may sit idle in the pool and still be
+            reused; older ones are reopened. Use it when a load balancer or
+            NAT drops idle connections silently. None keeps them indefinitely
+            on the sync client and uses httpx' default (5 s) on the async client.
+        tcp_keepalive: Send TCP keepalive probes on idle connections.
+        keepalive_idle: Seconds of idleness before the first probe.
+        keepalive_interval: Seconds between probes.
+        keepalive_count: Unanswered probes before the connection is dropped.
+        socket_options: Extra ``(level, option, value)`` tuples set on every new socket.
+    """
+
+    block: bool = False
+    num_pools: int = 10
+    idle_ttl: Optional[float] = None
+    tcp_keepalive: bool = True
+    keepalive_idle: int = 60
+    keepalive_interval: int = 15
+    keepalive_count: int = 4
+    socket_options: Sequence[SocketOption] = ()
+
+    def __post_init__(self) -> None:
+        if self.num_pools < 1:
+            raise SunbayBusinessError("num_pools must be at least 1")
+        if self.idle_ttl is not None and self.idle_ttl <= 0:
+            raise SunbayBusinessError("idle_ttl must be positive")
+
+    def build_socket_options(self) -> List[SocketOption]:
+        """
+        Socket options for new connections: TCP_NODELAY, keepalive settings
+        (where the platform supports them) and ``socket_options``.
+        """
+        options: List[SocketOption] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        if self.tcp_keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # TCP_KEEPIDLE is Linux/Windows; macOS calls it TCP_KEEPALIVE.
+            idle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+            if idle is not None:
+                options.append((socket.IPPROTO_TCP, idle, self.keepalive_idle))
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keepalive_interval))
+            if hasattr(socket, "TCP_KEEPCNT"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.keepalive_count))
+        options.extend(self.socket_options)
+        return options
@@ -0,0 +1,359 @@
+"""
+Client-side rate limiting.
+
+A RateLimiter keeps token buckets at up to four levels: global, per API
+key, per merchant_id and per API path (e.g. a slow ``PATH_BATCH_CLOSE``).
+Every request attempt takes one token from each bucket that applies to it,
+and waits, or fails fast, when one of them is empty.
+
+The buckets adapt to the server: an HTTP 429 lowers the rate of the buckets
+the throttled request went through and ``Retry-After`` pauses them; the rate
+then recovers linearly to the configured one.
+
+Per API key and per merchant buckets are dropped once they are back to the
+state of a new bucket (full, not throttled), least recently used first, so a
+multi-tenant process does not keep one bucket for every merchant it has ever
+seen. Buckets still paying off a burst or a 429 are kept, even past
+``max_buckets``: dropping one would reset its backoff.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Hashable, List, Mapping, Optional, Tuple
+
+from .. import constants
+from ..exceptions import SunbayBusinessError, SunbayRateLimitedError
+from .forks import reset_lock_after_fork
+from .retry import parse_retry_after
+
+# In-flight requests report the same congestion, so a burst of 429 answers
+# lowers the rate only once per this many seconds.
+_THROTTLE_COOLDOWN = 1.0
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A token bucket: ``rate`` requests per second, with bursts of up to
+    ``burst`` requests (default: ``max(rate, 1)``).
+    """
+
+    rate: float
+    burst: Optional[float] = None
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Counters of a RateLimiter: tokens taken, requests refused because the
+    wait would exceed the limit, 429 answers seen, and the total time
+    callers were told to wait, in seconds.
+    """
+
+    acquired: int = 0
+    rejected: int = 0
+    throttled: int = 0
+    total_wait: float = 0.0
+
+
+class _Bucket:
+    __slots__ = ("limit", "label", "burst", "tokens", "updated", "floor", "reduced_rate", "reduced_at", "paused_until")
+
+    def __init__(self, limit: RateLimit, label: str, floor: float, now: float) -> None:
+        if limit.rate <= 0:
+            raise SunbayBusinessError("RateLimit rate must be positive")
+        self.limit = limit
+        self.label = label
+        self.burst = limit.burst if limit.burst is not None else max(limit.rate, 1.0)
+        self.tokens = self.burst
+        self.updated = now
+        self.floor = limit.rate * floor
+        # Rate right after the last 429, recovering towards limit.rate.
+        self.reduced_rate: Optional[float] = None
+        self.reduced_at = 0.0
+        self.paused_until = 0.0
+
+    def rate(self, now: float, recovery_time: float) -> float:
+        if self.reduced_rate is None:
+            return self.limit.rate
+        progress = (now - self.reduced_at) / recovery_time if recovery_time > 0 else 1.0
+        if progress >= 1.0:
+            self.reduced_rate = None
+            return self.limit.rate
+        return self.reduced_rate + (self.limit.rate - self.reduced_rate) * progress
+
+    def refill(self, now: float, recovery_time: float) -> None:
+        start = max(self.updated, self.paused_until)
+        if now > start:
+            self.tokens = min(self.burst, self.tokens + (now - start) * self.rate(now, recovery_time))
+        self.updated = max(self.updated, now)
+
+    def wait(self, now: float, recovery_time: float) -> float:
+        # Seconds until one token is available (tokens go negative while
+        # callers are queued).
+        pause = max(0.0, self.paused_until - now)
+        if self.tokens >= 1.0:
+            return pause
+        return pause + (1.0 - self.tokens) / self.rate(now, recovery_time)
+
+    def throttle(self, now: float, factor: float, pause: Optional[float], recovery_time: float) -> None:
+        if self.reduced_rate is None or now - self.reduced_at >= _THROTTLE_COOLDOWN:
+            self.reduced_rate = max(self.floor, self.rate(now, recovery_time) * factor)
+            self.reduced_at = now
+        if pause:
+            self.paused_until = max(self.paused_until, now + pause)
+            self.tokens = min(self.tokens, 0.0)
+
+    def settled(self, now: float, recovery_time: float) -> bool:
+        # True when the bucket is back to the state of a new one.
+        self.refill(now, recovery_time)
+        return self.tokens >= self.burst and self.reduced_rate is None and now >= self.paused_until
+
+
+class RateLimiter:
+    """
+    Token buckets in front of the HTTP client. Safe to share between threads,
+    clients and event loops.
+
+    Args:
+        global_limit: Bucket shared by every request.
+        per_api_key: Bucket per API key (useful when clients share the limiter).
+        per_merchant: Bucket per merchant_id of the request.
+        per_path: Buckets per API path, e.g. ``{PATH_BATCH_CLOSE: RateLimit(0.5)}``.
+        max_wait: Seconds a request may wait for its tokens. None waits as
+            long as needed; 0 never waits. A request that would wait longer
+            raises SunbayRateLimitedError without being sent.
+        decrease_factor: Rate multiplier applied on HTTP 429 (at most once a
+            second per bucket).
+        min_rate_ratio: Lowest rate a 429 can lead to, as a fraction of the
+            configured rate.
+        recovery_time: Seconds for a lowered rate to recover linearly to the
+            configured one.
+        max_pause: Longest ``Retry-After`` pause honoured, in seconds.
+        max_buckets: Soft cap on per API key and per merchant buckets.
+            Above it every bucket back to full and unthrottled is dropped,
+            not only the least recently used ones; the others are kept
+            until they are.
+
+    Example:
+        limiter = RateLimiter(global_limit=RateLimit(50), per_merchant=RateLimit(10, burst=20))
+        client = NexusClient(api_key="sk_live_xxx", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        global_limit: Optional[RateLimit] = None,
+        per_api_key: Optional[RateLimit] = None,
+        per_merchant: Optional[RateLimit] = None,
+        per_path: Optional[Mapping[str, RateLimit]] = None,
+        max_wait: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        min_rate_ratio: float = 0.1,
+        recovery_time: float = 30.0,
+        max_pause: float = 60.0,
+        max_buckets: int = 1024,
+    ) -> None:
+        if not 0 < decrease_factor <= 1:
+            raise SunbayBusinessError("decrease_factor must be in (0, 1]")
+        if not 0 < min_rate_ratio <= 1:
+            raise SunbayBusinessError("min_rate_ratio must be in (0, 1]")
+        if max_wait is not None and max_wait < 0:
+            raise SunbayBusinessError("max_wait must not be negative")
+        if max_buckets < 1:
+            raise SunbayBusinessError("max_buckets must be at least 1")
+        self._per_api_key = per_api_key
+        self._per_merchant = per_merchant
+        self._per_path = dict(per_path or {})
+        self.max_wait = max_wait
+        self._decrease_factor = decrease_factor
+        self._min_rate_ratio = min_rate_ratio
+        self._recovery_time = recovery_time
+        self._max_pause = max_pause
+        self._max_buckets = max_buckets
+        # Global and per path buckets, then per API key and per merchant ones
+        # in LRU order.
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self._scoped: "OrderedDict[Tuple[str, str], _Bucket]" = OrderedDict()
+        self._api_keys = 0
+        self._stats = RateLimiterStats()
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+        if global_limit is not None:
+            self._buckets["global"] = self._new_bucket(global_limit, "global", time.monotonic())
+        for path, limit in self._per_path.items():
+            self._buckets[("path", path)] = self._new_bucket(limit, f"path {path}", time.monotonic())
+
+    def reserve(
+        self,
+        api_key: Optional[str] = None,
+        merchant_id: Optional[str] = None,
+        path: Optional[str] = None,
+        max_wait: Optional[float] = None,
+    ) -> float:
+        """
+        Take one token from every bucket that applies and return the seconds
+        the caller must wait before sending. ``max_wait`` overrides the
+        limiter's for this call.
+
+        Raises:
+            SunbayRateLimitedError: when the wait would exceed ``max_wait``;
+                no token is taken then.
+        """
+        limit = self.max_wait if max_wait is None else max_wait
+        now = time.monotonic()
+        with self._lock:
+            buckets = self._buckets_for(api_key, merchant_id, path, now)
+            wait, slowest = 0.0, None
+            for bucket in buckets:
+                bucket.refill(now, self._recovery_time)
+                needed = bucket.wait(now, self._recovery_time)
+                if needed > wait:
+                    wait, slowest = needed, bucket
+            if limit is not None and wait > limit:
+                self._stats.rejected += 1
+                assert slowest is not None
+                raise SunbayRateLimitedError(slowest.label, retry_after=wait)
+            for bucket in buckets:
+                bucket.tokens -= 1.0
+            self._stats.acquired += 1
+            self._stats.total_wait += wait
+        return wait
+
+    def acquire(
+        self,
+        api_key: Optional[str] = None,
+        merchant_id: Optional[str] = None,
+        path: Optional[str] = None,
+        max_wait: Optional[float] = None,
+    ) -> float:
+        """
+        Blocking acquire: take the tokens and sleep until they are due.
+        Returns the seconds waited.
+        """
+        wait = self.reserve(api_key, merchant_id, path, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(
+        self, api_key: Optional[str] = None, merchant_id: Optional[str] = None, path: Optional[str] = None
+    ) -> bool:
+        """
+        Non-blocking acquire: take the tokens only if they are available now.
+        """
+        try:
+            self.reserve(api_key, merchant_id, path, max_wait=0.0)
+        except SunbayRateLimitedError:
+            return False
+        return True
+
+    async def acquire_async(
+        self,
+        api_key: Optional[str] = None,
+        merchant_id: Optional[str] = None,
+        path: Optional[str] = None,
+        max_wait: Optional[float] = None,
+    ) -> float:
+        """
+        Asyncio acquire: like ``acquire`` but sleeps without blocking the event loop.
+        """
+        wait = self.reserve(api_key, merchant_id, path, max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_response(
+        self,
+        api_key: Optional[str],
+        merchant_id: Optional[str],
+        path: Optional[str],
+        status: Optional[int],
+        retry_after: Optional[str] = None,
+    ) -> None:
+        """
+        Feed the HTTP status (and ``Retry-After`` header) of an attempt back.
+        Only HTTP 429 changes the buckets.
+        """
+        if status != constants.HTTP_STATUS_TOO_MANY_REQUESTS:
+            return
+        pause = parse_retry_after(retry_after)
+        if pause is not None:
+            pause = min(pause, self._max_pause)
+        now = time.monotonic()
+        with self._lock:
+            self._stats.throttled += 1
+            for bucket in self._buckets_for(api_key, merchant_id, path, now):
+                bucket.refill(now, self._recovery_time)
+                bucket.throttle(now, self._decrease_factor, pause, self._recovery_time)
+
+    def current_rates(self) -> Dict[str, float]:
+        """
+        Current refill rate (requests per second) of every bucket, by label
+        ("global", "path ...", "merchant ...", "api key #n").
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                bucket.label: bucket.rate(now, self._recovery_time)
+                for buckets in (self._buckets, self._scoped)
+                for bucket in buckets.values()
+            }
+
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def _new_bucket(self, limit: RateLimit, label: str, now: float) -> _Bucket:
+        return _Bucket(limit, label, self._min_rate_ratio, now)
+
+    def _buckets_for(
+        self, api_key: Optional[str], merchant_id: Optional[str], path: Optional[str], now: float
+    ) -> List[_Bucket]:
+        buckets = [self._buckets[key] for key in ("global", ("path", path)) if key in self._buckets]
+        scoped = 0
+        if api_key and self._per_api_key is not None:
+            buckets.append(self._scoped_bucket(("api_key", api_key), self._per_api_key, now))
+            scoped += 1
+        if merchant_id and self._per_merchant is not None:
+            buckets.append(self._scoped_bucket(("merchant", merchant_id), self._per_merchant, now))
+            scoped += 1
+        # The buckets of this request are the most recently used ones.
+        self._drop_settled(now, keep=scoped)
+        return buckets
+
+    def _drop_settled(self, now: float, keep: int) -> None:
+        # Called with the lock held; a settled bucket is no different from the
+        # new one built on its next use. Settled buckets go in LRU order up to
+        # the first unsettled one, and past it while above max_buckets; the
+        # ``keep`` most recently used are left alone. An unsettled bucket is
+        # never dropped, as that would undo the backoff after a 429.
+        over = len(self._scoped) - self._max_buckets
+        candidates = len(self._scoped) - keep
+        dropped = []
+        for index, (key, bucket) in enumerate(self._scoped.items()):
+            if index >= candidates:
+                break
+            if bucket.settled(now, self._recovery_time):
+                dropped.append(key)
+                over -= 1
+            elif over <= 0:
+                break
+        for key in dropped:
+            del self._scoped[key]
+
+    def _scoped_bucket(self, key: Tuple[str, str], limit: RateLimit, now: float) -> _Bucket:
+        bucket = self._scoped.get(key)
+        if bucket is not None:
+            self._scoped.move_to_end(key)
+        else:
+            if key[0] == "api_key":
+                # API keys are secrets: never put them in labels or errors.
+                self._api_keys += 1
+                label = f"api key #{self._api_keys}"
+            else:
+                label = f"merchant {key[1]}"
+            bucket = self._scoped[key] = self._new_bucket(limit, label, now)
+        return bucket
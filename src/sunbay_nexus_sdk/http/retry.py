@@ -0,0 +1,214 @@
+"""
+Retry policy for Sunbay Nexus HTTP clients.
+
+A RetryPolicy decides whether a failed attempt is retried (by HTTP method,
+status code and exception class) and how long to wait before the next one:
+exponential backoff with full jitter, stretched to honour ``Retry-After``.
+An optional RetryBudget caps retries to a fraction of regular traffic so a
+backend brownout does not turn into a retry storm.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional, Tuple, Type
+
+from ..constants import RETRYABLE_HTTP_STATUSES
+from .forks import reset_lock_after_fork
+
+
+@dataclass
+class RetryStats:
+    """
+    Retry bookkeeping for one API call.
+
+    Attached as ``retry_stats`` to the returned response or raised exception.
+    """
+
+    attempts: int = 0
+    retries: int = 0
+    # Cumulative time spent sleeping between attempts, in seconds.
+    total_backoff: float = 0.0
+    # True when a retry was wanted but denied by the retry budget.
+    budget_exhausted: bool = False
+    # Hedged requests sent (GET calls with a HedgePolicy).
+    hedges: int = 0
+
+
+class RetryBudget:
+    """
+    Token-bucket retry budget, safe to share between threads and clients.
+
+    Every call deposits ``ratio`` tokens and every retry withdraws one, so
+    retries stay below roughly ``ratio`` of the call volume. A trickle of
+    ``min_retries_per_second`` keeps low-traffic clients able to retry.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+    ) -> None:
+        self._ratio = ratio
+        self._min_per_second = min_retries_per_second
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self._max_tokens, self._tokens + elapsed * self._min_per_second)
+
+    def deposit(self) -> None:
+        """
+        Record one call (first attempt).
+        """
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        Take one token for a retry. Returns False when the budget is exhausted.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retry configuration, set per client or per call via RequestOptions.
+
+    Args:
+        max_attempts: Total attempts including the first one.
+        backoff_base: Backoff before the first retry, in seconds; doubles per retry.
+        backoff_max: Upper bound of a single backoff, in seconds.
+        jitter: Use full jitter (uniform in ``[0, backoff]``) instead of fixed backoff.
+        retry_on_status: HTTP statuses that are retried.
+        retry_on_exceptions: Transport exception classes that are retried.
+            ``None`` retries every transport error (timeouts, connection errors).
+        retry_methods: HTTP methods that may be retried. POST is excluded by
+            default because transactions are not idempotent on the wire.
+        respect_retry_after: Wait at least ``Retry-After`` when the server sends it.
+        max_retry_after: Give up instead of waiting longer than this for ``Retry-After``.
+        budget: Optional shared RetryBudget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        jitter: bool = True,
+        retry_on_status: Collection[int] = RETRYABLE_HTTP_STATUSES,
+        retry_on_exceptions: Optional[Tuple[Type[BaseException], ...]] = None,
+        retry_methods: Collection[str] = ("GET",),
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        self.max_attempts = max(int(max_attempts), 1)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_on_status = frozenset(retry_on_status)
+        self.retry_on_exceptions = retry_on_exceptions
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+
+    @classmethod
+    def no_retry(cls) -> "RetryPolicy":
+        """
+        Policy that never retries.
+        """
+        return cls(max_attempts=1)
+
+    def backoff(self, retry_number: int) -> float:
+        """
+        Backoff before the given retry (1-based), in seconds.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (retry_number - 1)))
+        return random.uniform(0.0, ceiling) if self.jitter else ceiling
+
+    def next_delay(
+        self,
+        method: str,
+        stats: RetryStats,
+        *,
+        exc: Optional[BaseException] = None,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Returns the delay in seconds before the next attempt, or None to stop.
+        Updates ``stats`` when a retry is granted.
+        """
+        if stats.attempts >= self.max_attempts or method.upper() not in self.retry_methods:
+            return None
+        if exc is not None:
+            if self.retry_on_exceptions is not None and not isinstance(exc, self.retry_on_exceptions):
+                return None
+        elif status is None or status not in self.retry_on_status:
+            return None
+
+        delay = self.backoff(stats.retries + 1)
+        if self.respect_retry_after:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                if server_delay > self.max_retry_after:
+                    return None
+                delay = max(delay, server_delay)
+
+        if self.budget is not None and not self.budget.try_withdraw():
+            stats.budget_exhausted = True
+            return None
+
+        stats.retries += 1
+        stats.total_backoff += delay
+        return delay
+
+    def record_call(self) -> None:
+        """
+        Record a new call against the retry budget.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
@@ -0,0 +1,531 @@
+"""
+Idempotency journal for POST transactions.
+
+HttpClient never retries POST calls: after a timeout the SDK cannot tell
+whether a ``sale``, ``refund`` or ``checkout_sale`` reached Nexus. With a
+journal, NexusClient records the intent of every transaction (keyed by
+app_id, merchant_id and transaction_request_id) before sending it and its
+outcome after the answer arrives:
+
+- an unknown outcome (timeout, connection reset, 5xx, or a crash between the
+  two records) is resolved with ``query`` by transaction_request_id, and the
+  POST is sent again only when Nexus has no such transaction
+- a transaction_request_id that already completed returns the recorded
+  response without a network call; reusing it for a different request body
+  (another amount, terminal, ...) raises SunbayBusinessError
+- concurrent submissions of the same transaction_request_id through one
+  client share one network call; other clients and processes using the same
+  journal wait for the owner's outcome, or for its lease to expire, before
+  resolving it themselves
+
+SqliteJournal stores the journal in a SQLite database (standard library
+only); subclass IdempotencyJournal to keep it elsewhere.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Collection, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar
+
+from .constants import (
+    PATH_AUTH,
+    PATH_CHECKOUT_SALE,
+    PATH_FORCED_AUTH,
+    PATH_INCREMENTAL_AUTH,
+    PATH_POST_AUTH,
+    PATH_REFUND,
+    PATH_SALE,
+    PATH_VOID,
+    TRANSACTION_NOT_FOUND_CODES,
+)
+from .exceptions import (
+    SunbayBusinessError,
+    SunbayCircuitOpenError,
+    SunbayError,
+    SunbayNetworkError,
+    SunbayRateLimitedError,
+)
+from .http.forks import reset_lock_after_fork
+from .models.base import BaseResponse
+from .models.request import QueryRequest
+from .models.response import (
+    AuthResponse,
+    CheckoutSaleResponse,
+    ForcedAuthResponse,
+    IncrementalAuthResponse,
+    PostAuthResponse,
+    RefundResponse,
+    SaleResponse,
+    VoidResponse,
+)
+from .serialization import decode_response, to_primitive
+
+T = TypeVar("T", bound=BaseResponse)
+
+# Journaled endpoints: POSTs creating a transaction that ``query`` can find
+# by transaction_request_id.
+JOURNALED_PATHS: Dict[str, Type[BaseResponse]] = {
+    PATH_SALE: SaleResponse,
+    PATH_AUTH: AuthResponse,
+    PATH_FORCED_AUTH: ForcedAuthResponse,
+    PATH_INCREMENTAL_AUTH: IncrementalAuthResponse,
+    PATH_POST_AUTH: PostAuthResponse,
+    PATH_REFUND: RefundResponse,
+    PATH_VOID: VoidResponse,
+    PATH_CHECKOUT_SALE: CheckoutSaleResponse,
+}
+
+# Seconds between journal reads while another process owns a transaction.
+_POLL_INTERVAL = 0.1
+
+_Key = Tuple[str, str, str]
+
+
+class JournalState(str, Enum):
+    """
+    State of a journaled transaction.
+    """
+
+    # Intent recorded; the outcome is not known yet.
+    PENDING = "PENDING"
+    # Nexus created the transaction; the response is recorded.
+    COMPLETED = "COMPLETED"
+    # Nexus did not create the transaction (business error, 4xx, not found
+    # by query); the transaction_request_id may be submitted again.
+    REJECTED = "REJECTED"
+
+
+class JournalEntry(NamedTuple):
+    """
+    One journaled transaction. Times are Unix timestamps.
+    """
+
+    app_id: str
+    merchant_id: str
+    transaction_request_id: str
+    path: str
+    state: JournalState
+    owner: Optional[str]
+    response: Optional[str]
+    error: Optional[str]
+    created_at: float
+    updated_at: float
+    # SHA-256 of the serialized request body (None for entries recorded
+    # before fingerprints were stored).
+    fingerprint: Optional[str] = None
+
+    @property
+    def key(self) -> _Key:
+        return (self.app_id, self.merchant_id, self.transaction_request_id)
+
+
+class IdempotencyJournal:
+    """
+    Storage interface of the journal, plus how NexusClient uses it.
+
+    Args:
+        max_attempts: POST attempts per call. An attempt is repeated only
+            after ``query`` confirmed that Nexus has no such transaction.
+        resolve_delay: Seconds to wait after an unknown outcome before
+            querying, so a request still processed by Nexus can finish.
+        not_found_codes: Business codes of ``query`` meaning "no such
+            transaction". Any other business error of ``query`` is raised
+            and never leads to a resubmission.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        resolve_delay: float = 1.0,
+        not_found_codes: Collection[str] = TRANSACTION_NOT_FOUND_CODES,
+    ) -> None:
+        self.max_attempts = max(int(max_attempts), 1)
+        self.resolve_delay = resolve_delay
+        self.not_found_codes = frozenset(not_found_codes)
+
+    def claim(self, key: _Key, path: str, owner: str, fingerprint: Optional[str] = None) -> Optional[JournalEntry]:
+        """
+        Atomically record a PENDING intent owned by ``owner``, with the
+        ``fingerprint`` of its request body, and return None when there is no
+        entry for ``key`` or it is REJECTED. Otherwise leave the entry as is
+        and return it.
+        """
+        raise NotImplementedError
+
+    def take_over(self, entry: JournalEntry, owner: str) -> bool:
+        """
+        Make ``owner`` the owner of a PENDING entry, unless it changed since
+        ``entry`` was read. Returns True on success.
+        """
+        raise NotImplementedError
+
+    def record(
+        self,
+        key: _Key,
+        state: JournalState,
+        response: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record the outcome of a transaction.
+        """
+        raise NotImplementedError
+
+    def get(self, key: _Key) -> Optional[JournalEntry]:
+        raise NotImplementedError
+
+    def pending(self, older_than: float = 0.0) -> List[JournalEntry]:
+        """
+        PENDING entries not updated for at least ``older_than`` seconds.
+        """
+        raise NotImplementedError
+
+    def purge(self, older_than: float) -> int:
+        """
+        Delete COMPLETED and REJECTED entries older than ``older_than``
+        seconds. Returns how many were deleted.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteJournal(IdempotencyJournal):
+    """
+    Journal in a SQLite database, safe to share between threads and
+    processes on one host.
+
+    Args:
+        path: Database file (":memory:" for a per-process journal, which
+            de-duplicates but does not survive restarts).
+        synchronous: SQLite ``synchronous`` setting. NORMAL (with WAL)
+            survives process crashes; FULL also survives power loss at the
+            cost of an fsync per record.
+        timeout: Seconds to wait for a database locked by another process.
+        **policy: IdempotencyJournal arguments (max_attempts, ...).
+    """
+
+    def __init__(self, path: str, synchronous: str = "NORMAL", timeout: float = 30.0, **policy: Any) -> None:
+        super().__init__(**policy)
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise SunbayBusinessError(f"Unsupported synchronous setting: {synchronous}")
+        self._path = path
+        self._synchronous = synchronous.upper()
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+        self._connect()
+
+    def _connect(self) -> None:
+        conn = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sunbay_journal ("
+            " app_id TEXT NOT NULL, merchant_id TEXT NOT NULL, transaction_request_id TEXT NOT NULL,"
+            " path TEXT NOT NULL, state TEXT NOT NULL, owner TEXT, response TEXT, error TEXT,"
+            " created_at REAL NOT NULL, updated_at REAL NOT NULL, fingerprint TEXT,"
+            " PRIMARY KEY (app_id, merchant_id, transaction_request_id))"
+        )
+        # Journals created before fingerprints were stored lack the column.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if "fingerprint" not in {row[1] for row in conn.execute("PRAGMA table_info(sunbay_journal)")}:
+                conn.execute("ALTER TABLE sunbay_journal ADD COLUMN fingerprint TEXT")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("CREATE INDEX IF NOT EXISTS sunbay_journal_state ON sunbay_journal (state, updated_at)")
+        self._conn = conn
+        self._pid = os.getpid()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # SQLite connections must not be used, or even closed, in a forked
+            # child: closing one can delete the WAL file the parent still uses.
+            _inherited.append(self._conn)
+            self._connect()
+        return self._conn
+
+    def claim(self, key: _Key, path: str, owner: str, fingerprint: Optional[str] = None) -> Optional[JournalEntry]:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(_SELECT, key).fetchone()
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO sunbay_journal (app_id, merchant_id, transaction_request_id, path, state,"
+                        " owner, created_at, updated_at, fingerprint) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (*key, path, JournalState.PENDING.value, owner, now, now, fingerprint),
+                    )
+                elif row[4] == JournalState.REJECTED.value:
+                    conn.execute(
+                        "UPDATE sunbay_journal SET path = ?, state = ?, owner = ?, response = NULL, error = NULL,"
+                        " updated_at = ?, fingerprint = ?"
+                        " WHERE app_id = ? AND merchant_id = ? AND transaction_request_id = ?",
+                        (path, JournalState.PENDING.value, owner, now, fingerprint, *key),
+                    )
+                    row = None
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return None if row is None else _entry(row)
+
+    def take_over(self, entry: JournalEntry, owner: str) -> bool:
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE sunbay_journal SET owner = ?, updated_at = ? WHERE app_id = ? AND merchant_id = ?"
+                " AND transaction_request_id = ? AND state = ? AND owner IS ? AND updated_at = ?",
+                (owner, time.time(), *entry.key, JournalState.PENDING.value, entry.owner, entry.updated_at),
+            )
+        return cursor.rowcount == 1
+
+    def record(
+        self,
+        key: _Key,
+        state: JournalState,
+        response: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._connection().execute(
+                "UPDATE sunbay_journal SET state = ?, response = ?, error = ?, updated_at = ?"
+                " WHERE app_id = ? AND merchant_id = ? AND transaction_request_id = ?",
+                (state.value, response, error, time.time(), *key),
+            )
+
+    def get(self, key: _Key) -> Optional[JournalEntry]:
+        with self._lock:
+            row = self._connection().execute(_SELECT, key).fetchone()
+        return None if row is None else _entry(row)
+
+    def pending(self, older_than: float = 0.0) -> List[JournalEntry]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT * FROM sunbay_journal WHERE state = ? AND updated_at <= ? ORDER BY updated_at",
+                (JournalState.PENDING.value, time.time() - older_than),
+            ).fetchall()
+        return [_entry(row) for row in rows]
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM sunbay_journal WHERE state != ? AND updated_at <= ?",
+                (JournalState.PENDING.value, time.time() - older_than),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                self._conn.close()
+
+
+_SELECT = "SELECT * FROM sunbay_journal WHERE app_id = ? AND merchant_id = ? AND transaction_request_id = ?"
+
+# Connections inherited from a parent process, kept open (see _connection).
+_inherited: List[sqlite3.Connection] = []
+
+
+def _entry(row: Tuple[Any, ...]) -> JournalEntry:
+    return JournalEntry(*row[:4], JournalState(row[4]), *row[5:])  # type: ignore[call-arg]
+
+
+def _encode_response(response: BaseResponse) -> str:
+    return json.dumps({"data": to_primitive(response)}, ensure_ascii=False)
+
+
+def _fingerprint(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def _describe(exc: BaseException) -> str:
+    message = exc.args[0] if exc.args else type(exc).__name__
+    code = getattr(exc, "code", None)
+    return f"{code}: {message}" if code is not None else str(message)
+
+
+class JournaledPoster:
+    """
+    Sends journaled POST transactions for a NexusClient; see the module docstring.
+    """
+
+    def __init__(self, client: Any, journal: IdempotencyJournal, logger: Optional[logging.Logger] = None) -> None:
+        self._client = client
+        self._http = client._http_client
+        self._journal = journal
+        self._logger = logger or logging.getLogger("sunbay_nexus_sdk.journal")
+        self._lock = threading.Lock()
+        reset_lock_after_fork(self)
+        # (path, request fingerprint, shared outcome) by key.
+        self._in_flight: Dict[_Key, Tuple[str, str, "Future[BaseResponse]"]] = {}
+        self._pid = os.getpid()
+
+    @property
+    def journal(self) -> IdempotencyJournal:
+        return self._journal
+
+    def post(self, path: str, request: Any, response_type: Type[T], options: Any = None) -> T:
+        transaction_request_id = getattr(request, "transaction_request_id", None)
+        if path not in JOURNALED_PATHS or not transaction_request_id:
+            return self._http.post(path, request, response_type, options)
+        key: _Key = (request.app_id, request.merchant_id, transaction_request_id)
+        fingerprint = _fingerprint(self._http._serialize_request_body(request))
+
+        if self._pid != os.getpid():
+            # Calls in flight in the parent do not exist in a forked child.
+            self._in_flight = {}
+            self._pid = os.getpid()
+        with self._lock:
+            joined = self._in_flight.get(key)
+            if joined is None:
+                future: "Future[BaseResponse]" = Future()
+                self._in_flight[key] = (path, fingerprint, future)
+        if joined is not None:
+            if joined[0] != path:
+                raise SunbayBusinessError(f"transaction_request_id {transaction_request_id} is in use by {joined[0]}")
+            if joined[1] != fingerprint:
+                raise SunbayBusinessError(
+                    f"transaction_request_id {transaction_request_id} is in use by a different request"
+                )
+            self._logger.debug("Joining in-flight %s %s", path, transaction_request_id)
+            return joined[2].result()  # type: ignore[return-value]
+
+        try:
+            response = self._submit(key, path, fingerprint, request, response_type, options)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        future.set_result(response)
+        return response
+
+    def resolve_pending(self, older_than: Optional[float] = None) -> List[JournalEntry]:
+        """
+        Resolve PENDING entries not updated for ``older_than`` seconds
+        (default: the client's connect + read timeout) with ``query``.
+        Returns the entries afterwards: COMPLETED when Nexus has the
+        transaction, REJECTED when it does not, still PENDING when ``query``
+        failed.
+        """
+        if older_than is None:
+            older_than = self._lease()
+        with self._lock:
+            in_flight = set(self._in_flight)
+        resolved: List[JournalEntry] = []
+        for entry in self._journal.pending(older_than):
+            if entry.key in in_flight:
+                continue
+            try:
+                response = self._resolve(entry.key, JOURNALED_PATHS.get(entry.path, BaseResponse))
+            except SunbayError as exc:
+                self._logger.warning("Could not resolve %s %s: %s", entry.path, entry.transaction_request_id, exc)
+            else:
+                if response is None:
+                    self._journal.record(entry.key, JournalState.REJECTED, error="Not found by query")
+            resolved.append(self._journal.get(entry.key) or entry)
+        return resolved
+
+    def _owner(self) -> str:
+        # Unique per call: other clients of this process may share the journal.
+        return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+
+    def _lease(self) -> float:
+        # Longest time a live owner can still be waiting for its POST.
+        return self._http._connect_timeout + self._http._read_timeout + self._journal.resolve_delay
+
+    def _submit(
+        self, key: _Key, path: str, fingerprint: str, request: Any, response_type: Type[T], options: Any
+    ) -> T:
+        journal = self._journal
+        owner = self._owner()
+        while True:
+            entry = journal.claim(key, path, owner, fingerprint)
+            if entry is None:
+                return self._send(key, path, request, response_type, options)
+            if entry.path != path:
+                raise SunbayBusinessError(f"transaction_request_id {key[2]} was already used for {entry.path}")
+            if entry.fingerprint is not None and entry.fingerprint != fingerprint:
+                raise SunbayBusinessError(f"transaction_request_id {key[2]} was already used for a different request")
+            if entry.state == JournalState.COMPLETED:
+                self._logger.debug("Returning recorded response of %s %s", path, key[2])
+                return decode_response(json.loads(entry.response or "{}"), response_type)
+            remaining = entry.updated_at + self._lease() - time.time()
+            if remaining > 0:
+                # Another caller may be sending it right now: wait for its outcome.
+                time.sleep(min(remaining, _POLL_INTERVAL))
+                continue
+            # PENDING past its lease: a crash or an unknown outcome.
+            response = self._resolve(key, response_type)
+            if response is not None:
+                return response
+            if journal.take_over(entry, owner):
+                self._logger.info("Resubmitting %s %s: not found by query", path, key[2])
+                return self._send(key, path, request, response_type, options)
+
+    def _send(self, key: _Key, path: str, request: Any, response_type: Type[T], options: Any) -> T:
+        journal = self._journal
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._http.post(path, request, response_type, options)
+            except (SunbayCircuitOpenError, SunbayRateLimitedError) as exc:
+                # Failed fast: nothing was sent.
+                journal.record(key, JournalState.REJECTED, error=_describe(exc))
+                raise
+            except SunbayBusinessError as exc:
+                journal.record(key, JournalState.REJECTED, error=_describe(exc))
+                raise
+            except SunbayNetworkError as exc:
+                status = exc.status_code
+                if status is not None and status < 500:
+                    # A 4xx answer means the transaction was not created.
+                    if status == 429 and attempt < journal.max_attempts:
+                        time.sleep(journal.resolve_delay)
+                        continue
+                    journal.record(key, JournalState.REJECTED, error=_describe(exc))
+                    raise
+                if attempt >= journal.max_attempts:
+                    raise
+                self._logger.info("Outcome of %s %s unknown (%s), resolving with query", path, key[2], exc.args[0])
+                time.sleep(journal.resolve_delay)
+                try:
+                    resolved = self._resolve(key, response_type)
+                except SunbayError:
+                    raise exc from None
+                if resolved is not None:
+                    return resolved
+                self._logger.info("Resubmitting %s %s: not found by query", path, key[2])
+                continue
+            journal.record(key, JournalState.COMPLETED, response=_encode_response(response))
+            return response
+
+    def _resolve(self, key: _Key, response_type: Type[T]) -> Optional[T]:
+        # The transaction as Nexus knows it, recorded as COMPLETED, or None
+        # when Nexus has no such transaction.
+        query = QueryRequest(app_id=key[0], merchant_id=key[1], transaction_request_id=key[2])
+        try:
+            found = self._client.query(query)
+        except SunbayBusinessError as exc:
+            if exc.code in self._journal.not_found_codes:
+                return None
+            raise
+        response = decode_response({"data": to_primitive(found)}, response_type)
+        self._journal.record(key, JournalState.COMPLETED, response=_encode_response(response))
+        return response
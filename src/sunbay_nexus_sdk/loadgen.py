@@ -0,0 +1,434 @@
+"""
+Open-loop load generator for Sunbay Nexus integrations.
+
+Drives a mix of ``sale``, ``query``, ``refund``, ``batch_query`` and
+``create_checkout_session`` calls through a real NexusClient at a target
+rate, then reports throughput, latency percentiles per endpoint, an error
+breakdown and connection pool saturation:
+
+    python -m sunbay_nexus_sdk.loadgen --rps 200 --duration 60 --workers 64 \\
+        --mix sale=4,query=4,refund=1,batch_query=1 --json results.json
+
+Calls are scheduled at fixed (or Poisson) arrival times independent of how
+fast earlier calls complete. Latency is measured from the scheduled time, so
+time spent queued behind busy workers counts (no coordinated omission);
+``queue`` shows that part separately.
+
+Every call is a real API call: point ``SUNBAY_BASE_URL`` (or ``--base-url``)
+at a sandbox or at ``python -m sunbay_nexus_sdk.testing.stub_server``.
+Running against the production URL requires ``--allow-production``.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .client import NexusClient
+from .constants import DEFAULT_BASE_URL, DEFAULT_CONNECT_TIMEOUT, DEFAULT_MAX_CONNECTIONS, DEFAULT_READ_TIMEOUT
+from .exceptions import SunbayBusinessError, SunbayCircuitOpenError, SunbayNetworkError
+from .http.metrics import MetricsRegistry
+from .models.common import CheckoutAmount, CheckoutProductItem, RefundAmount, SaleAmount
+from .models.request import (
+    BatchQueryRequest,
+    CreateCheckoutSessionRequest,
+    QueryRequest,
+    RefundRequest,
+    SaleRequest,
+)
+from .utils.id_generator import generate_request_id
+
+ENDPOINTS = ("sale", "query", "refund", "batch_query", "create_checkout_session")
+DEFAULT_MIX = "sale=4,query=4,refund=1,batch_query=1"
+PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+# Transaction ids returned by sales, used by later queries and refunds.
+_RECENT_TRANSACTIONS = 10_000
+
+
+class _Monitor(MetricsRegistry):
+    """
+    MetricsRegistry that also keeps totals for the report: retries, peak pool
+    usage and checkout waits.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.retries = 0
+        self.peak_in_use = 0
+        self.max_size = 0
+        self.checkouts = 0
+        self.waited = 0
+        self.max_wait = 0.0
+
+    def record_pool_checkout(self, pool: str, wait: float, in_use: int, max_size: int) -> None:
+        super().record_pool_checkout(pool, wait, in_use, max_size)
+        with self._lock:
+            self.checkouts += 1
+            self.peak_in_use = max(self.peak_in_use, in_use)
+            self.max_size = max_size
+            if wait >= 0.001:
+                self.waited += 1
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_retry(self, path: str, method: str) -> None:
+        super().record_retry(path, method)
+        with self._lock:
+            self.retries += 1
+
+
+class _Requests:
+    """
+    Builds a fresh request for each endpoint (unique transaction_request_id).
+    """
+
+    def __init__(self, app_id: str, merchant_id: str, terminal_sn: str) -> None:
+        self._app_id = app_id
+        self._merchant_id = merchant_id
+        self._terminal_sn = terminal_sn
+        self._transactions: Deque[str] = deque(maxlen=_RECENT_TRANSACTIONS)
+
+    def remember(self, transaction_id: Optional[str]) -> None:
+        if transaction_id:
+            self._transactions.append(transaction_id)
+
+    def _recent(self) -> str:
+        try:
+            return random.choice(self._transactions)
+        except IndexError:
+            return "TXN_LOADGEN_UNKNOWN"
+
+    def build(self, endpoint: str) -> Any:
+        common = dict(app_id=self._app_id, merchant_id=self._merchant_id)
+        request_id = generate_request_id()
+        if endpoint == "sale":
+            return SaleRequest(
+                reference_order_id=f"LOAD{request_id[:16]}",
+                transaction_request_id=request_id,
+                amount=SaleAmount(order_amount=100, price_currency="USD"),
+                description="loadgen sale",
+                terminal_sn=self._terminal_sn,
+                **common,
+            )
+        if endpoint == "query":
+            return QueryRequest(transaction_id=self._recent(), **common)
+        if endpoint == "refund":
+            return RefundRequest(
+                transaction_request_id=request_id,
+                amount=RefundAmount(order_amount=100, price_currency="USD"),
+                original_transaction_id=self._recent(),
+                terminal_sn=self._terminal_sn,
+                **common,
+            )
+        if endpoint == "batch_query":
+            return BatchQueryRequest(terminal_sn=self._terminal_sn, **common)
+        return CreateCheckoutSessionRequest(
+            transaction_request_id=request_id,
+            reference_order_id=f"LOAD{request_id[:16]}",
+            amount=CheckoutAmount(order_amount=100, price_currency="USD"),
+            product_list=[CheckoutProductItem(amount=100, name="loadgen item", num=1)],
+            description="loadgen checkout",
+            **common,
+        )
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {endpoint: [] for endpoint in ENDPOINTS}
+        self.queue_delays: List[float] = []
+        self.ok: Counter = Counter()
+        self.errors: Dict[str, Counter] = {endpoint: Counter() for endpoint in ENDPOINTS}
+
+    def record(self, endpoint: str, latency: float, queued: float, error: Optional[str]) -> None:
+        with self._lock:
+            self.latencies[endpoint].append(latency)
+            self.queue_delays.append(queued)
+            if error is None:
+                self.ok[endpoint] += 1
+            else:
+                self.errors[endpoint][error] += 1
+
+
+def _classify(exc: BaseException) -> str:
+    if isinstance(exc, SunbayCircuitOpenError):
+        return "circuit_open"
+    if isinstance(exc, SunbayBusinessError):
+        return f"business:{exc.code}" if exc.code is not None else "validation"
+    if isinstance(exc, SunbayNetworkError):
+        if exc.status_code is not None:
+            return f"http:{exc.status_code}"
+        cause = exc.__cause__
+        return f"network:{type(cause).__name__}" if cause is not None else "network"
+    return type(exc).__name__
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse ``"sale=4,query=4,refund=1"`` into endpoint weights.
+    """
+    mix: Dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {name!r}; choose from {', '.join(ENDPOINTS)}")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight in {part!r}")
+    if not mix or sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("the mix needs at least one endpoint with a positive weight")
+    return mix
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values (0.0 when empty).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _latency_summary(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    summary = {f"p{pct:g}": percentile(values, pct) for pct in PERCENTILES}
+    summary["max"] = values[-1] if values else 0.0
+    summary["mean"] = sum(values) / len(values) if values else 0.0
+    return summary
+
+
+def run(
+    client: NexusClient,
+    requests: _Requests,
+    mix: Dict[str, float],
+    rps: float,
+    duration: float,
+    workers: int,
+    arrival: str = "constant",
+    max_backlog: Optional[int] = None,
+) -> Tuple[_Recorder, float, int]:
+    """
+    Issue calls for ``duration`` seconds; return (recorder, elapsed, dropped).
+
+    Calls that would exceed ``max_backlog`` queued calls are dropped and counted.
+    """
+    endpoints = list(mix)
+    weights = [mix[name] for name in endpoints]
+    jobs: "queue.Queue[Optional[Tuple[float, str]]]" = queue.Queue()
+    recorder = _Recorder()
+    backlog = max_backlog if max_backlog is not None else max(workers * 100, 1000)
+
+    def worker() -> None:
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            scheduled, endpoint = job
+            started = time.monotonic()
+            error = None
+            try:
+                response = getattr(client, endpoint)(requests.build(endpoint))
+                if endpoint == "sale":
+                    requests.remember(response.transaction_id)
+            except Exception as exc:  # noqa: BLE001 - every failure is reported, not raised
+                error = _classify(exc)
+            finished = time.monotonic()
+            recorder.record(endpoint, finished - scheduled, started - scheduled, error)
+
+    threads = [threading.Thread(target=worker, name=f"sunbay-loadgen-{i}", daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    dropped = 0
+    start = time.monotonic()
+    next_at = start
+    end = start + duration
+    while next_at < end:
+        delay = next_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        if jobs.qsize() >= backlog:
+            dropped += 1
+        else:
+            jobs.put((next_at, random.choices(endpoints, weights)[0]))
+        next_at += random.expovariate(rps) if arrival == "poisson" else 1.0 / rps
+
+    for _ in threads:
+        jobs.put(None)
+    for thread in threads:
+        thread.join()
+    return recorder, time.monotonic() - start, dropped
+
+
+def build_report(
+    recorder: _Recorder, elapsed: float, dropped: int, monitor: _Monitor, config: Dict[str, Any]
+) -> Dict[str, Any]:
+    endpoints = {}
+    errors: Counter = Counter()
+    total = ok = 0
+    for endpoint in ENDPOINTS:
+        count = len(recorder.latencies[endpoint])
+        if not count:
+            continue
+        endpoint_errors = recorder.errors[endpoint]
+        errors.update(endpoint_errors)
+        total += count
+        ok += recorder.ok[endpoint]
+        endpoints[endpoint] = {
+            "count": count,
+            "ok": recorder.ok[endpoint],
+            "errors": dict(endpoint_errors),
+            "throughput": count / elapsed if elapsed else 0.0,
+            "latency": _latency_summary(recorder.latencies[endpoint]),
+        }
+    return {
+        "config": config,
+        "elapsed": elapsed,
+        "requests": total,
+        "ok": ok,
+        "dropped": dropped,
+        "throughput": total / elapsed if elapsed else 0.0,
+        "retries": monitor.retries,
+        "queue": _latency_summary(recorder.queue_delays),
+        "endpoints": endpoints,
+        "errors": dict(errors.most_common()),
+        "pool": {
+            "max_connections": monitor.max_size,
+            "peak_in_use": monitor.peak_in_use,
+            "checkouts": monitor.checkouts,
+            "waited": monitor.waited,
+            "max_wait": monitor.max_wait,
+        },
+    }
+
+
+def print_report(report: Dict[str, Any], out: Callable[[str], Any] = print) -> None:
+    out(
+        f"{report['requests']} calls in {report['elapsed']:.1f}s: {report['throughput']:.1f}/s, "
+        f"{report['ok']} ok, {report['requests'] - report['ok']} failed, "
+        f"{report['dropped']} dropped, {report['retries']} retries"
+    )
+    header = f"{'endpoint':<26}{'count':>8}{'errors':>8}{'rps':>9}"
+    header += "".join(f"{'p' + format(p, 'g'):>10}" for p in PERCENTILES) + f"{'max':>10}"
+    out(header + "   (latency ms)")
+    rows = list(report["endpoints"].items()) + [("(queue wait)", None)]
+    for name, stats in rows:
+        latency = stats["latency"] if stats else report["queue"]
+        line = f"{name:<26}"
+        if stats:
+            line += f"{stats['count']:>8}{stats['count'] - stats['ok']:>8}{stats['throughput']:>9.1f}"
+        else:
+            line += f"{'':>25}"
+        line += "".join(f"{latency['p' + format(p, 'g')] * 1000:>10.1f}" for p in PERCENTILES)
+        out(line + f"{latency['max'] * 1000:>10.1f}")
+    if report["errors"]:
+        out("errors: " + ", ".join(f"{name}={count}" for name, count in report["errors"].items()))
+    pool = report["pool"]
+    if pool["checkouts"]:
+        out(
+            f"pool: peak {pool['peak_in_use']}/{pool['max_connections']} connections in use, "
+            f"{pool['waited']} of {pool['checkouts']} checkouts waited (max {pool['max_wait'] * 1000:.1f} ms)"
+        )
+        if pool["peak_in_use"] > pool["max_connections"]:
+            out("pool: more connections in use than max_connections; the extra ones are opened per call and discarded")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m sunbay_nexus_sdk.loadgen",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--rps", type=float, default=50.0, help="target calls per second (default: 50)")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to generate load (default: 30)")
+    parser.add_argument("--workers", type=int, default=32, help="concurrent worker threads (default: 32)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"default: {DEFAULT_MIX}")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="constant", help="arrival process")
+    parser.add_argument("--max-backlog", type=int, help="queued calls before new ones are dropped")
+    parser.add_argument("--base-url", help="API base URL (SUNBAY_BASE_URL takes precedence, as for NexusClient)")
+    parser.add_argument("--api-key", default=os.getenv("SUNBAY_API_KEY") or "sk_loadgen", help="API key")
+    parser.add_argument("--app-id", default="app_loadgen")
+    parser.add_argument("--merchant-id", default="mch_loadgen")
+    parser.add_argument("--terminal-sn", default="T_LOADGEN")
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS)
+    parser.add_argument("--connect-timeout", type=float, default=DEFAULT_CONNECT_TIMEOUT)
+    parser.add_argument("--read-timeout", type=float, default=DEFAULT_READ_TIMEOUT)
+    parser.add_argument("--max-retries", type=int, help="client max_retries (default: SDK default)")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON ('-' for stdout)")
+    parser.add_argument("--seed", type=int, help="random seed for the endpoint mix and arrivals")
+    parser.add_argument(
+        "--sdk-log-level", default="CRITICAL", help="level of the SDK's own loggers during the run (default: CRITICAL)"
+    )
+    parser.add_argument("--allow-production", action="store_true", help=f"allow running against {DEFAULT_BASE_URL}")
+    args = parser.parse_args(argv)
+
+    if args.rps <= 0 or args.duration <= 0 or args.workers <= 0:
+        parser.error("--rps, --duration and --workers must be positive")
+    if args.seed is not None:
+        random.seed(args.seed)
+    # Failed calls are already counted in the report; do not log each one.
+    logging.getLogger("sunbay_nexus_sdk").setLevel(args.sdk_log_level.upper())
+
+    monitor = _Monitor()
+    client_kwargs: Dict[str, Any] = dict(
+        api_key=args.api_key,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        max_connections=args.max_connections,
+        metrics=monitor,
+    )
+    if args.base_url:
+        client_kwargs["base_url"] = args.base_url
+    if args.max_retries is not None:
+        client_kwargs["max_retries"] = args.max_retries
+
+    with NexusClient(**client_kwargs) as client:
+        base_url = client._http_client._base_url
+        if base_url.rstrip("/") == DEFAULT_BASE_URL and not args.allow_production:
+            parser.error(
+                f"refusing to generate load against {DEFAULT_BASE_URL}; set SUNBAY_BASE_URL or --base-url "
+                "(or pass --allow-production)"
+            )
+        config = {
+            "base_url": base_url,
+            "rps": args.rps,
+            "duration": args.duration,
+            "workers": args.workers,
+            "mix": args.mix,
+            "arrival": args.arrival,
+            "max_connections": args.max_connections,
+            "connect_timeout": args.connect_timeout,
+            "read_timeout": args.read_timeout,
+            "max_retries": args.max_retries,
+        }
+        requests = _Requests(args.app_id, args.merchant_id, args.terminal_sn)
+        recorder, elapsed, dropped = run(
+            client, requests, args.mix, args.rps, args.duration, args.workers, args.arrival, args.max_backlog
+        )
+
+    report = build_report(recorder, elapsed, dropped, monitor, config)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+        return 0
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+            fp.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,62 @@
 Base models for Sunbay Nexus SDK.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Any, Optional, Sequence
 
 from ..constants import RESPONSE_SUCCESS_CODE
 
 
+def slotted(cls: Optional[type] = None, *, extra: Sequence[str] = ()) -> Any:
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields (plus ``extra``).
+
+    Instances then have no per-instance ``__dict__``, which saves about
+    5-33% of their memory (17% for QueryResponse, see
+    ``benchmarks/bench_memory.py``). ``dataclass(slots=True)`` does the same
+    but needs Python 3.10+. Apply it above ``@dataclass``; constructors,
+    defaults, attribute names, ``fields``/``asdict``/``replace``, copy and
+    pickle keep working.
+    Arbitrary attributes can no longer be set on instances.
+    """
+
+    def wrap(cls: type) -> type:
+        if "__slots__" in cls.__dict__:
+            raise TypeError(f"{cls.__name__} already defines __slots__")
+        inherited = set()
+        for base in cls.__mro__[1:-1]:
+            inherited.update(base.__dict__.get("__slots__", ()))
+        names = [f.name for f in fields(cls)] + list(extra)
+        cls_dict = dict(cls.__dict__)
+        cls_dict["__slots__"] = tuple(name for name in names if name not in inherited)
+        # Class-level defaults would shadow the slot descriptors; the
+        # generated __init__ keeps its own copy of them.
+        for name in names:
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+def _call_meta(slot: str, doc: str) -> property:
+    """
+    Property over a private slot holding call metadata; None until the HTTP client sets it.
+    """
+
+    def get(self: Any) -> Any:
+        return getattr(self, slot, None)
+
+    def set_(self: Any, value: Any) -> None:
+        object.__setattr__(self, slot, value)
+
+    return property(get, set_, doc=doc)
+
+
+@slotted(extra=("_retry_stats", "_client_request_id", "_elapsed"))
 @dataclass
 class BaseResponse:
     """
@@ -18,10 +68,14 @@ class BaseResponse:
     msg: Optional[str] = None
     trace_id: Optional[str] = None
 
+    # Call metadata set by the HTTP client. These are not dataclass fields, so
+    # they do not appear in repr, eq or asdict.
+    retry_stats = _call_meta("_retry_stats", "Retry bookkeeping (RetryStats) of the call.")
+    client_request_id = _call_meta("_client_request_id", "X-Client-Request-Id sent with the call.")
+    elapsed = _call_meta("_elapsed", "Total call duration in seconds, including retries.")
+
     def is_success(self) -> bool:
         """
         Return True if the API call is considered successful.
         """
         return self.code == RESPONSE_SUCCESS_CODE
-
-
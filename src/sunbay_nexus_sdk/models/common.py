@@ -5,7 +5,10 @@ Common value objects shared across multiple requests and responses.
 from dataclasses import dataclass
 from typing import List, Optional
 
+from .base import slotted
 
+
+@slotted
 @dataclass
 class Amount:
     """
@@ -25,6 +28,7 @@ class Amount:
     cashback_amount: Optional[int] = None
 
 
+@slotted
 @dataclass
 class TipSuggestions:
     """
@@ -39,6 +43,7 @@ class TipSuggestions:
     values: List[int]
 
 
+@slotted
 @dataclass
 class TipConfig:
     """
@@ -56,6 +61,7 @@ class TipConfig:
     suggestions: Optional[TipSuggestions] = None
 
 
+@slotted
 @dataclass
 class SaleAmount:
     """
@@ -73,6 +79,7 @@ class SaleAmount:
     tip_config: Optional[TipConfig] = None
 
 
+@slotted
 @dataclass
 class AuthAmount:
     """
@@ -85,6 +92,7 @@ class AuthAmount:
     price_currency: str
 
 
+@slotted
 @dataclass
 class PostAuthAmount:
     """
@@ -101,6 +109,7 @@ class PostAuthAmount:
     tip_config: Optional[TipConfig] = None
 
 
+@slotted
 @dataclass
 class RefundAmount:
     """
@@ -117,6 +126,7 @@ class RefundAmount:
     cashback_amount: Optional[int] = None
 
 
+@slotted
 @dataclass
 class PaymentMethodInfo:
     """
@@ -137,6 +147,7 @@ class PaymentMethodInfo:
     sub_id: Optional[str] = None
 
 
+@slotted
 @dataclass
 class CheckoutAmount:
     """
@@ -152,6 +163,7 @@ class CheckoutAmount:
     surcharge_amount: Optional[int] = None
 
 
+@slotted
 @dataclass
 class CheckoutProductItem:
     """
@@ -165,6 +177,7 @@ class CheckoutProductItem:
     num: int
 
 
+@slotted
 @dataclass
 class CheckoutAddress:
     """
@@ -179,6 +192,7 @@ class CheckoutAddress:
     country: Optional[str] = None
 
 
+@slotted
 @dataclass
 class BatchQueryItem:
     """
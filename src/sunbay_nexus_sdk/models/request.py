@@ -5,6 +5,7 @@ Request models for Sunbay Nexus SDK.
 from dataclasses import dataclass
 from typing import List, Optional
 
+from .base import slotted
 from .common import (
     AuthAmount,
     CheckoutAddress,
@@ -17,6 +18,7 @@ from .common import (
 )
 
 
+@slotted
 @dataclass
 class SaleRequest:
     """
@@ -40,6 +42,7 @@ class SaleRequest:
     card_network_type: Optional[str] = None
 
 
+@slotted
 @dataclass
 class AuthRequest:
     """
@@ -63,6 +66,7 @@ class AuthRequest:
     card_network_type: Optional[str] = None
 
 
+@slotted
 @dataclass
 class ForcedAuthRequest:
     """
@@ -86,6 +90,7 @@ class ForcedAuthRequest:
     card_network_type: Optional[str] = None
 
 
+@slotted
 @dataclass
 class IncrementalAuthRequest:
     """
@@ -108,6 +113,7 @@ class IncrementalAuthRequest:
     push_to_terminal: bool = True
 
 
+@slotted
 @dataclass
 class QueryRequest:
     """
@@ -121,6 +127,7 @@ class QueryRequest:
     transaction_request_id: Optional[str] = None
 
 
+@slotted
 @dataclass
 class PostAuthRequest:
     """
@@ -144,6 +151,7 @@ class PostAuthRequest:
     push_to_terminal: bool = True
 
 
+@slotted
 @dataclass
 class RefundRequest:
     """
@@ -171,6 +179,7 @@ class RefundRequest:
     card_network_type: Optional[str] = None
 
 
+@slotted
 @dataclass
 class BatchCloseRequest:
     """
@@ -185,6 +194,7 @@ class BatchCloseRequest:
     description: Optional[str] = None
 
 
+@slotted
 @dataclass
 class BatchQueryRequest:
     """
@@ -196,6 +206,7 @@ class BatchQueryRequest:
     terminal_sn: str
 
 
+@slotted
 @dataclass
 class VoidRequest:
     """
@@ -217,6 +228,7 @@ class VoidRequest:
     push_to_terminal: bool = True
 
 
+@slotted
 @dataclass
 class AbortRequest:
     """
@@ -232,6 +244,7 @@ class AbortRequest:
     attach: Optional[str] = None
 
 
+@slotted
 @dataclass
 class TipAdjustRequest:
     """
@@ -249,6 +262,7 @@ class TipAdjustRequest:
     attach: Optional[str] = None
 
 
+@slotted
 @dataclass
 class CreateCheckoutSessionRequest:
     """
@@ -271,6 +285,7 @@ class CreateCheckoutSessionRequest:
     notify_url: Optional[str] = None
 
 
+@slotted
 @dataclass
 class CheckoutSaleRequest:
     """
@@ -5,10 +5,11 @@ Response models for Sunbay Nexus SDK.
 from dataclasses import dataclass
 from typing import Optional, List
 
-from .base import BaseResponse
+from .base import BaseResponse, slotted
 from .common import Amount, BatchQueryItem
 
 
+@slotted
 @dataclass
 class SaleResponse(BaseResponse):
     """
@@ -21,6 +22,7 @@ class SaleResponse(BaseResponse):
     transaction_status: Optional[str] = None
 
 
+@slotted
 @dataclass
 class AuthResponse(BaseResponse):
     """
@@ -33,6 +35,7 @@ class AuthResponse(BaseResponse):
     transaction_status: Optional[str] = None
 
 
+@slotted
 @dataclass
 class ForcedAuthResponse(BaseResponse):
     """
@@ -45,6 +48,7 @@ class ForcedAuthResponse(BaseResponse):
     transaction_status: Optional[str] = None
 
 
+@slotted
 @dataclass
 class IncrementalAuthResponse(BaseResponse):
     """
@@ -57,6 +61,7 @@ class IncrementalAuthResponse(BaseResponse):
     transaction_status: Optional[str] = None
 
 
+@slotted
 @dataclass
 class PostAuthResponse(BaseResponse):
     """
@@ -71,6 +76,7 @@ class PostAuthResponse(BaseResponse):
     original_transaction_request_id: Optional[str] = None
 
 
+@slotted
 @dataclass
 class RefundResponse(BaseResponse):
     """
@@ -85,6 +91,7 @@ class RefundResponse(BaseResponse):
     original_transaction_request_id: Optional[str] = None
 
 
+@slotted
 @dataclass
 class VoidResponse(BaseResponse):
     """
@@ -98,6 +105,7 @@ class VoidResponse(BaseResponse):
     original_transaction_request_id: Optional[str] = None
 
 
+@slotted
 @dataclass
 class AbortResponse(BaseResponse):
     """
@@ -109,6 +117,7 @@ class AbortResponse(BaseResponse):
     original_transaction_request_id: Optional[str] = None
 
 
+@slotted
 @dataclass
 class TipAdjustResponse(BaseResponse):
     """
@@ -122,6 +131,7 @@ class TipAdjustResponse(BaseResponse):
     tip_amount: Optional[int] = None
 
 
+@slotted
 @dataclass
 class QueryResponse(BaseResponse):
     """
@@ -154,6 +164,7 @@ class QueryResponse(BaseResponse):
     attach: Optional[str] = None
 
 
+@slotted
 @dataclass
 class BatchCloseResponse(BaseResponse):
     """
@@ -173,6 +184,7 @@ class BatchCloseResponse(BaseResponse):
     tax_amount: Optional[int] = None
 
 
+@slotted
 @dataclass
 class BatchQueryResponse(BaseResponse):
     """
@@ -184,6 +196,7 @@ class BatchQueryResponse(BaseResponse):
     batch_list: Optional[List[BatchQueryItem]] = None
 
 
+@slotted
 @dataclass
 class CreateCheckoutSessionResponse(BaseResponse):
     """
@@ -208,6 +221,7 @@ class CreateCheckoutSessionResponse(BaseResponse):
     notify_url: Optional[str] = None
 
 
+@slotted
 @dataclass
 class CheckoutSaleResponse(BaseResponse):
     """
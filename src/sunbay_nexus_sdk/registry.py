@@ -0,0 +1,276 @@
+"""
+Multi-tenant client registry for platforms calling Nexus for many merchants.
+
+Every NexusClient normally owns a requests Session with its own connection
+pool, so one client per API key multiplies sockets, memory and TLS
+handshakes. ClientRegistry keeps a single Session (one SunbayHTTPAdapter, one
+pool per host) and hands out per-tenant NexusClient objects that reuse it
+while keeping their own API key, base URL, timeouts, retry policy and circuit
+breakers. Built clients are cached with LRU eviction and an optional idle
+timeout; an evicted tenant's client is simply rebuilt on its next ``get``.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from requests import Session
+
+from .client import NexusClient, _PinnedBaseUrl
+from .constants import DEFAULT_BASE_URL, DEFAULT_CONNECT_TIMEOUT, DEFAULT_MAX_CONNECTIONS
+from .exceptions import SunbayBusinessError, SunbayNetworkError
+from .http.adapter import SunbayHTTPAdapter
+from .http.metrics import MetricsHook
+from .http.pool import PoolConfig
+
+# NexusClient arguments that may differ per tenant (besides api_key / base_url).
+TENANT_SETTINGS = frozenset(
+    (
+        "connect_timeout",
+        "read_timeout",
+        "max_retries",
+        "logger",
+        "json_codec",
+        "retry_policy",
+        "circuit_breaker",
+        "logging_policy",
+        "metrics",
+        "hooks",
+        "hedge_policy",
+        "coalescer",
+        "rate_limiter",
+        "journal",
+        "query_cache",
+    )
+)
+
+# Settings holding state of the calls made through them. Shared by every
+# tenant as a registry default, they would mix tenants (a QueryCache is keyed
+# by app and merchant id, not by API key), so they are only set per tenant.
+PER_TENANT_ONLY_SETTINGS = frozenset(("coalescer", "rate_limiter", "journal", "query_cache"))
+
+
+class _Tenant(NamedTuple):
+    api_key: str
+    base_url: str
+    settings: Dict[str, Any]
+
+
+class _Entry:
+    __slots__ = ("client", "last_used")
+
+    def __init__(self, client: NexusClient, last_used: float) -> None:
+        self.client = client
+        self.last_used = last_used
+
+
+class ClientRegistry:
+    """
+    Hands out per-tenant NexusClient objects sharing one connection pool.
+
+    Args:
+        base_url: Default base URL for tenants that do not set their own.
+            SUNBAY_BASE_URL overrides this default, never a tenant's own URL.
+        max_connections: Connections kept per host, shared by all tenants.
+        pool_config: Pool settings of the shared adapter. Defaults to
+            ``PoolConfig(block=True)`` so ``max_connections`` is a hard cap:
+            callers wait for a free connection instead of opening extra ones.
+        metrics: Hook for pool metrics of the shared adapter; also the
+            default ``metrics`` of every tenant.
+        max_clients: Built clients kept at most; the least recently used
+            one is evicted beyond that.
+        idle_timeout: Seconds after which an unused client is evicted
+            (None: only LRU eviction).
+        **defaults: NexusClient settings applied to every tenant (see
+            TENANT_SETTINGS, except PER_TENANT_ONLY_SETTINGS); ``register``
+            can override them per tenant.
+
+    Example:
+        registry = ClientRegistry(max_connections=50, read_timeout=30.0)
+        registry.register("merchant-1", api_key="sk_live_1")
+        registry.get("merchant-1").sale(request)
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        pool_config: Optional[PoolConfig] = None,
+        metrics: Optional[MetricsHook] = None,
+        max_clients: int = 256,
+        idle_timeout: Optional[float] = None,
+        **defaults: Any,
+    ) -> None:
+        if max_clients < 1:
+            raise SunbayBusinessError("max_clients must be at least 1")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise SunbayBusinessError("idle_timeout must be positive")
+        _check_settings(defaults)
+        shared = sorted(set(defaults) & PER_TENANT_ONLY_SETTINGS)
+        if shared:
+            raise SunbayBusinessError(f"Per-tenant setting(s) cannot be registry defaults: {', '.join(shared)}")
+        if metrics is not None:
+            defaults.setdefault("metrics", metrics)
+
+        # NexusClient lets SUNBAY_BASE_URL override base_url; do the same here,
+        # for the default only: a tenant's own base_url always wins.
+        self._base_url = os.getenv("SUNBAY_BASE_URL") or base_url
+        self._max_connections = max_connections
+        self._max_clients = max_clients
+        self._idle_timeout = idle_timeout
+        self._defaults = defaults
+        self._logger: logging.Logger = defaults.get("logger") or logging.getLogger("sunbay_nexus_sdk.registry")
+
+        self._session = Session()
+        self._adapter = SunbayHTTPAdapter(
+            pool_config or PoolConfig(block=True), metrics=metrics, pool_maxsize=max_connections
+        )
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._tenants: Dict[str, _Tenant] = {}
+        self._clients: "OrderedDict[str, _Entry]" = OrderedDict()
+
+    def register(self, tenant_id: str, api_key: str, base_url: Optional[str] = None, **settings: Any) -> None:
+        """
+        Add or replace a tenant. ``settings`` override the registry defaults
+        for this tenant only. A cached client of a replaced tenant is dropped.
+        """
+        if not api_key:
+            raise SunbayBusinessError("API key cannot be null or empty")
+        _check_settings(settings)
+        tenant = _Tenant(api_key, base_url or self._base_url, dict(self._defaults, **settings))
+        with self._lock:
+            self._tenants[tenant_id] = tenant
+            entry = self._clients.pop(tenant_id, None)
+        if entry is not None:
+            _discard(entry.client)
+
+    def unregister(self, tenant_id: str) -> None:
+        """
+        Remove a tenant and its cached client. Unknown tenants are ignored.
+        """
+        with self._lock:
+            self._tenants.pop(tenant_id, None)
+            entry = self._clients.pop(tenant_id, None)
+        if entry is not None:
+            _discard(entry.client)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        return tenant_id in self._tenants
+
+    def get(self, tenant_id: str) -> NexusClient:
+        """
+        Return the tenant's client, building it on first use or after eviction.
+
+        Raises:
+            SunbayBusinessError: if the tenant is not registered or the registry is closed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                raise SunbayBusinessError("ClientRegistry is closed")
+            entry = self._clients.get(tenant_id)
+            if entry is not None:
+                entry.last_used = now
+                self._clients.move_to_end(tenant_id)
+                client = entry.client
+            else:
+                tenant = self._tenants.get(tenant_id)
+                if tenant is None:
+                    raise SunbayBusinessError(f"Unknown tenant: {tenant_id}")
+                client = NexusClient(
+                    api_key=tenant.api_key,
+                    base_url=_PinnedBaseUrl(tenant.base_url),
+                    max_connections=self._max_connections,
+                    session=self._session,
+                    **tenant.settings,
+                )
+                self._clients[tenant_id] = _Entry(client, now)
+            evicted = self._evict(now)
+        for old in evicted:
+            _discard(old)
+        return client
+
+    def _evict(self, now: float) -> List[NexusClient]:
+        # Called with the lock held; the OrderedDict is in LRU order.
+        evicted: List[NexusClient] = []
+        while len(self._clients) > self._max_clients:
+            tenant_id, entry = self._clients.popitem(last=False)
+            evicted.append(entry.client)
+            self._logger.debug("Evicted client of tenant %s (LRU)", tenant_id)
+        if self._idle_timeout is not None:
+            while self._clients:
+                tenant_id, entry = next(iter(self._clients.items()))
+                if now - entry.last_used <= self._idle_timeout:
+                    break
+                del self._clients[tenant_id]
+                evicted.append(entry.client)
+                self._logger.debug("Evicted client of tenant %s (idle)", tenant_id)
+        return evicted
+
+    @property
+    def cached_clients(self) -> int:
+        """
+        Number of built clients currently cached.
+        """
+        return len(self._clients)
+
+    def warm_up(self, connections: int = 1, base_url: Optional[str] = None) -> int:
+        """
+        Open up to ``connections`` shared connections to ``base_url`` (default:
+        the registry's). Returns how many were opened.
+
+        Raises:
+            SunbayNetworkError: when no connection could be opened.
+        """
+        url = (base_url or self._base_url).rstrip("/")
+        settings = self._session.merge_environment_settings(url, {}, None, None, None)
+        timeout = self._defaults.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+        opened = self._adapter.warm_up(url, connections, timeout, self._logger, verify=settings["verify"])
+        if connections > 0 and opened == 0:
+            raise SunbayNetworkError(f"Could not open any connection to {url}", retryable=True)
+        return opened
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Close every cached client, waiting up to ``timeout`` seconds in total
+        for their calls in flight, then close the shared connections. ``get``
+        raises SunbayBusinessError afterwards.
+
+        Returns True when every call in flight finished in time.
+        """
+        with self._lock:
+            self._closed = True
+            clients = [entry.client for entry in self._clients.values()]
+            self._clients.clear()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        drained = True
+        for client in clients:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            drained = client.close(remaining) and drained
+        self._session.close()
+        return drained
+
+    def __enter__(self) -> "ClientRegistry":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _check_settings(settings: Dict[str, Any]) -> None:
+    unknown = sorted(set(settings) - TENANT_SETTINGS)
+    if unknown:
+        raise SunbayBusinessError(f"Unsupported tenant setting(s): {', '.join(unknown)}")
+
+
+def _discard(client: NexusClient) -> None:
+    # Not client.close(): another thread may still hold the evicted client and
+    # use it. Only its bulk workers are stopped; the session stays shared.
+    client._bulk.shutdown(wait=False)
@@ -0,0 +1,25 @@
+"""
+Serialization helpers that map SDK models to and from the HTTP API format.
+"""
+
+from .decoder import (  # noqa: F401
+    DecodePlan,
+    camel_to_snake,
+    decode_response,
+    get_decoder,
+    to_snake_dict,
+)
+from .encoder import (  # noqa: F401
+    SerializationPlan,
+    encode_json,
+    get_plan,
+    snake_to_camel,
+    to_primitive,
+    to_query_params,
+)
+from .json_codec import (  # noqa: F401
+    JsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_json_codec,
+)
@@ -0,0 +1,180 @@
+"""
+Response decoder built on cached per-dataclass decode plans.
+
+A plan maps every camelCase key of a response type straight to its dataclass
+field together with a converter derived from the field's type hint, so that:
+
+- nested dataclasses (``Amount``, ``BatchQueryItem``) are built as objects;
+- ``int`` fields sent as strings by the API are coerced to int;
+- keys the SDK does not know yet are ignored instead of raising TypeError.
+"""
+
+import threading
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union, get_type_hints
+
+from .encoder import snake_to_camel
+
+T = TypeVar("T")
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def camel_to_snake(name: str) -> str:
+    """
+    Convert a camelCase name to snake_case (``tipWithTax`` -> ``tip_with_tax``).
+    """
+    chars = []
+    for ch in name:
+        if ch.isupper():
+            if chars:
+                chars.append("_")
+            chars.append(ch.lower())
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def to_snake_dict(source: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a dict with camelCase keys to snake_case keys recursively.
+
+    Used for fields typed as plain ``dict`` where no dataclass describes the shape.
+    """
+    result: Dict[str, Any] = {}
+    for key, value in source.items():
+        if isinstance(value, dict):
+            value = to_snake_dict(value)
+        elif isinstance(value, list):
+            value = [to_snake_dict(item) if isinstance(item, dict) else item for item in value]
+        result[camel_to_snake(key)] = value
+    return result
+
+
+def _to_int(value: Any) -> Any:
+    # Monetary fields may be encoded as strings; keep the original value if it
+    # cannot be parsed rather than failing the whole response.
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _snake_dict_or_value(value: Any) -> Any:
+    return to_snake_dict(value) if isinstance(value, dict) else value
+
+
+def _converter_for(hint: Any) -> Converter:
+    origin = getattr(hint, "__origin__", None)
+    if origin is Union:
+        args = [arg for arg in hint.__args__ if arg is not type(None)]
+        return _converter_for(args[0]) if len(args) == 1 else None
+    if origin in (list, tuple):
+        args = getattr(hint, "__args__", None) or (Any,)
+        item_converter = _converter_for(args[0])
+        if item_converter is None:
+            return None
+
+        def _convert_list(value: Any) -> Any:
+            if isinstance(value, list):
+                return [item_converter(item) for item in value]
+            return value
+
+        return _convert_list
+    if origin is dict or hint is dict:
+        return _snake_dict_or_value
+    if hint is int:
+        return _to_int
+    if isinstance(hint, type) and is_dataclass(hint):
+        nested = hint
+
+        def _convert_nested(value: Any) -> Any:
+            if isinstance(value, dict):
+                return get_decoder(nested).build(value)
+            return value
+
+        return _convert_nested
+    return None
+
+
+class DecodePlan:
+    """
+    Precompiled camelCase-key to field mapping for one response dataclass.
+    """
+
+    __slots__ = ("cls", "fields", "field_names")
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        hints = get_type_hints(cls)
+        mapping: Dict[str, Tuple[str, Converter]] = {}
+        for f in fields(cls):
+            if not f.init:
+                continue
+            entry = (f.name, _converter_for(hints.get(f.name, Any)))
+            # Accept the API spelling and, for robustness, the Python spelling.
+            mapping[snake_to_camel(f.name)] = entry
+            mapping.setdefault(f.name, entry)
+        self.fields = mapping
+        self.field_names = frozenset(entry[0] for entry in mapping.values())
+
+    def kwargs(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map an API payload to constructor keyword arguments, skipping unknown keys.
+        """
+        result: Dict[str, Any] = {}
+        mapping = self.fields
+        for key, value in data.items():
+            entry = mapping.get(key)
+            if entry is None:
+                continue
+            name, converter = entry
+            if converter is not None and value is not None:
+                value = converter(value)
+            result[name] = value
+        return result
+
+    def build(self, data: Dict[str, Any]) -> Any:
+        return self.cls(**self.kwargs(data))
+
+
+_decoders: Dict[type, DecodePlan] = {}
+_decoders_lock = threading.Lock()
+
+
+def get_decoder(cls: type) -> DecodePlan:
+    """
+    Return the cached decode plan for a dataclass type, compiling it once.
+    """
+    plan = _decoders.get(cls)
+    if plan is None:
+        with _decoders_lock:
+            plan = _decoders.get(cls)
+            if plan is None:
+                plan = DecodePlan(cls)
+                _decoders[cls] = plan
+    return plan
+
+
+def decode_response(root: Dict[str, Any], response_type: Type[T]) -> T:
+    """
+    Build ``response_type`` from an API envelope (``code``/``msg``/``traceId``/``data``).
+
+    Fields inside ``data`` take precedence over the envelope's base fields.
+    """
+    plan = get_decoder(response_type)
+    data = root.get("data")
+
+    if isinstance(data, dict):
+        payload = plan.kwargs(data)
+    elif data is not None and "data" in plan.field_names:
+        payload = {"data": data}
+    else:
+        payload = {}
+
+    payload.setdefault("code", root.get("code"))
+    payload.setdefault("msg", root.get("msg"))
+    payload.setdefault("trace_id", root.get("traceId"))
+    return response_type(**payload)  # type: ignore[call-arg]
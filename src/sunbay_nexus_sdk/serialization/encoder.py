@@ -0,0 +1,210 @@
+"""
+Request encoder built on cached per-dataclass serialization plans.
+
+The first time a request type is encoded its dataclass fields are compiled
+into a plan holding the camelCase JSON key of every field. Later calls walk
+the plan and write JSON fragments directly, without the deep copy performed
+by ``dataclasses.asdict`` or an intermediate snake_case/camelCase dict.
+
+The output is byte-for-byte identical to
+``json.dumps(_to_camel_dict(asdict(obj)), ensure_ascii=False)``.
+"""
+
+import json
+import threading
+from dataclasses import fields, is_dataclass
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, Tuple
+
+_ITEM_SEPARATOR = ", "
+_KEY_SEPARATOR = ": "
+
+_INFINITY = float("inf")
+
+
+def snake_to_camel(name: str) -> str:
+    """
+    Convert a snake_case name to camelCase (``tip_with_tax`` -> ``tipWithTax``).
+    """
+    parts = name.split("_")
+    head = parts[0]
+    tail = [p.capitalize() for p in parts[1:] if p]
+    return head + "".join(tail)
+
+
+# Cache for keys of plain dict payloads, which are not known in advance.
+_camel_keys: Dict[str, str] = {}
+
+
+def _camel_key(key: str) -> str:
+    camel = _camel_keys.get(key)
+    if camel is None:
+        camel = snake_to_camel(key)
+        if len(_camel_keys) < 4096:
+            _camel_keys[key] = camel
+    return camel
+
+
+def _encode_float(value: float) -> str:
+    # Same spelling as json.dumps for non-finite floats.
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+_SCALAR_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    str: encode_basestring,
+    int: int.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+    float: _encode_float,
+}
+
+
+class SerializationPlan:
+    """
+    Precompiled field layout of one request dataclass.
+    """
+
+    __slots__ = ("cls", "fields")
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        # (attribute name, camelCase key, JSON key fragment including separator)
+        self.fields: Tuple[Tuple[str, str, str], ...] = tuple(
+            (f.name, snake_to_camel(f.name), encode_basestring(snake_to_camel(f.name)) + _KEY_SEPARATOR)
+            for f in fields(cls)
+        )
+
+    def write(self, obj: Any, out: List[str]) -> None:
+        """
+        Append the JSON fragments of ``obj`` to ``out``.
+        """
+        out.append("{")
+        first = True
+        for name, _, key_fragment in self.fields:
+            if first:
+                first = False
+            else:
+                out.append(_ITEM_SEPARATOR)
+            out.append(key_fragment)
+            _write_value(getattr(obj, name), out)
+        out.append("}")
+
+    def to_dict(self, obj: Any, *, skip_none: bool = False) -> Dict[str, Any]:
+        """
+        Build a camelCase dict of ``obj`` with nested values converted to JSON types.
+        """
+        result: Dict[str, Any] = {}
+        for name, camel, _ in self.fields:
+            value = getattr(obj, name)
+            if value is None:
+                if skip_none:
+                    continue
+                result[camel] = None
+            else:
+                result[camel] = to_primitive(value)
+        return result
+
+
+_plans: Dict[type, SerializationPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def get_plan(cls: type) -> SerializationPlan:
+    """
+    Return the cached serialization plan for a dataclass type, compiling it once.
+    """
+    plan = _plans.get(cls)
+    if plan is None:
+        with _plans_lock:
+            plan = _plans.get(cls)
+            if plan is None:
+                plan = SerializationPlan(cls)
+                _plans[cls] = plan
+    return plan
+
+
+def _write_value(value: Any, out: List[str]) -> None:
+    value_type = type(value)
+    scalar = _SCALAR_ENCODERS.get(value_type)
+    if scalar is not None:
+        out.append(scalar(value))
+        return
+
+    plan = _plans.get(value_type)
+    if plan is not None or (is_dataclass(value) and not isinstance(value, type)):
+        (plan or get_plan(value_type)).write(value, out)
+    elif isinstance(value, (list, tuple)):
+        out.append("[")
+        for index, item in enumerate(value):
+            if index:
+                out.append(_ITEM_SEPARATOR)
+            _write_value(item, out)
+        out.append("]")
+    elif isinstance(value, dict):
+        out.append("{")
+        first = True
+        for key, item in value.items():
+            if first:
+                first = False
+            else:
+                out.append(_ITEM_SEPARATOR)
+            out.append(encode_basestring(_camel_key(key)) if isinstance(key, str) else json.dumps(str(key)))
+            out.append(_KEY_SEPARATOR)
+            _write_value(item, out)
+        out.append("}")
+    elif isinstance(value, bool):
+        out.append("true" if value else "false")
+    elif isinstance(value, str):
+        # str-based enums (e.g. TransactionStatus) are sent as their value.
+        out.append(encode_basestring(value))
+    elif isinstance(value, int):
+        out.append(int.__repr__(value))
+    elif isinstance(value, float):
+        out.append(_encode_float(value))
+    else:
+        out.append(json.dumps(value, ensure_ascii=False))
+
+
+def to_primitive(value: Any) -> Any:
+    """
+    Convert a value into JSON-compatible types with camelCase dict keys.
+    """
+    if type(value) in _SCALAR_ENCODERS:
+        return value
+    plan = _plans.get(type(value))
+    if plan is not None or (is_dataclass(value) and not isinstance(value, type)):
+        return (plan or get_plan(type(value))).to_dict(value)
+    if isinstance(value, (list, tuple)):
+        return [to_primitive(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            (_camel_key(key) if isinstance(key, str) else key): to_primitive(item)
+            for key, item in value.items()
+        }
+    return value
+
+
+def encode_json(obj: Any) -> str:
+    """
+    Encode a request dataclass (or dict) as a camelCase JSON document.
+    """
+    out: List[str] = []
+    _write_value(obj, out)
+    return "".join(out)
+
+
+def to_query_params(obj: Any) -> Dict[str, Any]:
+    """
+    Build camelCase query parameters from a request, omitting top-level None values.
+    """
+    if isinstance(obj, dict):
+        return {
+            _camel_key(key): to_primitive(value) for key, value in obj.items() if value is not None
+        }
+    return get_plan(type(obj)).to_dict(obj, skip_none=True)
@@ -0,0 +1,94 @@
+"""
+Pluggable JSON codecs working on bytes.
+
+Request bodies are produced as UTF-8 bytes and response bodies are parsed
+straight from ``response.content``, so no str round trip (or charset
+detection by the HTTP library) happens on the hot path.
+
+The stdlib codec is the default. ``orjson`` can be selected explicitly, or
+via ``"auto"`` which picks it when installed.
+"""
+
+import json
+from typing import Any, Union
+
+from ..exceptions import SunbayBusinessError
+from .encoder import encode_json, to_primitive
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """
+    Interface for encoding request bodies and decoding response bodies.
+    """
+
+    name = "base"
+
+    def encode_request(self, request_body: Any) -> bytes:
+        """
+        Encode a request dataclass (or dict) to camelCase JSON bytes.
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Parse JSON bytes. Must raise ValueError for malformed input.
+        """
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    Codec based on the standard library json module.
+    """
+
+    name = "stdlib"
+
+    def encode_request(self, request_body: Any) -> bytes:
+        return encode_json(request_body).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec based on orjson, which serializes directly to bytes.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with: pip install orjson")
+
+    def encode_request(self, request_body: Any) -> bytes:
+        return orjson.dumps(to_primitive(request_body))
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+_DEFAULT_CODEC = StdlibJsonCodec()
+
+
+def get_json_codec(codec: Union[None, str, JsonCodec] = None) -> JsonCodec:
+    """
+    Resolve a codec argument.
+
+    Accepts a JsonCodec instance, ``None`` or ``"stdlib"`` (default),
+    ``"orjson"``, or ``"auto"`` (orjson when installed, otherwise stdlib).
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == StdlibJsonCodec.name:
+        return _DEFAULT_CODEC
+    if codec == OrjsonCodec.name:
+        return OrjsonCodec()
+    if codec == "auto":
+        return OrjsonCodec() if orjson is not None else _DEFAULT_CODEC
+    raise SunbayBusinessError(f"Unknown JSON codec: {codec!r}")
@@ -0,0 +1,11 @@
+"""
+Testing utilities for Sunbay Nexus SDK integrations.
+"""
+
+from .stub_server import FaultConfig, Latency, StubServer
+
+__all__ = (
+    "FaultConfig",
+    "Latency",
+    "StubServer",
+)
@@ -0,0 +1,628 @@
+"""
+Local stand-in for the Sunbay Nexus API, for load and fault testing.
+
+StubServer implements every path in ``constants.api_constants`` with the
+usual ``code``/``msg``/``traceId``/``data`` envelope. Transactions are kept in
+memory: they are PROCESSING for ``processing_time`` seconds and then SUCCESS
+(or FAIL, see ``decline_rate``), so query polling behaves like the real
+backend. Repeating a ``transactionRequestId`` returns the same transaction.
+
+FaultConfig adds latency, business errors, HTTP 429/5xx, connection resets
+and slow bodies, globally or per path, so pooling, retries and timeouts can
+be exercised under controlled load. Point a client at the server with
+``SUNBAY_BASE_URL``:
+
+    python -m sunbay_nexus_sdk.testing.stub_server --port 8080 --status 503=0.02 --reset-rate 0.01
+    SUNBAY_BASE_URL=http://127.0.0.1:8080 python my_load_test.py
+
+When ``--host``/``--port`` are not given, the server binds to the address in
+``SUNBAY_BASE_URL`` if it is a local ``http://`` URL.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import socket
+import struct
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .. import constants
+from ..enums import TransactionStatus
+from ..exceptions import SunbayBusinessError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Business error returned by ``FaultConfig.error_rate``.
+DEFAULT_ERROR_CODE = constants.TRANSIENT_BUSINESS_CODES[0]
+DEFAULT_ERROR_MSG = "System busy, please try again later"
+
+NOT_FOUND_CODE = constants.TRANSACTION_NOT_FOUND_CODES[0]
+UNAUTHORIZED_CODE = "A0401"
+
+_TRANSACTION_TYPES = {
+    constants.PATH_SALE: "SALE",
+    constants.PATH_AUTH: "AUTH",
+    constants.PATH_FORCED_AUTH: "FORCED_AUTH",
+    constants.PATH_INCREMENTAL_AUTH: "INCREMENTAL_AUTH",
+    constants.PATH_POST_AUTH: "POST_AUTH",
+    constants.PATH_REFUND: "REFUND",
+    constants.PATH_VOID: "VOID",
+    constants.PATH_CHECKOUT_SALE: "SALE",
+}
+
+_LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+logger = logging.getLogger("sunbay_nexus_sdk.testing.stub_server")
+
+
+@dataclass
+class Latency:
+    """
+    Server-side delay before each response, in seconds.
+
+    - ``fixed``: always ``mean``.
+    - ``uniform``: between ``mean - spread`` and ``mean + spread``.
+    - ``exponential``: exponential with the given ``mean``.
+    - ``lognormal``: median ``mean``, ``spread`` is sigma (0.5 gives a realistic long tail).
+
+    Samples are capped at ``maximum`` when set.
+    """
+
+    distribution: str = "fixed"
+    mean: float = 0.0
+    spread: float = 0.0
+    maximum: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.distribution not in _LATENCY_DISTRIBUTIONS:
+            raise SunbayBusinessError(f"Unknown latency distribution: {self.distribution!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            delay = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "exponential":
+            delay = rng.expovariate(1.0 / self.mean)
+        elif self.distribution == "lognormal":
+            delay = rng.lognormvariate(math.log(self.mean), self.spread)
+        else:
+            delay = self.mean
+        if self.maximum is not None:
+            delay = min(delay, self.maximum)
+        return max(delay, 0.0)
+
+
+@dataclass
+class FaultConfig:
+    """
+    Faults injected into stub responses. Rates are probabilities per request.
+
+    Attributes:
+        latency: Delay applied before every response.
+        status_rates: HTTP status -> rate, e.g. ``{429: 0.05, 503: 0.02}``.
+        retry_after: ``Retry-After`` header (seconds) sent with injected 429/503.
+        error_rate: Rate of HTTP 200 responses with a non-zero business ``code``.
+        error_code: Business code used for ``error_rate``.
+        reset_rate: Rate of connections reset (TCP RST) without any response.
+        slow_body_rate: Rate of responses whose body is streamed slowly.
+        slow_body_chunks: Number of chunks a slow body is split into.
+        slow_body_delay: Pause before each chunk of a slow body, in seconds.
+    """
+
+    latency: Latency = field(default_factory=Latency)
+    status_rates: Dict[int, float] = field(default_factory=dict)
+    retry_after: Optional[float] = None
+    error_rate: float = 0.0
+    error_code: str = DEFAULT_ERROR_CODE
+    reset_rate: float = 0.0
+    slow_body_rate: float = 0.0
+    slow_body_chunks: int = 10
+    slow_body_delay: float = 0.1
+
+
+class _Transaction:
+    __slots__ = ("data", "created", "final_status", "closed")
+
+    def __init__(self, data: Dict[str, Any], final_status: str) -> None:
+        self.data = data
+        self.created = time.monotonic()
+        self.final_status = final_status
+        self.closed = False
+
+
+class StubServer:
+    """
+    Threaded HTTP/1.1 server answering like the Sunbay Nexus API.
+
+    ``faults`` and ``path_faults`` are read on every request, so they can be
+    replaced while the server runs to switch between load scenarios.
+
+    Args:
+        host: Interface to bind.
+        port: Port to bind (0 picks a free port, see ``base_url``).
+        faults: Faults applied to every path without an entry in ``path_faults``.
+        path_faults: Per-path fault configuration (keys are API paths).
+        processing_time: Seconds a new transaction stays PROCESSING.
+        decline_rate: Rate of transactions that end as FAIL instead of SUCCESS.
+        api_key: When set, requests must send ``Authorization: Bearer <api_key>``.
+        max_transactions: Transactions kept in memory (oldest are dropped first).
+        seed: Seed for fault and latency sampling, for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        faults: Optional[FaultConfig] = None,
+        path_faults: Optional[Dict[str, FaultConfig]] = None,
+        processing_time: float = 2.0,
+        decline_rate: float = 0.0,
+        api_key: Optional[str] = None,
+        max_transactions: int = 100_000,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.faults = faults or FaultConfig()
+        self.path_faults = dict(path_faults or {})
+        self.processing_time = processing_time
+        self.decline_rate = decline_rate
+        self._api_key = api_key
+        self._max_transactions = max_transactions
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._transactions: "OrderedDict[str, _Transaction]" = OrderedDict()
+        self._by_request_id: Dict[Tuple[str, str, str], str] = {}
+        self._counters: Counter = Counter()
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "StubServer":
+        """
+        Create a server bound to the host and port of ``SUNBAY_BASE_URL``.
+        """
+        host, port = _address_from_env()
+        return cls(host=host, port=port, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        """
+        Serve requests on a background daemon thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="sunbay-stub-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters since start: ``requests``, ``status.<code>``, ``path.<path>``,
+        ``business_errors``, ``resets`` and ``slow_bodies``.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def _count(self, *names: str) -> None:
+        with self._lock:
+            for name in names:
+                self._counters[name] += 1
+
+    def _faults_for(self, path: str) -> FaultConfig:
+        return self.path_faults.get(path, self.faults)
+
+    def _roll(self, rate: float) -> bool:
+        return rate > 0 and self._rng.random() < rate
+
+    # ----- API behaviour ---------------------------------------------------
+
+    def handle(self, method: str, path: str, headers: Any, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Return ``(http_status, envelope)`` for one API call, without faults.
+        """
+        if self._api_key is not None:
+            expected = f"{constants.AUTHORIZATION_BEARER_PREFIX}{self._api_key}"
+            if headers.get(constants.HEADER_AUTHORIZATION) != expected:
+                return 401, _envelope(UNAUTHORIZED_CODE, "Invalid API key")
+
+        if method == "GET" and path == constants.PATH_QUERY:
+            return self._query(params)
+        if method != "POST":
+            return 404, _envelope("404", f"No handler for {method} {path}")
+
+        if path in _TRANSACTION_TYPES:
+            transaction = self._create(path, params)
+            return 200, _envelope(data=self._transaction_reply(path, transaction, params))
+        if path == constants.PATH_ABORT:
+            return self._abort(params)
+        if path == constants.PATH_TIP_ADJUST:
+            original = self._find(params.get("originalTransactionId"), None, params)
+            if original is None:
+                return 200, _envelope(NOT_FOUND_CODE, "Original transaction not found")
+            return 200, _envelope(
+                data={
+                    "originalTransactionId": original.data["transactionId"],
+                    "originalTransactionRequestId": original.data["transactionRequestId"],
+                    "tipAmount": params.get("tipAmount"),
+                }
+            )
+        if path == constants.PATH_BATCH_QUERY:
+            return 200, _envelope(data={"batchList": [self._batch_summary(params)]})
+        if path == constants.PATH_BATCH_CLOSE:
+            summary = self._batch_summary(params)
+            summary.update(terminalSn=params.get("terminalSn"), batchTime=_now(), transactionCount=summary["totalCount"])
+            return 200, _envelope(data=summary)
+        if path == constants.PATH_CREATE_CHECKOUT_SESSION:
+            session_id = f"cs_{uuid.uuid4().hex[:24]}"
+            data = {
+                key: params.get(key)
+                for key in (
+                    "appId",
+                    "merchantId",
+                    "transactionRequestId",
+                    "referenceOrderId",
+                    "description",
+                    "productList",
+                    "collectBillingAddress",
+                    "collectShippingAddress",
+                    "merchantReturnUrl",
+                    "notifyUrl",
+                )
+            }
+            data.update(
+                sessionId=session_id,
+                checkoutUrl=f"{self.base_url}/checkout/{session_id}",
+                expiresAt=_now(offset=1800),
+                amount=_amount(params.get("amount")),
+            )
+            return 200, _envelope(data=data)
+        return 404, _envelope("404", f"No handler for {method} {path}")
+
+    def _create(self, path: str, params: Dict[str, Any]) -> _Transaction:
+        key = (str(params.get("appId")), str(params.get("merchantId")), str(params.get("transactionRequestId")))
+        with self._lock:
+            existing = self._by_request_id.get(key)
+            if existing is not None and existing in self._transactions:
+                return self._transactions[existing]
+            declined = self._roll(self.decline_rate)
+            transaction = _Transaction(
+                {
+                    "transactionId": f"TXN{uuid.uuid4().hex[:20].upper()}",
+                    "transactionRequestId": params.get("transactionRequestId"),
+                    "referenceOrderId": params.get("referenceOrderId"),
+                    "transactionType": _TRANSACTION_TYPES[path],
+                    "amount": _amount(params.get("amount")),
+                    "createTime": _now(),
+                    "terminalSn": params.get("terminalSn"),
+                    "description": params.get("description"),
+                    "attach": params.get("attach"),
+                    "appId": key[0],
+                    "merchantId": key[1],
+                },
+                TransactionStatus.FAIL.value if declined else TransactionStatus.SUCCESS.value,
+            )
+            transaction_id = transaction.data["transactionId"]
+            self._transactions[transaction_id] = transaction
+            self._by_request_id[key] = transaction_id
+            while len(self._transactions) > self._max_transactions:
+                _, dropped = self._transactions.popitem(last=False)
+                data = dropped.data
+                self._by_request_id.pop((data["appId"], data["merchantId"], str(data["transactionRequestId"])), None)
+            return transaction
+
+    def _find(
+        self, transaction_id: Optional[str], request_id: Optional[str], params: Dict[str, Any]
+    ) -> Optional[_Transaction]:
+        with self._lock:
+            if transaction_id:
+                return self._transactions.get(transaction_id)
+            if request_id:
+                key = (str(params.get("appId")), str(params.get("merchantId")), request_id)
+                found = self._by_request_id.get(key)
+                return self._transactions.get(found) if found else None
+        return None
+
+    def _status(self, transaction: _Transaction) -> str:
+        if transaction.closed:
+            return TransactionStatus.CLOSED.value
+        if time.monotonic() - transaction.created < self.processing_time:
+            return TransactionStatus.PROCESSING.value
+        return transaction.final_status
+
+    def _transaction_reply(self, path: str, transaction: _Transaction, params: Dict[str, Any]) -> Dict[str, Any]:
+        data = transaction.data
+        reply = {
+            "transactionId": data["transactionId"],
+            "transactionRequestId": data["transactionRequestId"],
+            "referenceOrderId": data["referenceOrderId"],
+            "transactionStatus": self._status(transaction),
+        }
+        if "originalTransactionId" in params:
+            original = self._find(params.get("originalTransactionId"), None, params)
+            reply["originalTransactionId"] = params["originalTransactionId"]
+            reply["originalTransactionRequestId"] = original.data["transactionRequestId"] if original else None
+        if path == constants.PATH_CHECKOUT_SALE:
+            reply["redirectUrl"] = f"{self.base_url}/3ds/{data['transactionId']}"
+        return reply
+
+    def _query(self, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        transaction = self._find(params.get("transactionId"), params.get("transactionRequestId"), params)
+        if transaction is None:
+            return 200, _envelope(NOT_FOUND_CODE, "Transaction not found")
+        status = self._status(transaction)
+        data = dict(transaction.data, transactionStatus=status)
+        del data["appId"], data["merchantId"]
+        if status != TransactionStatus.PROCESSING.value:
+            data.update(
+                completeTime=_now(),
+                maskedPan="411111******1111",
+                cardNetworkType="CREDIT",
+                entryMode="CONTACTLESS",
+                batchNo="000001",
+                authCode="A1B2C3",
+            )
+        return 200, _envelope(data=data)
+
+    def _abort(self, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        original = self._find(
+            params.get("originalTransactionId"), params.get("originalTransactionRequestId"), params
+        )
+        if original is None:
+            return 200, _envelope(NOT_FOUND_CODE, "Original transaction not found")
+        if self._status(original) == TransactionStatus.PROCESSING.value:
+            original.closed = True
+        return 200, _envelope(
+            data={
+                "originalTransactionId": original.data["transactionId"],
+                "originalTransactionRequestId": original.data["transactionRequestId"],
+                "transactionStatus": self._status(original),
+            }
+        )
+
+    def _batch_summary(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            transactions = [
+                t
+                for t in self._transactions.values()
+                if t.data["merchantId"] == str(params.get("merchantId"))
+                and (not params.get("terminalSn") or t.data["terminalSn"] == params.get("terminalSn"))
+            ]
+        amounts = [t.data["amount"] or {} for t in transactions if self._status(t) == TransactionStatus.SUCCESS.value]
+        return {
+            "batchNo": "000001",
+            "startTime": _now(),
+            "channelCode": "CARD",
+            "priceCurrency": amounts[0].get("priceCurrency", "USD") if amounts else "USD",
+            "totalCount": len(amounts),
+            "netAmount": str(sum(int(a.get("transAmount") or 0) for a in amounts)),
+            "tipAmount": str(sum(int(a.get("tipAmount") or 0) for a in amounts)),
+            "surchargeAmount": str(sum(int(a.get("surchargeAmount") or 0) for a in amounts)),
+            "taxAmount": str(sum(int(a.get("taxAmount") or 0) for a in amounts)),
+        }
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Load tests open many connections at once.
+    request_queue_size = 1024
+    stub: StubServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY the body
+    # waits for the client's delayed ACK (~40 ms on Linux).
+    disable_nagle_algorithm = True
+    server: _HTTPServer
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self._respond(url.path, params)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            params = json.loads(body) if body else {}
+        except ValueError:
+            self._send(400, _encode(_envelope("400", "Malformed JSON body")), FaultConfig())
+            return
+        self._respond(urlsplit(self.path).path, params if isinstance(params, dict) else {})
+
+    def _respond(self, path: str, params: Dict[str, Any]) -> None:
+        stub = self.server.stub
+        faults = stub._faults_for(path)
+        stub._count("requests", f"path.{path}")
+
+        delay = faults.latency.sample(stub._rng)
+        if delay:
+            time.sleep(delay)
+
+        if stub._roll(faults.reset_rate):
+            stub._count("resets")
+            self._reset()
+            return
+        for status, rate in faults.status_rates.items():
+            if stub._roll(rate):
+                self._send(status, _encode(_envelope(str(status), "Injected fault")), faults, injected=True)
+                return
+        if stub._roll(faults.error_rate):
+            stub._count("business_errors")
+            self._send(200, _encode(_envelope(faults.error_code, DEFAULT_ERROR_MSG)), faults)
+            return
+        status, envelope = stub.handle(self.command, path, self.headers, params)
+        self._send(status, _encode(envelope), faults)
+
+    def _send(self, status: int, body: bytes, faults: FaultConfig, injected: bool = False) -> None:
+        stub = self.server.stub
+        stub._count(f"status.{status}")
+        self.send_response(status)
+        self.send_header(constants.HEADER_CONTENT_TYPE, constants.CONTENT_TYPE_JSON)
+        self.send_header("Content-Length", str(len(body)))
+        if injected and faults.retry_after is not None and status in (429, 503):
+            self.send_header(constants.HEADER_RETRY_AFTER, f"{faults.retry_after:g}")
+        self.end_headers()
+
+        if stub._roll(faults.slow_body_rate):
+            stub._count("slow_bodies")
+            chunks = max(faults.slow_body_chunks, 1)
+            size = max(math.ceil(len(body) / chunks), 1)
+            for start in range(0, len(body), size):
+                time.sleep(faults.slow_body_delay)
+                self.wfile.write(body[start:start + size])
+                self.wfile.flush()
+        else:
+            self.wfile.write(body)
+
+    def _reset(self) -> None:
+        # SO_LINGER with a zero timeout makes close() send RST instead of FIN.
+        self.close_connection = True
+        try:
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            self.connection.close()
+        except OSError:
+            pass
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def _envelope(code: str = constants.RESPONSE_SUCCESS_CODE, msg: str = "Success", data: Any = None) -> Dict[str, Any]:
+    envelope = {"code": code, "msg": msg, "traceId": uuid.uuid4().hex}
+    if data is not None:
+        envelope["data"] = data
+    return envelope
+
+
+def _encode(envelope: Dict[str, Any]) -> bytes:
+    return json.dumps(envelope, separators=(",", ":")).encode("utf-8")
+
+
+def _amount(amount: Any) -> Optional[Dict[str, Any]]:
+    # The backend echoes amounts as strings and adds the total (transAmount).
+    if not isinstance(amount, dict):
+        return None
+    parts = ("orderAmount", "tipAmount", "taxAmount", "surchargeAmount", "cashbackAmount")
+    total = sum(int(amount.get(name) or 0) for name in parts)
+    result = {name: str(amount[name]) for name in parts if amount.get(name) is not None}
+    result.update(priceCurrency=amount.get("priceCurrency"), transAmount=str(total))
+    return result
+
+
+def _now(offset: float = 0.0) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + offset))
+
+
+def _address_from_env() -> Tuple[str, int]:
+    base_url = os.getenv("SUNBAY_BASE_URL")
+    if base_url:
+        url = urlsplit(base_url)
+        if url.scheme == "http" and url.hostname:
+            return url.hostname, url.port or 80
+    return DEFAULT_HOST, DEFAULT_PORT
+
+
+def _parse_status_rate(value: str) -> Tuple[int, float]:
+    status, _, rate = value.partition("=")
+    try:
+        return int(status), float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected STATUS=RATE, got {value!r}")
+
+
+def main(argv: Optional[list] = None) -> None:
+    env_host, env_port = _address_from_env()
+    parser = argparse.ArgumentParser(
+        prog="python -m sunbay_nexus_sdk.testing.stub_server",
+        description="Local Sunbay Nexus API stub with latency and fault injection.",
+    )
+    parser.add_argument("--host", default=env_host, help=f"bind address (default: {env_host})")
+    parser.add_argument("--port", type=int, default=env_port, help=f"bind port (default: {env_port})")
+    parser.add_argument("--latency", choices=_LATENCY_DISTRIBUTIONS, default="fixed", help="latency distribution")
+    parser.add_argument("--latency-mean", type=float, default=0.0, help="mean (median for lognormal), seconds")
+    parser.add_argument("--latency-spread", type=float, default=0.0, help="uniform half-width or lognormal sigma")
+    parser.add_argument("--latency-max", type=float, help="cap on sampled latency, seconds")
+    parser.add_argument(
+        "--status", type=_parse_status_rate, action="append", default=[], metavar="STATUS=RATE",
+        help="inject an HTTP status, e.g. --status 429=0.05 --status 503=0.01",
+    )
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds on injected 429/503")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="rate of business errors (HTTP 200, code != 0)")
+    parser.add_argument("--error-code", default=DEFAULT_ERROR_CODE, help="business code for --error-rate")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="rate of connection resets")
+    parser.add_argument("--slow-body-rate", type=float, default=0.0, help="rate of slowly streamed bodies")
+    parser.add_argument("--slow-body-chunks", type=int, default=10, help="chunks per slow body")
+    parser.add_argument("--slow-body-delay", type=float, default=0.1, help="pause before each chunk, seconds")
+    parser.add_argument("--processing-time", type=float, default=2.0, help="seconds a transaction stays PROCESSING")
+    parser.add_argument("--decline-rate", type=float, default=0.0, help="rate of transactions ending as FAIL")
+    parser.add_argument("--api-key", help="require this API key")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible fault sequences")
+    args = parser.parse_args(argv)
+
+    faults = FaultConfig(
+        latency=Latency(args.latency, args.latency_mean, args.latency_spread, args.latency_max),
+        status_rates=dict(args.status),
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        error_code=args.error_code,
+        reset_rate=args.reset_rate,
+        slow_body_rate=args.slow_body_rate,
+        slow_body_chunks=args.slow_body_chunks,
+        slow_body_delay=args.slow_body_delay,
+    )
+    server = StubServer(
+        host=args.host,
+        port=args.port,
+        faults=faults,
+        processing_time=args.processing_time,
+        decline_rate=args.decline_rate,
+        api_key=args.api_key,
+        seed=args.seed,
+    )
+    print(f"Sunbay Nexus stub listening on {server.base_url}")
+    print(f"export SUNBAY_BASE_URL={server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+        print(f"\n{json.dumps(server.stats(), indent=2, sort_keys=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Transaction status tracker.
+
+Semi-integration calls (sale, auth, refund, ...) usually return while the
+terminal is still processing (TransactionStatus.PROCESSING). Instead of one
+polling loop per transaction, register the transactions with a
+TransactionStatusTracker: a single scheduler thread polls them with
+adaptive per-transaction backoff under a global QPS cap, and resolves a
+Future once each one reaches a final status (SUCCESS, FAIL or CLOSED).
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+from .constants import TRANSIENT_BUSINESS_CODES
+from .enums import TransactionStatus
+from .exceptions import SunbayBusinessError, SunbayNetworkError
+from .http import RequestOptions, RetryPolicy
+from .models.request import QueryRequest
+from .models.response import QueryResponse
+
+FINAL_TRANSACTION_STATUSES = frozenset(
+    (TransactionStatus.SUCCESS.value, TransactionStatus.FAIL.value, TransactionStatus.CLOSED.value)
+)
+
+# The tracker re-polls on its own schedule, so individual queries do not retry.
+_POLL_OPTIONS = RequestOptions(retry_policy=RetryPolicy.no_retry())
+
+_TrackingKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class _Tracked:
+    __slots__ = ("key", "request", "future", "delay", "deadline", "polls", "last_error")
+
+    def __init__(self, key: _TrackingKey, request: QueryRequest, delay: float, deadline: float) -> None:
+        self.key = key
+        self.request = request
+        self.future: "Future[QueryResponse]" = Future()
+        self.delay = delay
+        self.deadline = deadline
+        self.polls = 0
+        self.last_error: Optional[BaseException] = None
+
+
+class TransactionStatusTracker:
+    """
+    Poll many pending transactions from one scheduler thread.
+
+    Args:
+        client: NexusClient used to call ``query``.
+        max_qps: Global cap on query calls per second.
+        max_concurrency: Maximum queries in flight at the same time.
+        initial_delay: Seconds before the first poll of a transaction.
+        max_delay: Upper bound of the per-transaction polling interval.
+        backoff_factor: Interval multiplier applied after each non-final poll.
+        timeout: Seconds after which tracking gives up with TimeoutError.
+        transient_codes: Business codes of ``query`` polled again like
+            retryable network errors. Any other business error, or a
+            non-retryable network error (e.g. HTTP 401), fails the Future at once.
+        logger: Optional logger (defaults to ``sunbay_nexus_sdk.tracker``).
+    """
+
+    def __init__(
+        self,
+        client: "object",
+        max_qps: float = 20.0,
+        max_concurrency: int = 8,
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
+        backoff_factor: float = 1.5,
+        timeout: float = 300.0,
+        transient_codes: Collection[str] = TRANSIENT_BUSINESS_CODES,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if max_qps <= 0:
+            raise SunbayBusinessError("max_qps must be positive")
+        self._client = client
+        self._interval = 1.0 / max_qps
+        self._max_concurrency = max(int(max_concurrency), 1)
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._backoff_factor = backoff_factor
+        self._timeout = timeout
+        self._transient_codes = frozenset(transient_codes)
+        self._logger = logger or logging.getLogger("sunbay_nexus_sdk.tracker")
+
+        self._tracked: Dict[_TrackingKey, _Tracked] = {}
+        self._schedule: List[Tuple[float, int, _TrackingKey]] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._next_dispatch = 0.0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency, thread_name_prefix="sunbay-tracker")
+        self._thread = threading.Thread(target=self._run, name="sunbay-tracker", daemon=True)
+        self._thread.start()
+
+    def track(
+        self,
+        app_id: str,
+        merchant_id: str,
+        *,
+        transaction_id: Optional[str] = None,
+        transaction_request_id: Optional[str] = None,
+        callback: Optional[Callable[["Future[QueryResponse]"], None]] = None,
+    ) -> "Future[QueryResponse]":
+        """
+        Start tracking a transaction and return a Future of its final QueryResponse.
+
+        Registering the same transaction twice returns the same Future, so
+        callers never cause duplicate polling. ``callback`` is attached with
+        ``Future.add_done_callback``. Cancelling the Future stops the polling.
+        """
+        if not transaction_id and not transaction_request_id:
+            raise SunbayBusinessError("transaction_id or transaction_request_id is required")
+        key: _TrackingKey = (app_id, merchant_id, transaction_id or None, transaction_request_id or None)
+
+        with self._condition:
+            if self._closed:
+                raise SunbayBusinessError("TransactionStatusTracker is closed")
+            tracked = self._tracked.get(key)
+            if tracked is None or tracked.future.cancelled():
+                request = QueryRequest(
+                    app_id=app_id,
+                    merchant_id=merchant_id,
+                    transaction_id=transaction_id,
+                    transaction_request_id=transaction_request_id,
+                )
+                now = time.monotonic()
+                tracked = _Tracked(key, request, self._initial_delay, now + self._timeout)
+                self._tracked[key] = tracked
+                self._push(now + self._initial_delay, key)
+        if callback is not None:
+            tracked.future.add_done_callback(callback)
+        return tracked.future
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Number of transactions that have not reached a final status yet.
+        """
+        with self._condition:
+            return len(self._tracked)
+
+    def close(self, cancel_pending: bool = True) -> None:
+        """
+        Stop accepting transactions. Pending Futures are cancelled when
+        ``cancel_pending`` is True; otherwise polling goes on, and close
+        blocks, until each of them is resolved (at most ``timeout`` seconds).
+        """
+        with self._condition:
+            self._closed = True
+            pending = list(self._tracked.values()) if cancel_pending else []
+            if cancel_pending:
+                self._tracked.clear()
+                self._schedule.clear()
+            self._condition.notify_all()
+        for tracked in pending:
+            tracked.future.cancel()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "TransactionStatusTracker":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # --- Scheduler ---
+
+    def _transient(self, error: BaseException) -> bool:
+        # Errors worth polling again until the deadline.
+        if isinstance(error, SunbayNetworkError):
+            return error.retryable
+        if isinstance(error, SunbayBusinessError):
+            return error.code in self._transient_codes
+        return False
+
+    def _push(self, when: float, key: _TrackingKey) -> None:
+        heapq.heappush(self._schedule, (when, next(self._sequence), key))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        with self._condition:
+            # After close, run until the transactions left are resolved.
+            while not (self._closed and not self._tracked):
+                now = time.monotonic()
+                if not self._schedule or self._in_flight >= self._max_concurrency:
+                    self._condition.wait()
+                    continue
+                due = max(self._schedule[0][0], self._next_dispatch)
+                if due > now:
+                    self._condition.wait(due - now)
+                    continue
+
+                _, _, key = heapq.heappop(self._schedule)
+                tracked = self._tracked.get(key)
+                if tracked is None:
+                    continue
+                if tracked.future.cancelled():
+                    # Nobody waits for it any more: stop spending queries on it.
+                    del self._tracked[key]
+                    continue
+                self._in_flight += 1
+                self._next_dispatch = now + self._interval
+                self._executor.submit(self._poll, tracked)
+
+    def _poll(self, tracked: _Tracked) -> None:
+        response: Optional[QueryResponse] = None
+        error: Optional[BaseException] = None
+        try:
+            response = self._client.query(tracked.request, _POLL_OPTIONS)  # type: ignore[attr-defined]
+        except BaseException as exc:  # noqa: B902 - resolve the Future instead of losing the error
+            error = exc
+
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+            if self._tracked.get(tracked.key) is not tracked:
+                return
+            if tracked.future.cancelled():
+                del self._tracked[tracked.key]
+                return
+            tracked.polls += 1
+            tracked.last_error = error
+
+            if response is not None and response.transaction_status in FINAL_TRANSACTION_STATUSES:
+                del self._tracked[tracked.key]
+                resolve: Optional[Callable[[], None]] = lambda: tracked.future.set_result(response)  # noqa: E731
+            elif error is not None and not self._transient(error):
+                del self._tracked[tracked.key]
+                resolve = lambda: tracked.future.set_exception(error)  # noqa: E731
+            else:
+                now = time.monotonic()
+                if now >= tracked.deadline:
+                    del self._tracked[tracked.key]
+                    timeout_error = TimeoutError(
+                        f"Transaction {tracked.key[2] or tracked.key[3]} did not reach a final status "
+                        f"after {tracked.polls} polls"
+                    )
+                    timeout_error.__cause__ = error
+                    self._logger.warning("Stopped tracking %s: %s", tracked.key, timeout_error)
+                    resolve = lambda: tracked.future.set_exception(timeout_error)  # noqa: E731
+                else:
+                    tracked.delay = min(tracked.delay * self._backoff_factor, self._max_delay)
+                    self._push(min(now + tracked.delay, tracked.deadline), tracked.key)
+                    resolve = None
+
+        if resolve is not None and tracked.future.set_running_or_notify_cancel():
+            resolve()
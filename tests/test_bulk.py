@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from sunbay_nexus_sdk import NexusClient, SunbayBusinessError
+from sunbay_nexus_sdk.bulk import BulkExecutor
+from sunbay_nexus_sdk.constants import PATH_SALE
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import QueryRequest, SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig, Latency
+
+
+class FakeClient:
+    """
+    Answers ``query`` after ``delays[transaction_id]`` seconds; ids starting
+    with "bad" raise.
+    """
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.started = []
+
+    def query(self, request, options=None):
+        self.started.append(request.transaction_id)
+        time.sleep(self.delays.get(request.transaction_id, 0.0))
+        if request.transaction_id.startswith("bad"):
+            raise SunbayBusinessError(f"{request.transaction_id} failed", code="T0404")
+        return request.transaction_id
+
+
+def query(transaction_id: str) -> QueryRequest:
+    return QueryRequest(app_id="app", merchant_id="mch", transaction_id=transaction_id)
+
+
+def test_map_yields_in_completion_order():
+    executor = BulkExecutor(FakeClient({"slow": 0.3, "medium": 0.15, "fast": 0.0}), max_workers=3)
+    try:
+        results = list(executor.map([query("slow"), query("medium"), query("fast")]))
+    finally:
+        executor.shutdown()
+
+    assert [result.response for result in results] == ["fast", "medium", "slow"]
+    assert all(result.ok for result in results)
+
+
+def test_map_reports_errors_per_item():
+    executor = BulkExecutor(FakeClient({}), max_workers=2)
+    try:
+        results = {result.request.transaction_id: result for result in executor.map(map(query, ["a", "bad-1", "b"]))}
+    finally:
+        executor.shutdown()
+
+    assert results["a"].response == "a" and results["b"].response == "b"
+    assert not results["bad-1"].ok
+    assert isinstance(results["bad-1"].error, SunbayBusinessError)
+    assert results["bad-1"].response is None
+
+
+def test_map_pulls_at_most_max_in_flight_requests_ahead():
+    client = FakeClient({f"q{n}": 0.05 for n in range(10)})
+    executor = BulkExecutor(client, max_workers=4)
+    pulled = []
+
+    def requests():
+        for n in range(10):
+            pulled.append(n)
+            yield query(f"q{n}")
+
+    try:
+        results = executor.map(requests(), max_in_flight=2)
+        next(results)
+        assert len(pulled) <= 3
+        assert len(list(results)) == 9
+    finally:
+        executor.shutdown()
+
+
+def test_submit_resolves_to_the_error_of_the_call():
+    executor = BulkExecutor(FakeClient({}), max_workers=1)
+    try:
+        assert executor.submit(query("ok")).result() == "ok"
+        with pytest.raises(SunbayBusinessError):
+            executor.submit(query("bad")).result()
+        with pytest.raises(SunbayBusinessError):
+            executor.submit(object())
+    finally:
+        executor.shutdown()
+
+
+def bulk_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("sunbay-bulk")]
+
+
+def test_close_stops_the_workers_without_abandoning_calls_in_flight():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        server.path_faults[PATH_SALE] = FaultConfig(latency=Latency("fixed", 0.3))
+        client = NexusClient(api_key="k", base_url=server.base_url)
+        future = client.submit(
+            SaleRequest(
+                app_id="app",
+                merchant_id="mch",
+                reference_order_id="order-1",
+                transaction_request_id="txn-1",
+                amount=SaleAmount(order_amount=100, price_currency="USD"),
+                description="test",
+                terminal_sn="T1",
+            )
+        )
+        time.sleep(0.1)
+
+        assert client.close(timeout=5.0)
+        assert future.result(timeout=1.0).transaction_id
+        deadline = time.monotonic() + 2
+        while bulk_threads() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert bulk_threads() == []
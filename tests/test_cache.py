@@ -0,0 +1,49 @@
+from sunbay_nexus_sdk import QueryCache
+from sunbay_nexus_sdk.models.common import Amount
+from sunbay_nexus_sdk.models.request import QueryRequest
+from sunbay_nexus_sdk.models.response import QueryResponse
+
+
+def query_request() -> QueryRequest:
+    return QueryRequest(app_id="app", merchant_id="mch", transaction_id="txn-1")
+
+
+def query_response() -> QueryResponse:
+    return QueryResponse(
+        code="0",
+        transaction_id="txn-1",
+        transaction_request_id="req-1",
+        transaction_status="S",
+    )
+
+
+def test_put_refuses_a_response_older_than_an_invalidation():
+    cache = QueryCache()
+    generation = cache.generation  # query sent
+    cache.invalidate("app", "mch", transaction_id="txn-1")  # refund sent meanwhile
+
+    assert not cache.put(query_request(), query_response(), generation)
+    assert cache.get(query_request()) is None
+    assert cache.put(query_request(), query_response(), cache.generation)
+    assert cache.get(query_request()).transaction_status == "S"
+
+
+def test_invalidating_another_transaction_keeps_put_working():
+    cache = QueryCache()
+    generation = cache.generation
+    cache.invalidate("app", "mch", transaction_id="txn-2")
+
+    assert cache.put(query_request(), query_response(), generation)
+
+
+def test_mutating_a_response_does_not_change_the_cached_one():
+    cache = QueryCache()
+    response = query_response()
+    response.amount = Amount(price_currency="USD", order_amount=100)
+    cache.put(query_request(), response)
+    response.amount.order_amount = 1
+
+    hit = cache.get(query_request())
+    assert hit.amount.order_amount == 100
+    hit.amount.order_amount = 2
+    assert cache.get(query_request()).amount.order_amount == 100
@@ -0,0 +1,129 @@
+import time
+
+import pytest
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from sunbay_nexus_sdk import (
+    CircuitBreakerConfig,
+    CircuitState,
+    NexusClient,
+    RetryPolicy,
+    SunbayCircuitOpenError,
+    SunbayNetworkError,
+)
+from sunbay_nexus_sdk.constants import PATH_QUERY, PATH_SALE
+from sunbay_nexus_sdk.http.circuit_breaker import CircuitBreaker
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import QueryRequest, SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig
+
+CONFIG = CircuitBreakerConfig(minimum_calls=2, window_size=4, open_duration=0.2, half_open_max_calls=2)
+QUERY = QueryRequest(app_id="app", merchant_id="mch", transaction_id="txn-1")
+
+
+def open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(PATH_QUERY, CONFIG)
+    for _ in range(2):
+        breaker.acquire()
+        breaker.record(False, 0.01)
+    return breaker
+
+
+def test_breaker_opens_half_opens_and_closes():
+    breaker = CircuitBreaker(PATH_QUERY, CONFIG)
+    breaker.acquire()
+    breaker.record(True, 0.01)
+    breaker.acquire()
+    breaker.record(False, 0.01)
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(SunbayCircuitOpenError) as excinfo:
+        breaker.acquire()
+    assert 0 < excinfo.value.retry_after <= 0.2
+
+    time.sleep(0.25)
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.acquire()
+    breaker.acquire()
+    with pytest.raises(SunbayCircuitOpenError):
+        breaker.acquire()  # only half_open_max_calls probes
+    breaker.record(True, 0.01)
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.record(True, 0.01)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_failed_probe_opens_the_breaker_again():
+    breaker = open_breaker()
+    time.sleep(0.25)
+    breaker.acquire()
+    breaker.record(False, 0.01)
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_release_gives_back_a_probe_permit():
+    breaker = open_breaker()
+    time.sleep(0.25)
+    breaker.acquire()
+    breaker.acquire()
+    breaker.release()
+
+    breaker.acquire()
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+def test_breakers_are_per_path():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        server.path_faults[PATH_QUERY] = FaultConfig(status_rates={503: 1.0})
+        with NexusClient(
+            api_key="k", base_url=server.base_url, circuit_breaker=CONFIG, retry_policy=RetryPolicy.no_retry()
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(SunbayNetworkError):
+                    client.query(QUERY)
+            with pytest.raises(SunbayCircuitOpenError):
+                client.query(QUERY)
+            sale = SaleRequest(
+                app_id="app",
+                merchant_id="mch",
+                reference_order_id="order-1",
+                transaction_request_id="txn-1",
+                amount=SaleAmount(order_amount=100, price_currency="USD"),
+                description="test",
+                terminal_sn="T1",
+            )
+            assert client.sale(sale).transaction_id
+
+            states = client.circuit_breaker_states()
+        assert states[PATH_QUERY].state is CircuitState.OPEN
+        assert states[PATH_SALE].state is CircuitState.CLOSED
+        assert server.stats()["path." + PATH_QUERY] == 2
+
+
+class _FailingAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        raise RuntimeError("not a network error")
+
+
+def test_non_network_exception_releases_the_probe_permit():
+    session = Session()
+    session.mount("http://", _FailingAdapter())
+    with NexusClient(
+        api_key="k", base_url="http://nexus.invalid", session=session, circuit_breaker=CONFIG
+    ) as client:
+        breaker = client._http_client._circuit_breakers.get(PATH_QUERY)
+        for _ in range(2):
+            breaker.acquire()
+            breaker.record(False, 0.01)
+        time.sleep(0.25)
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                client.query(QUERY)
+        # Neither an outcome nor a leaked permit: both probes are still available.
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.acquire()
+        breaker.acquire()
@@ -0,0 +1,56 @@
+import threading
+import time
+
+import pytest
+
+from sunbay_nexus_sdk import NexusClient, RequestCoalescer, RequestOptions, SunbayBusinessError
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.models.request import QueryRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig, Latency
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        server.path_faults[PATH_QUERY] = FaultConfig(latency=Latency("fixed", 0.3))
+        yield server
+
+
+def query_twice(client: NexusClient, second_options) -> None:
+    # Both calls return "not found"; only the number of requests sent matters.
+    request = QueryRequest(app_id="app", merchant_id="mch", transaction_id="txn-1")
+
+    def query(options) -> None:
+        try:
+            client.query(request, options)
+        except SunbayBusinessError:
+            pass
+
+    first = threading.Thread(target=query, args=(None,))
+    first.start()
+    time.sleep(0.1)
+    query(second_options)
+    first.join()
+
+
+def test_identical_queries_are_coalesced(server):
+    coalescer = RequestCoalescer()
+    with NexusClient(api_key="k", base_url=server.base_url, coalescer=coalescer) as client:
+        query_twice(client, None)
+
+    assert server.stats()["path." + PATH_QUERY] == 1
+    assert coalescer.stats().joined == 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    [RequestOptions(headers={"traceparent": "00-abc-01"}), RequestOptions(request_id="req-1")],
+)
+def test_queries_with_their_own_options_are_not_coalesced(server, options):
+    coalescer = RequestCoalescer()
+    with NexusClient(api_key="k", base_url=server.base_url, coalescer=coalescer) as client:
+        query_twice(client, options)
+
+    assert server.stats()["path." + PATH_QUERY] == 2
+    assert coalescer.stats().joined == 0
@@ -0,0 +1,77 @@
+import os
+import time
+
+import pytest
+
+from sunbay_nexus_sdk import LaneState, NexusClient, TerminalDispatcher, TransactionStatusTracker
+from sunbay_nexus_sdk.constants import PATH_SALE
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig, Latency
+
+
+def sale_request(transaction_request_id: str, terminal_sn: str) -> SaleRequest:
+    return SaleRequest(
+        app_id="app",
+        merchant_id="mch",
+        reference_order_id=transaction_request_id,
+        transaction_request_id=transaction_request_id,
+        amount=SaleAmount(order_amount=100, price_currency="USD"),
+        description="test",
+        terminal_sn=terminal_sn,
+    )
+
+
+@pytest.fixture
+def client():
+    with StubServer(processing_time=0.0, seed=1) as server, NexusClient(
+        api_key="k", base_url=server.base_url
+    ) as client:
+        client.server = server
+        yield client
+
+
+def test_idle_lanes_are_dropped(client):
+    with TerminalDispatcher(client, max_concurrency=4) as dispatcher:
+        futures = [dispatcher.submit(sale_request(f"txn-{i}", f"T{i % 10}")) for i in range(50)]
+        for future in futures:
+            assert future.result().transaction_id
+        deadline = time.monotonic() + 5
+        while dispatcher.lanes() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert dispatcher.lanes() == {}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_does_not_inherit_busy_lanes(client):
+    client.server.path_faults[PATH_SALE] = FaultConfig(latency=Latency("fixed", 1.0))
+    with TerminalDispatcher(client) as dispatcher:
+        running = dispatcher.submit(sale_request("parent", "T1"))
+        time.sleep(0.2)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                ok = dispatcher.lanes() == {} and dispatcher.submit(sale_request("child", "T1")).result(timeout=5)
+            except BaseException:
+                ok = False
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        running.result()
+    assert os.WEXITSTATUS(status) == 0
+
+
+def test_lanes_report_running_and_held_calls():
+    with StubServer(processing_time=0.6, seed=1) as server, NexusClient(
+        api_key="k", base_url=server.base_url
+    ) as client, TransactionStatusTracker(client, initial_delay=0.1, max_delay=0.1) as tracker:
+        server.path_faults[PATH_SALE] = FaultConfig(latency=Latency("fixed", 0.3))
+        with TerminalDispatcher(client, tracker=tracker) as dispatcher:
+            first = dispatcher.submit(sale_request("txn-1", "T1"))
+            dispatcher.submit(sale_request("txn-2", "T1"))
+            time.sleep(0.1)
+            assert dispatcher.lanes()["T1"][:2] == (1, LaneState.RUNNING)
+
+            first.result()
+            time.sleep(0.05)
+            assert dispatcher.lanes()["T1"][:2] == (1, LaneState.HELD)
@@ -0,0 +1,185 @@
+import json
+import logging
+import os
+import socket
+import stat
+import threading
+import time
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+import pytest
+
+from sunbay_nexus_sdk import NexusClient, RetryBudget, SunbayBusinessError
+from sunbay_nexus_sdk.constants import PATH_SALE
+from sunbay_nexus_sdk.http.forks import LazyThreadPool
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig, Latency
+
+needs_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+
+
+def sale_request(tag: str, index: int = 0) -> SaleRequest:
+    return SaleRequest(
+        app_id="app",
+        merchant_id="mch",
+        reference_order_id=f"{tag}-{index}",
+        transaction_request_id=f"{tag}-{index}",
+        amount=SaleAmount(order_amount=100, price_currency="USD"),
+        description="fork safety",
+        terminal_sn="T1",
+    )
+
+
+@pytest.fixture
+def server():
+    logging.getLogger("sunbay_nexus_sdk").setLevel(logging.CRITICAL)
+    with StubServer(processing_time=0.0, seed=1) as server:
+        yield server
+
+
+def in_child(check: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    # Run ``check`` in a forked child and return its result.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            result = check()
+        except BaseException as exc:  # noqa: B902 - reported to the parent
+            result = {"crash": repr(exc)}
+        os.write(write_fd, json.dumps(result).encode("utf-8"))
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        payload = pipe.read()
+    os.waitpid(pid, 0)
+    result = json.loads(payload or b'{"crash": "no result"}')
+    assert "crash" not in result, result["crash"]
+    return result
+
+
+def address_of(server: StubServer) -> Tuple[str, int]:
+    host, port = server.base_url.rsplit("//", 1)[1].split(":")
+    return socket.gethostbyname(host), int(port)
+
+
+def sockets_to(address: Tuple[str, int]) -> Set[int]:
+    # Local ports of this process's sockets connected to ``address``.
+    ports = set()
+    for name in os.listdir("/proc/self/fd") if os.path.isdir("/proc/self/fd") else range(3, 1024):
+        fd = int(name)
+        try:
+            if not stat.S_ISSOCK(os.fstat(fd).st_mode):
+                continue
+            # fromfd duplicates the descriptor, so the original is left alone.
+            with socket.fromfd(fd, socket.AF_INET, socket.SOCK_STREAM) as sock:
+                if sock.getpeername()[:2] == address:
+                    ports.add(sock.getsockname()[1])
+        except OSError:
+            continue
+    return ports
+
+
+def pool_ports(client: NexusClient) -> Set[int]:
+    # Local ports of the open sockets of the client's pool connections.
+    ports = set()
+    for conn in list(client._http_client._adapter.poolmanager.connections):
+        sock = getattr(conn, "sock", None)
+        if sock is not None and sock.fileno() != -1:
+            try:
+                ports.add(sock.getsockname()[1])
+            except OSError:
+                continue
+    return ports
+
+
+@needs_fork
+def test_forked_child_opens_its_own_connections_under_load(server):
+    client = NexusClient(api_key="k", base_url=server.base_url, max_connections=8, read_timeout=10.0)
+    client.warm_up(4)
+    stop = threading.Event()
+    parent_errors: List[str] = []
+
+    def load(worker: int) -> None:
+        index = 0
+        while not stop.is_set():
+            try:
+                client.sale(sale_request(f"parent{worker}", index))
+            except Exception as exc:  # noqa: B902 - counted below
+                parent_errors.append(repr(exc))
+            index += 1
+
+    threads = [threading.Thread(target=load, args=(n,), daemon=True) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for number in range(3):
+            parent_ports = sockets_to(address_of(server))
+
+            def child(number: int = number, parent_ports: Set[int] = parent_ports) -> Dict[str, Any]:
+                used: Set[int] = set()
+                for index in range(20):
+                    client.sale(sale_request(f"child{number}", index))
+                    used.update(pool_ports(client))
+                drained = client.close(timeout=5.0)
+                return {"shared": sorted(used & parent_ports), "leaked": sorted(pool_ports(client)), "drained": drained}
+
+            assert in_child(child) == {"shared": [], "leaked": [], "drained": True}
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert parent_errors == []
+    assert client.close(timeout=5.0)
+
+
+@needs_fork
+def test_calls_in_flight_in_the_parent_do_not_block_close_in_the_child(server):
+    server.path_faults[PATH_SALE] = FaultConfig(latency=Latency("fixed", 1.0))
+    client = NexusClient(api_key="k", base_url=server.base_url)
+    thread = threading.Thread(target=client.sale, args=(sale_request("slow"),))
+    thread.start()
+    time.sleep(0.3)
+    try:
+        assert in_child(lambda: {"drained": client.close(timeout=0.5)}) == {"drained": True}
+    finally:
+        thread.join()
+        client.close()
+
+
+@needs_fork
+def test_locks_held_at_fork_are_replaced_in_the_child():
+    budget = RetryBudget()
+    pool = LazyThreadPool(1, "fork-test")
+    pool.get().submit(lambda: None).result()
+    budget._lock.acquire()
+    try:
+
+        def child() -> Dict[str, Any]:
+            acquired = budget._lock.acquire(timeout=1.0)
+            worker_ran = pool.get().submit(lambda: True).result(timeout=1.0)
+            return {"acquired": acquired, "worker_ran": worker_ran}
+
+        assert in_child(child) == {"acquired": True, "worker_ran": True}
+    finally:
+        budget._lock.release()
+        pool.shutdown()
+
+
+def test_close_waits_for_calls_in_flight(server):
+    server.path_faults[PATH_SALE] = FaultConfig(latency=Latency("fixed", 0.5))
+    client = NexusClient(api_key="k", base_url=server.base_url)
+    responses = []
+    thread = threading.Thread(target=lambda: responses.append(client.sale(sale_request("drain"))))
+    thread.start()
+    time.sleep(0.2)
+
+    assert not client.close(timeout=0.05)
+    assert client.close(timeout=5.0)
+    thread.join()
+    assert responses[0].transaction_id
+    with pytest.raises(SunbayBusinessError):
+        client.sale(sale_request("after-close"))
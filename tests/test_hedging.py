@@ -0,0 +1,121 @@
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+from sunbay_nexus_sdk import HedgePolicy, MetricsRegistry, NexusClient, SunbayBusinessError
+from sunbay_nexus_sdk.constants import PATH_QUERY, PATH_SALE
+from sunbay_nexus_sdk.http.metrics import HEDGES
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import QueryRequest, SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig, Latency
+
+QUERY = QueryRequest(app_id="app", merchant_id="mch", transaction_id="txn-1")
+SLOW = FaultConfig(latency=Latency("fixed", 1.0))
+
+
+class _ClosingAdapter(HTTPAdapter):
+    # Records every response and which of them were closed.
+    def __init__(self) -> None:
+        super().__init__()
+        self.responses: List[Response] = []
+        self.closed: List[Response] = []
+
+    def build_response(self, req, resp):  # type: ignore[no-untyped-def]
+        response = super().build_response(req, resp)
+        close = response.close
+
+        def recording_close() -> None:
+            self.closed.append(response)
+            close()
+
+        response.close = recording_close  # type: ignore[assignment]
+        self.responses.append(response)
+        return response
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        yield server
+
+
+def hedged_client(server: StubServer, metrics: MetricsRegistry, session: Optional[Session] = None) -> NexusClient:
+    policy = HedgePolicy(delay=0.2, percentile=None, max_extra_ratio=1.0)
+    return NexusClient(
+        api_key="k", base_url=server.base_url, hedge_policy=policy, metrics=metrics, session=session
+    )
+
+
+def served(server: StubServer, path: str) -> int:
+    return server.stats().get("path." + path, 0)
+
+
+def test_slow_get_is_hedged_and_the_first_answer_wins(server):
+    server.path_faults[PATH_QUERY] = SLOW
+    # Only the original request is slow: the hedge arrives after the fault is lifted.
+    threading.Timer(0.1, server.path_faults.pop, args=(PATH_QUERY,)).start()
+    metrics = MetricsRegistry()
+    with hedged_client(server, metrics) as client:
+        started = time.monotonic()
+        with pytest.raises(SunbayBusinessError):
+            client.query(QUERY)
+        elapsed = time.monotonic() - started
+
+    assert 0.2 <= elapsed < 1.0
+    assert metrics.value(HEDGES, path=PATH_QUERY, method="GET", won="true") == 1
+    assert metrics.value(HEDGES, path=PATH_QUERY, method="GET", won="false") == 0
+
+
+def test_fast_get_is_not_hedged(server):
+    metrics = MetricsRegistry()
+    with hedged_client(server, metrics) as client:
+        with pytest.raises(SunbayBusinessError):
+            client.query(QUERY)
+    assert served(server, PATH_QUERY) == 1
+    assert metrics.value(HEDGES, path=PATH_QUERY, method="GET", won="true") == 0
+
+
+def test_post_is_never_hedged(server):
+    server.path_faults[PATH_SALE] = FaultConfig(latency=Latency("fixed", 0.5))
+    metrics = MetricsRegistry()
+    request = SaleRequest(
+        app_id="app",
+        merchant_id="mch",
+        reference_order_id="order-1",
+        transaction_request_id="req-1",
+        amount=SaleAmount(order_amount=100, price_currency="USD"),
+        description="hedging",
+        terminal_sn="T1",
+    )
+    with hedged_client(server, metrics) as client:
+        client.sale(request)
+    assert served(server, PATH_SALE) == 1
+    assert metrics.value(HEDGES, path=PATH_SALE, method="POST", won="true") == 0
+    assert metrics.value(HEDGES, path=PATH_SALE, method="POST", won="false") == 0
+
+
+def test_losing_response_is_closed(server):
+    server.path_faults[PATH_QUERY] = SLOW
+    threading.Timer(0.1, server.path_faults.pop, args=(PATH_QUERY,)).start()
+    adapter = _ClosingAdapter()
+    session = Session()
+    session.mount("http://", adapter)
+    with hedged_client(server, MetricsRegistry(), session=session) as client:
+        with pytest.raises(SunbayBusinessError):
+            client.query(QUERY)
+        assert len(adapter.responses) == 1
+        assert adapter.closed == []
+
+        # The original request is left to finish, then its response is closed.
+        deadline = time.monotonic() + 5.0
+        while len(adapter.closed) < 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    session.close()
+
+    assert len(adapter.responses) == 2
+    assert adapter.closed == [adapter.responses[1]]
@@ -0,0 +1,142 @@
+import logging
+
+import pytest
+
+from sunbay_nexus_sdk import NexusClient, RequestHooks, RetryPolicy, SunbayBusinessError, SunbayNetworkError
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import QueryRequest, SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig
+
+
+class Recorder(RequestHooks):
+    def __init__(self):
+        self.events = []
+        self.contexts = []
+
+    def _record(self, event, context):
+        self.events.append(f"{event}:{context.attempt}")
+        self.contexts.append(context)
+
+    def before_send(self, context):
+        self._record("before_send", context)
+
+    def after_receive(self, context):
+        self._record("after_receive", context)
+
+    def on_retry(self, context, delay):
+        self._record("on_retry", context)
+
+    def on_error(self, context):
+        self._record("on_error", context)
+
+
+class Failing(RequestHooks):
+    def before_send(self, context):
+        raise RuntimeError("before_send")
+
+    def after_receive(self, context):
+        raise RuntimeError("after_receive")
+
+    def on_retry(self, context, delay):
+        raise RuntimeError("on_retry")
+
+    def on_error(self, context):
+        raise RuntimeError("on_error")
+
+
+class HealOnRetry(RequestHooks):
+    # Clears the injected fault once the first attempt failed.
+    def __init__(self, server):
+        self.server = server
+
+    def on_retry(self, context, delay):
+        self.server.path_faults[PATH_QUERY] = FaultConfig()
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        yield server
+
+
+def client_with(server, *hooks, max_attempts=2):
+    policy = RetryPolicy(max_attempts=max_attempts, backoff_base=0.001)
+    return NexusClient(api_key="k", base_url=server.base_url, hooks=hooks, retry_policy=policy)
+
+
+def transaction_id(server) -> str:
+    with NexusClient(api_key="k", base_url=server.base_url) as client:
+        request = SaleRequest(
+            app_id="app",
+            merchant_id="mch",
+            reference_order_id="order-1",
+            transaction_request_id="txn-1",
+            amount=SaleAmount(order_amount=100, price_currency="USD"),
+            description="test",
+            terminal_sn="T1",
+        )
+        return client.sale(request).transaction_id
+
+
+def test_retried_call_fires_on_retry_between_attempts_and_after_receive_once(server):
+    query = QueryRequest(app_id="app", merchant_id="mch", transaction_id=transaction_id(server))
+    recorder = Recorder()
+    server.path_faults[PATH_QUERY] = FaultConfig(status_rates={503: 1.0})
+    with client_with(server, HealOnRetry(server), recorder) as client:
+        response = client.query(query)
+
+    assert recorder.events == ["before_send:1", "on_retry:1", "before_send:2", "after_receive:2"]
+    context = recorder.contexts[-1]
+    assert context.response is response
+    assert context.status == 200
+    assert context.elapsed is not None
+
+
+def test_failed_call_fires_on_error_once(server):
+    recorder = Recorder()
+    server.path_faults[PATH_QUERY] = FaultConfig(status_rates={503: 1.0})
+    with client_with(server, recorder) as client, pytest.raises(SunbayNetworkError) as excinfo:
+        client.query(QueryRequest(app_id="app", merchant_id="mch", transaction_id="txn-1"))
+
+    assert recorder.events == ["before_send:1", "on_retry:1", "before_send:2", "on_error:2"]
+    assert recorder.contexts[-1].error is excinfo.value
+
+
+def test_business_error_fires_on_error_without_retry(server):
+    recorder = Recorder()
+    with client_with(server, recorder) as client, pytest.raises(SunbayBusinessError):
+        client.query(QueryRequest(app_id="app", merchant_id="mch", transaction_id="no-such-transaction"))
+
+    assert recorder.events == ["before_send:1", "on_error:1"]
+
+
+def test_hook_exceptions_are_logged_and_swallowed(server, caplog):
+    query = QueryRequest(app_id="app", merchant_id="mch", transaction_id=transaction_id(server))
+    recorder = Recorder()
+    server.path_faults[PATH_QUERY] = FaultConfig(status_rates={503: 1.0})
+    with caplog.at_level(logging.ERROR, logger="sunbay_nexus_sdk"):
+        with client_with(server, Failing(), HealOnRetry(server), recorder) as client:
+            assert client.query(query).transaction_id
+        with client_with(server, Failing(), recorder, max_attempts=1) as client, pytest.raises(SunbayBusinessError):
+            client.query(QueryRequest(app_id="app", merchant_id="mch", transaction_id="no-such-transaction"))
+
+    # Hooks after the failing one still ran.
+    assert recorder.events == [
+        "before_send:1",
+        "on_retry:1",
+        "before_send:2",
+        "after_receive:2",
+        "before_send:1",
+        "on_error:1",
+    ]
+    failed = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Request hook")]
+    assert failed == [
+        "Request hook Failing.before_send failed",
+        "Request hook Failing.on_retry failed",
+        "Request hook Failing.before_send failed",
+        "Request hook Failing.after_receive failed",
+        "Request hook Failing.before_send failed",
+        "Request hook Failing.on_error failed",
+    ]
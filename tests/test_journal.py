@@ -0,0 +1,131 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from sunbay_nexus_sdk import (
+    JournalState,
+    NexusClient,
+    RateLimit,
+    RateLimiter,
+    SqliteJournal,
+    SunbayBusinessError,
+    SunbayNetworkError,
+    SunbayRateLimitedError,
+)
+from sunbay_nexus_sdk.constants import PATH_QUERY, PATH_SALE
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig, Latency
+
+
+def sale_request(transaction_request_id: str = "txn-1") -> SaleRequest:
+    return SaleRequest(
+        app_id="app",
+        merchant_id="mch",
+        reference_order_id=transaction_request_id,
+        transaction_request_id=transaction_request_id,
+        amount=SaleAmount(order_amount=100, price_currency="USD"),
+        description="test",
+        terminal_sn="T1",
+    )
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = SqliteJournal(str(tmp_path / "journal.db"), resolve_delay=0.1)
+    yield journal
+    journal.close()
+
+
+def calls(server: StubServer, path: str) -> int:
+    return server.stats().get("path." + path, 0)
+
+
+def test_clients_sharing_a_journal_wait_for_the_owner(server, journal):
+    server.path_faults[PATH_SALE] = FaultConfig(latency=Latency("fixed", 0.5))
+    with NexusClient(api_key="k", base_url=server.base_url, journal=journal) as first, NexusClient(
+        api_key="k", base_url=server.base_url, journal=journal
+    ) as second:
+        responses = []
+        thread = threading.Thread(target=lambda: responses.append(first.sale(sale_request())))
+        thread.start()
+        time.sleep(0.1)
+        response = second.sale(sale_request())
+        thread.join()
+
+    assert response.transaction_id == responses[0].transaction_id
+    assert calls(server, PATH_SALE) == 1
+    assert calls(server, PATH_QUERY) == 0
+
+
+def test_unknown_outcome_is_not_resent_when_query_fails_with_another_code(server, journal):
+    # The response of the sale is lost, and query answers with a business
+    # error that does not mean "not found".
+    server.path_faults[PATH_SALE] = FaultConfig(slow_body_rate=1.0, slow_body_chunks=2, slow_body_delay=0.6)
+    server.path_faults[PATH_QUERY] = FaultConfig(error_rate=1.0)
+    with NexusClient(api_key="k", base_url=server.base_url, read_timeout=0.3, journal=journal) as client:
+        with pytest.raises(SunbayNetworkError):
+            client.sale(sale_request())
+
+    assert calls(server, PATH_SALE) == 1
+    assert journal.get(("app", "mch", "txn-1")).state == JournalState.PENDING
+
+
+def test_rate_limited_call_is_not_resolved_and_stays_claimable(server, journal):
+    limiter = RateLimiter(global_limit=RateLimit(1.0, burst=0), max_wait=0)
+    with NexusClient(api_key="k", base_url=server.base_url, journal=journal, rate_limiter=limiter) as client:
+        with pytest.raises(SunbayRateLimitedError):
+            client.sale(sale_request())
+
+    assert calls(server, PATH_SALE) == 0
+    assert calls(server, PATH_QUERY) == 0
+    assert journal.get(("app", "mch", "txn-1")).state == JournalState.REJECTED
+    with NexusClient(api_key="k", base_url=server.base_url, journal=journal) as client:
+        assert client.sale(sale_request()).transaction_id
+    assert calls(server, PATH_SALE) == 1
+
+
+def test_reused_transaction_request_id_with_another_body_is_refused(server, journal):
+    with NexusClient(api_key="k", base_url=server.base_url, journal=journal) as client:
+        client.sale(sale_request())
+        changed = sale_request()
+        changed.amount = SaleAmount(order_amount=999, price_currency="USD")
+        with pytest.raises(SunbayBusinessError):
+            client.sale(changed)
+        assert client.sale(sale_request()).transaction_id
+
+    assert calls(server, PATH_SALE) == 1
+
+
+def test_journal_without_fingerprints_is_migrated(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE sunbay_journal ("
+        " app_id TEXT NOT NULL, merchant_id TEXT NOT NULL, transaction_request_id TEXT NOT NULL,"
+        " path TEXT NOT NULL, state TEXT NOT NULL, owner TEXT, response TEXT, error TEXT,"
+        " created_at REAL NOT NULL, updated_at REAL NOT NULL,"
+        " PRIMARY KEY (app_id, merchant_id, transaction_request_id))"
+    )
+    conn.execute(
+        "INSERT INTO sunbay_journal VALUES ('app', 'mch', 'old', ?, 'REJECTED', NULL, NULL, NULL, 0, 0)", (PATH_SALE,)
+    )
+    conn.commit()
+    conn.close()
+
+    journal = SqliteJournal(path)
+    try:
+        assert journal.get(("app", "mch", "old")).fingerprint is None
+        assert journal.claim(("app", "mch", "new"), PATH_SALE, "owner", "abc") is None
+        assert journal.get(("app", "mch", "new")).fingerprint == "abc"
+    finally:
+        journal.close()
@@ -0,0 +1,85 @@
+import logging
+
+import pytest
+
+from sunbay_nexus_sdk import LoggingPolicy, NexusClient, RetryPolicy, SunbayBusinessError, SunbayNetworkError
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import QueryRequest, SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig
+
+QUERY = QueryRequest(app_id="app", merchant_id="mch", transaction_id="no-such-transaction")
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    policy = LoggingPolicy(slow_threshold=60.0)
+    with NexusClient(
+        api_key="k", base_url=server.base_url, logging_policy=policy, retry_policy=RetryPolicy.no_retry()
+    ) as client:
+        yield client
+
+
+def call_logs(caplog):
+    return [r.getMessage() for r in caplog.records if r.levelno == logging.INFO and r.name == "sunbay_nexus_sdk.http"]
+
+
+def test_slow_only_mode_logs_transport_failures(server, client, caplog):
+    server.path_faults[PATH_QUERY] = FaultConfig(reset_rate=1.0)
+    with caplog.at_level(logging.INFO, logger="sunbay_nexus_sdk.http"), pytest.raises(SunbayNetworkError):
+        client.query(QUERY)
+
+    messages = call_logs(caplog)
+    assert [m.split(" ")[0] for m in messages] == ["Request", "Failed"]
+
+
+def test_slow_only_mode_logs_http_and_business_errors(server, client, caplog):
+    with caplog.at_level(logging.INFO, logger="sunbay_nexus_sdk.http"):
+        with pytest.raises(SunbayBusinessError):
+            client.query(QUERY)
+        server.path_faults[PATH_QUERY] = FaultConfig(status_rates={500: 1.0})
+        with pytest.raises(SunbayNetworkError):
+            client.query(QUERY)
+
+    messages = call_logs(caplog)
+    assert [m.split(" ")[0] for m in messages] == ["Request", "Failed", "Request", "Response"]
+    assert "T0404" in messages[1]
+    assert "Status: 500" in messages[3]
+
+
+def test_slow_only_mode_skips_fast_successes(client, caplog):
+    sale = SaleRequest(
+        app_id="app",
+        merchant_id="mch",
+        reference_order_id="txn-1",
+        transaction_request_id="txn-1",
+        amount=SaleAmount(order_amount=100, price_currency="USD"),
+        description="test",
+        terminal_sn="T1",
+    )
+    with caplog.at_level(logging.INFO, logger="sunbay_nexus_sdk.http"):
+        transaction_id = client.sale(sale).transaction_id
+        client.query(QueryRequest(app_id="app", merchant_id="mch", transaction_id=transaction_id))
+
+    assert call_logs(caplog) == []
+
+
+@pytest.mark.parametrize(
+    "policy", [LoggingPolicy(log_bodies=False), LoggingPolicy(max_body_length=5, redact_fields=("msg",))]
+)
+def test_http_error_message_does_not_depend_on_the_logging_policy(server, policy):
+    server.path_faults[PATH_QUERY] = FaultConfig(status_rates={500: 1.0})
+    with NexusClient(
+        api_key="k", base_url=server.base_url, logging_policy=policy, retry_policy=RetryPolicy.no_retry()
+    ) as client, pytest.raises(SunbayNetworkError) as excinfo:
+        client.query(QUERY)
+
+    assert excinfo.value.args[0].startswith("HTTP 500 (Server Error) - {")
+    assert "Injected fault" in excinfo.value.args[0]
@@ -0,0 +1,82 @@
+import re
+
+import pytest
+
+from sunbay_nexus_sdk import (
+    MetricsRegistry,
+    NexusClient,
+    RequestOptions,
+    RetryPolicy,
+    SunbayBusinessError,
+    SunbayNetworkError,
+    render_prometheus,
+)
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.http.metrics import REQUEST_DURATION
+from sunbay_nexus_sdk.models.request import QueryRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig
+
+QUERY = QueryRequest(app_id="app", merchant_id="mch", transaction_id="no-such-transaction")
+LABELS = f'method="GET",path="{PATH_QUERY}"'
+SAMPLE = re.compile(r'^[a-z_]+(\{[a-z_]+="[^"]*"(,[a-z_]+="[^"]*")*\})? (\d+|\d+\.\d+(e-?\d+)?|\+Inf)$')
+
+
+@pytest.fixture
+def rendered():
+    metrics = MetricsRegistry(buckets=(0.5, 60.0))
+    with StubServer(processing_time=0.0, seed=1) as server, NexusClient(
+        api_key="k",
+        base_url=server.base_url,
+        metrics=metrics,
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.001),
+    ) as client:
+        server.path_faults[PATH_QUERY] = FaultConfig(status_rates={503: 1.0})
+        with pytest.raises(SunbayNetworkError):
+            client.query(QUERY)  # two attempts, one retry
+        server.path_faults[PATH_QUERY] = FaultConfig(reset_rate=1.0)
+        with pytest.raises(SunbayNetworkError):
+            client.query(QUERY, RequestOptions(retry_policy=RetryPolicy.no_retry()))
+        server.path_faults[PATH_QUERY] = FaultConfig()
+        with pytest.raises(SunbayBusinessError):
+            client.query(QUERY)  # HTTP 200 with business code T0404
+    return metrics, render_prometheus(metrics)
+
+
+def test_counters_are_rendered(rendered):
+    _, text = rendered
+    lines = text.splitlines()
+
+    assert f"sunbay_responses_total{{{LABELS},status=\"503\"}} 2" in lines
+    assert f"sunbay_responses_total{{{LABELS},status=\"200\"}} 1" in lines
+    assert f"sunbay_retries_total{{{LABELS}}} 1" in lines
+    assert f"sunbay_business_codes_total{{code=\"T0404\",{LABELS}}} 1" in lines
+    assert f"sunbay_transport_errors_total{{error=\"ConnectionError\",{LABELS}}} 1" in lines
+
+
+def test_attempt_phases_are_rendered_as_histograms(rendered):
+    metrics, text = rendered
+    lines = text.splitlines()
+
+    total = f'{REQUEST_DURATION}_bucket{{{LABELS},phase="total",le="%s"}} 4'
+    assert total % "60" in lines and total % "+Inf" in lines
+    assert f'{REQUEST_DURATION}_count{{{LABELS},phase="total"}} 4' in lines
+    # Time to first byte exists only for attempts that got a response.
+    assert f'{REQUEST_DURATION}_count{{{LABELS},phase="ttfb"}} 3' in lines
+    # Connect time is recorded for new connections only.
+    assert 1 <= metrics.histogram(REQUEST_DURATION, path=PATH_QUERY, method="GET", phase="connect").count <= 4
+
+
+def test_exposition_format(rendered):
+    _, text = rendered
+    assert text.endswith("\n")
+    declared = []
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            name, kind = line.split()[2:]
+            assert kind in ("counter", "gauge", "histogram")
+            declared.append(name)
+        elif not line.startswith("# HELP "):
+            assert SAMPLE.match(line), line
+            assert re.sub(r"(_bucket|_sum|_count)?(\{.*)? .*$", "", line) == declared[-1]
+    assert len(declared) == len(set(declared))
@@ -0,0 +1,70 @@
+import socket
+
+import pytest
+
+from sunbay_nexus_sdk import MetricsRegistry, NexusClient, PoolConfig, SunbayBusinessError, SunbayNetworkError
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.http.metrics import REQUEST_DURATION
+from sunbay_nexus_sdk.models.request import QueryRequest
+from sunbay_nexus_sdk.testing import StubServer
+
+QUERY = QueryRequest(app_id="app", merchant_id="mch", transaction_id="no-such-transaction")
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        yield server
+
+
+def open_sockets(client: NexusClient):
+    conns = client._http_client._adapter.poolmanager.connections
+    return [conn.sock for conn in list(conns) if getattr(conn, "sock", None) is not None]
+
+
+def test_warm_up_opens_pooled_connections_used_by_the_calls(server):
+    metrics = MetricsRegistry()
+    with NexusClient(api_key="k", base_url=server.base_url, metrics=metrics) as client:
+        assert client.warm_up(3) == 3
+        assert len(open_sockets(client)) == 3
+
+        for _ in range(3):
+            with pytest.raises(SunbayBusinessError):
+                client.query(QUERY)
+
+    # Every call reused a warmed connection: none was opened on the way.
+    assert metrics.histogram(REQUEST_DURATION, path=PATH_QUERY, method="GET", phase="connect") is None
+    assert metrics.histogram(REQUEST_DURATION, path=PATH_QUERY, method="GET", phase="total").count == 3
+
+
+def test_warm_up_is_capped_at_max_connections(server):
+    with NexusClient(api_key="k", base_url=server.base_url, max_connections=2) as client:
+        assert client.warm_up(5) == 2
+
+
+def test_warm_up_applies_the_pool_socket_options(server):
+    config = PoolConfig(tcp_keepalive=True, keepalive_idle=30)
+    with NexusClient(api_key="k", base_url=server.base_url, pool_config=config) as client:
+        client.warm_up(1)
+        (sock,) = open_sockets(client)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) == 1
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) == 1
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
+
+
+def test_warm_up_raises_when_no_connection_opens():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    # Nothing listens on the port any more.
+    with NexusClient(api_key="k", base_url=f"http://127.0.0.1:{port}", connect_timeout=1.0) as client:
+        with pytest.raises(SunbayNetworkError) as excinfo:
+            client.warm_up(2)
+    assert excinfo.value.retryable
+
+
+@pytest.mark.parametrize("settings", [{"num_pools": 0}, {"idle_ttl": 0}])
+def test_pool_config_rejects_invalid_settings(settings):
+    with pytest.raises(SunbayBusinessError):
+        PoolConfig(**settings)
@@ -0,0 +1,35 @@
+import time
+
+from sunbay_nexus_sdk import RateLimit, RateLimiter
+
+
+def test_refilled_buckets_are_dropped():
+    limiter = RateLimiter(per_api_key=RateLimit(100.0, burst=1), per_merchant=RateLimit(100.0, burst=1))
+    assert limiter.try_acquire(api_key="key", merchant_id="mch-1")
+    assert not limiter.try_acquire(api_key="key", merchant_id="mch-1")
+    time.sleep(0.05)
+
+    assert limiter.try_acquire(merchant_id="mch-2")
+    assert list(limiter.current_rates()) == ["merchant mch-2"]
+
+
+def test_refilled_buckets_behind_a_throttled_one_are_dropped_beyond_max_buckets():
+    limiter = RateLimiter(per_merchant=RateLimit(100.0, burst=1), max_buckets=2)
+    limiter.record_response(None, "mch-0", None, 429, retry_after="5")
+    assert limiter.try_acquire(merchant_id="mch-1")
+    assert limiter.try_acquire(merchant_id="mch-2")
+    time.sleep(0.05)
+
+    assert limiter.try_acquire(merchant_id="mch-3")
+    assert sorted(limiter.current_rates()) == ["merchant mch-0", "merchant mch-3"]
+
+
+def test_throttled_bucket_is_kept_beyond_max_buckets():
+    limiter = RateLimiter(per_merchant=RateLimit(0.001, burst=1), max_buckets=1)
+    limiter.record_response(None, "throttled", None, 429, retry_after="5")
+    for n in range(5):
+        assert limiter.try_acquire(merchant_id=f"mch-{n}")
+
+    assert "merchant throttled" in limiter.current_rates()
+    assert len(limiter.current_rates()) == 6
+    assert not limiter.try_acquire(merchant_id="throttled")
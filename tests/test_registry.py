@@ -0,0 +1,58 @@
+import pytest
+
+from sunbay_nexus_sdk import ClientRegistry, QueryCache, SunbayBusinessError
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import QueryRequest, SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+
+
+def base_url(client) -> str:
+    return client._http_client._base_url
+
+
+def test_sunbay_base_url_does_not_override_a_tenant_base_url(monkeypatch):
+    monkeypatch.setenv("SUNBAY_BASE_URL", "https://env.example")
+    registry = ClientRegistry()
+    registry.register("own", api_key="key-1", base_url="https://tenant.example")
+    registry.register("default", api_key="key-2")
+    try:
+        assert base_url(registry.get("own")) == "https://tenant.example"
+        assert base_url(registry.get("default")) == "https://env.example"
+    finally:
+        registry.close()
+
+
+@pytest.mark.parametrize("setting", ["query_cache", "journal", "coalescer", "rate_limiter"])
+def test_per_call_state_cannot_be_a_registry_default(setting):
+    with pytest.raises(SunbayBusinessError) as excinfo:
+        ClientRegistry(**{setting: object()})
+    assert setting in excinfo.value.args[0]
+
+
+def test_tenants_do_not_share_cached_queries():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        registry = ClientRegistry(base_url=server.base_url)
+        registry.register("a", api_key="key-a", query_cache=QueryCache())
+        registry.register("b", api_key="key-b", query_cache=QueryCache())
+        try:
+            sale = registry.get("a").sale(
+                SaleRequest(
+                    app_id="app",
+                    merchant_id="mch",
+                    reference_order_id="order-1",
+                    transaction_request_id="txn-1",
+                    amount=SaleAmount(order_amount=100, price_currency="USD"),
+                    description="test",
+                    terminal_sn="T1",
+                )
+            )
+            query = QueryRequest(app_id="app", merchant_id="mch", transaction_id=sale.transaction_id)
+            registry.get("a").query(query)
+            registry.get("a").query(query)
+            assert server.stats()["path." + PATH_QUERY] == 1
+
+            registry.get("b").query(query)
+            assert server.stats()["path." + PATH_QUERY] == 2
+        finally:
+            registry.close()
@@ -0,0 +1,86 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from sunbay_nexus_sdk import NexusClient, RetryBudget, RetryPolicy, SunbayNetworkError
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.http.retry import RetryStats, parse_retry_after
+from sunbay_nexus_sdk.models.request import QueryRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig
+
+QUERY = QueryRequest(app_id="app", merchant_id="mch", transaction_id="txn-1")
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.0, seed=1) as server:
+        yield server
+
+
+def queries(server: StubServer) -> int:
+    return server.stats().get("path." + PATH_QUERY, 0)
+
+
+def test_jittered_backoff_stays_within_the_exponential_ceiling():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+    for retry_number, ceiling in ((1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0), (10, 3.0)):
+        delays = [policy.backoff(retry_number) for _ in range(200)]
+        assert all(0.0 <= delay <= ceiling for delay in delays)
+        assert max(delays) > ceiling / 2
+    assert RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=False).backoff(3) == 2.0
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-4") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 28.0 <= parse_retry_after(later) <= 30.0
+    earlier = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(earlier) == 0.0
+
+
+def test_retry_after_longer_than_max_retry_after_stops_retrying():
+    policy = RetryPolicy(max_attempts=3, max_retry_after=1.0)
+    stats = RetryStats(attempts=1)
+    assert policy.next_delay("GET", stats, status=429, retry_after="5") is None
+    assert policy.next_delay("GET", stats, status=429, retry_after="0.5") >= 0.5
+    assert policy.next_delay("POST", stats, status=429) is None
+
+
+def test_429_waits_for_retry_after(server):
+    server.path_faults[PATH_QUERY] = FaultConfig(status_rates={429: 1.0}, retry_after=0.4)
+    policy = RetryPolicy(max_attempts=2, backoff_base=0.001)
+    with NexusClient(api_key="k", base_url=server.base_url, retry_policy=policy) as client:
+        started = time.monotonic()
+        with pytest.raises(SunbayNetworkError) as excinfo:
+            client.query(QUERY)
+
+    assert time.monotonic() - started >= 0.4
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.retry_stats.attempts == 2
+    assert excinfo.value.retry_stats.total_backoff >= 0.4
+    assert queries(server) == 2
+
+
+def test_exhausted_budget_stops_a_retry_storm(server):
+    server.path_faults[PATH_QUERY] = FaultConfig(status_rates={503: 1.0})
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, max_tokens=2.0)
+    policy = RetryPolicy(max_attempts=5, backoff_base=0.001, budget=budget)
+    with NexusClient(api_key="k", base_url=server.base_url, retry_policy=policy) as client:
+        errors = []
+        for _ in range(5):
+            with pytest.raises(SunbayNetworkError) as excinfo:
+                client.query(QUERY)
+            errors.append(excinfo.value)
+
+    # Two retries in the budget, then every call gets a single attempt.
+    assert queries(server) == 5 + 2
+    assert errors[-1].retry_stats.attempts == 1
+    assert errors[-1].retry_stats.budget_exhausted
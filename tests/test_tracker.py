@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from sunbay_nexus_sdk import NexusClient, SunbayBusinessError, TransactionStatusTracker
+from sunbay_nexus_sdk.constants import PATH_QUERY
+from sunbay_nexus_sdk.models.common import SaleAmount
+from sunbay_nexus_sdk.models.request import SaleRequest
+from sunbay_nexus_sdk.testing import StubServer
+from sunbay_nexus_sdk.testing.stub_server import FaultConfig
+
+
+@pytest.fixture
+def server():
+    with StubServer(processing_time=0.5, seed=1) as server:
+        yield server
+
+
+def sale(client: NexusClient, transaction_request_id: str = "txn-1") -> str:
+    request = SaleRequest(
+        app_id="app",
+        merchant_id="mch",
+        reference_order_id=transaction_request_id,
+        transaction_request_id=transaction_request_id,
+        amount=SaleAmount(order_amount=100, price_currency="USD"),
+        description="test",
+        terminal_sn="T1",
+    )
+    return client.sale(request).transaction_id
+
+
+def test_close_without_cancel_resolves_pending_futures(server):
+    with NexusClient(api_key="k", base_url=server.base_url) as client:
+        tracker = TransactionStatusTracker(client, initial_delay=0.1, max_delay=0.2, timeout=10)
+        future = tracker.track("app", "mch", transaction_id=sale(client))
+        tracker.close(cancel_pending=False)
+
+        assert future.done()
+        assert future.result().transaction_status == "S"
+
+
+def test_unknown_transaction_fails_at_once(server):
+    with NexusClient(api_key="k", base_url=server.base_url) as client:
+        with TransactionStatusTracker(client, initial_delay=0.05, timeout=30) as tracker:
+            started = time.monotonic()
+            future = tracker.track("app", "mch", transaction_id="no-such-transaction")
+            with pytest.raises(SunbayBusinessError):
+                future.result(timeout=5)
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_system_busy_is_polled_again(server):
+    server.path_faults[PATH_QUERY] = FaultConfig(error_rate=1.0)
+    with NexusClient(api_key="k", base_url=server.base_url) as client:
+        with TransactionStatusTracker(client, initial_delay=0.05, max_delay=0.1, timeout=5) as tracker:
+            future = tracker.track("app", "mch", transaction_id=sale(client))
+            time.sleep(0.3)
+            assert not future.done()
+            server.path_faults[PATH_QUERY] = FaultConfig()
+            assert future.result(timeout=5).transaction_status == "S"
+
+
+def test_cancelled_future_is_no_longer_polled(server):
+    with NexusClient(api_key="k", base_url=server.base_url) as client:
+        transaction_id = sale(client)
+        with TransactionStatusTracker(client, initial_delay=0.05, max_delay=0.05, timeout=10) as tracker:
+            future = tracker.track("app", "mch", transaction_id=transaction_id)
+            time.sleep(0.15)
+            assert future.cancel()
+            time.sleep(0.1)
+            polled = server.stats()["path." + PATH_QUERY]
+            time.sleep(0.2)
+
+            assert server.stats()["path." + PATH_QUERY] == polled
+            assert tracker.pending_count == 0
+            # Tracking it again starts over with a new Future.
+            again = tracker.track("app", "mch", transaction_id=transaction_id)
+            assert again.result(timeout=5).transaction_status == "S"